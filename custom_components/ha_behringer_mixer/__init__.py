@@ -1,41 +1,110 @@
 """Custom integration to integrate a Behringer mixer into Home Assistant."""
 from __future__ import annotations
 
+from datetime import timedelta
+
 from homeassistant.config_entries import ConfigEntry, ConfigEntryNotReady
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.typing import ConfigType
 
 from .api import BehringerMixerApiClient
-from .const import DOMAIN, LOGGER
-from .coordinator import MixerDataUpdateCoordinator
+from .catalog import forget_catalog
+from .const import (
+    DEFAULT_SIGNAL_HOLD,
+    DEFAULT_UPDATE_WINDOW,
+    DEFAULT_WRITE_RATE,
+    DOMAIN,
+    LOGGER,
+    METRICS_INTERVAL,
+)
+from .coordinator import MixerDataUpdateCoordinator, snapshot_store
+from .manager import async_get_connection_manager
+from .services import async_setup_services
+from .utils import async_migrate_old_unique_ids
 
 PLATFORMS: list[Platform] = [
     Platform.SWITCH,
     Platform.NUMBER,
     Platform.SENSOR,
     Platform.SELECT,
+    Platform.BINARY_SENSOR,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the integration services."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
     hass.data.setdefault(DOMAIN, {})
     try:
         client = BehringerMixerApiClient(
-            mixer_ip=entry.data["MIXER_IP"], mixer_type=entry.data["MIXER_TYPE"]
+            mixer_ip=entry.data["MIXER_IP"],
+            mixer_type=entry.data["MIXER_TYPE"],
+            write_rate=entry.data.get("WRITE_RATE", DEFAULT_WRITE_RATE),
+            update_window=entry.data.get("UPDATE_WINDOW", DEFAULT_UPDATE_WINDOW),
+            io_thread=entry.data.get("IO_THREAD", False),
+            connection_manager=async_get_connection_manager(hass),
+        )
+        # Start from the last known state if there is one, and connect in
+        # the background; otherwise wait for the mixer as before.
+        snapshot = await snapshot_store(hass, entry.entry_id).async_load()
+        from_snapshot = bool(snapshot) and client.load_snapshot(snapshot)
+        coordinator = MixerDataUpdateCoordinator(hass=hass, client=client)
+        # Entities built from the snapshot are unavailable until it is live
+        coordinator.sub_connected = not from_snapshot
+        # Only load and track what the configured entities use
+        client.restrict_addresses(
+            coordinator.address_prefixes(), coordinator.library_tags()
         )
-        if not await client.setup():
+        meter_addresses = coordinator.meter_addresses()
+        signal_thresholds = coordinator.signal_thresholds()
+        if meter_addresses or signal_thresholds:
+            client.enable_meters(
+                meter_addresses,
+                signal_thresholds,
+                entry.data.get("SIGNAL_HOLD", DEFAULT_SIGNAL_HOLD),
+            )
+        if entry.data.get("METRICS"):
+            client.enable_metrics()
+        if not from_snapshot and not await client.setup():
             raise ConfigEntryNotReady(
                 f"Timeout while connecting to {entry.data['MIXER_IP']}"
             )
 
-        hass.data[DOMAIN][entry.entry_id] = coordinator = MixerDataUpdateCoordinator(
-            hass=hass,
-            client=client,
-        )
+        hass.data[DOMAIN][entry.entry_id] = coordinator
         await coordinator.async_config_entry_first_refresh()
+        coordinator.async_activate_sends()
         client.register_coordinator(coordinator)
 
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+        if client.metrics:
+            entry.async_on_unload(
+                async_track_time_interval(
+                    hass,
+                    coordinator.async_publish_metrics,
+                    timedelta(seconds=METRICS_INTERVAL),
+                    name=f"{DOMAIN} metrics {entry.entry_id}",
+                )
+            )
+
+        if from_snapshot:
+            entry.async_create_background_task(
+                hass,
+                coordinator.async_start_live_updates(),
+                f"{DOMAIN} live updates {entry.entry_id}",
+            )
+        else:
+            await coordinator.async_save_snapshot()
 
     except ConfigEntryNotReady:
         raise
@@ -54,15 +123,25 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
     if unloaded := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        await hass.data[DOMAIN][entry.entry_id].client.stop()
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        await coordinator.async_save_snapshot()
+        await coordinator.client.stop()
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unloaded
 
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved mixer state and cached catalog when the entry is deleted."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
+    forget_catalog(entry.entry_id)
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    """Apply a changed config entry, reloading only if it cannot be done in place."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is not None and await coordinator.async_apply_config():
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
 
 async def async_migrate_entry(hass, config_entry: ConfigEntry):
     """Migrate old entry."""
@@ -103,6 +182,9 @@ async def async_migrate_entry(hass, config_entry: ConfigEntry):
         new = {**config_entry.data}
         new["HEADAMPS_CONFIG"] = 0
         hass.config_entries.async_update_entry(config_entry, data=new, version =4)
+    if config_entry.version < 5:
+        await async_migrate_old_unique_ids(hass, config_entry)
+        hass.config_entries.async_update_entry(config_entry, version=5)
 
     LOGGER.debug("Migration to version %s successful", config_entry.version)
 
@@ -2,8 +2,29 @@
 
 from __future__ import annotations
 import asyncio
-from .const import LOGGER
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from .const import (
+    DEFAULT_UPDATE_WINDOW,
+    DEFAULT_WRITE_RATE,
+    DISCONNECT_GRACE,
+    DOMAIN,
+    FADE_TICK_RATE,
+    LOGGER,
+    OPTIMISTIC_TIMEOUT,
+    OPTIMISTIC_TOLERANCE,
+    RELOAD_BATCH_INTERVAL,
+    RELOAD_BATCH_SIZE,
+    RELOAD_SETTLE_TIME,
+    SCENE_QUIET_TIME,
+    SCENE_SETTLE_TIMEOUT,
+)
+from .meters import BehringerMixerMeters, BehringerMixerSignalDetector
+from .metrics import BehringerMixerMetrics
 from behringer_mixer import mixer_api
+from behringer_mixer.utils import db_to_fader, fader_to_db
 
 
 class BehringerMixerApiClientError(Exception):
@@ -18,97 +39,1136 @@ class BehringerMixerApiClientAuthenticationError(BehringerMixerApiClientError):
     """Exception to indicate an authentication error."""
 
 
+class BehringerMixerWriteCoalescer:
+    """Send only the latest pending value per address, at a maximum rate."""
+
+    def __init__(self, send, rate: float) -> None:
+        """Initialise the coalescer."""
+        self._send = send
+        self._interval = 1 / rate
+        self._pending = {}
+        self._task = None
+        self.writes_sent = 0
+        self.writes_dropped = 0
+
+    def queue(self, address: str, value) -> None:
+        """Queue a value, replacing any value still pending for the address."""
+        if address in self._pending:
+            self.writes_dropped += 1
+        self._pending[address] = value
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_worker())
+
+    async def _flush_worker(self):
+        """Flush pending values until nothing new arrives within an interval."""
+        while self._pending:
+            pending, self._pending = self._pending, {}
+            for address, value in pending.items():
+                try:
+                    await self._send(address, value)
+                except Exception as e:
+                    LOGGER.warning("Failed to write %s to %s: %s", value, address, e)
+                    continue
+                self.writes_sent += 1
+            await asyncio.sleep(self._interval)
+
+    def stop(self):
+        """Drop anything pending and stop flushing."""
+        self._pending = {}
+        if self._task:
+            self._task.cancel()
+
+
+class BehringerMixerFadeEngine:
+    """Run fader fades for any number of addresses off one shared timer."""
+
+    def __init__(self, send, tick_rate: float = FADE_TICK_RATE) -> None:
+        """Initialise the fade engine."""
+        self._send = send
+        self._interval = 1 / tick_rate
+        self._fades = {}
+        self._task = None
+
+    def start(
+        self, address: str, start: float, target: float, duration: float, curve: str
+    ) -> None:
+        """Fade an address to target, replacing any fade already running on it."""
+        started = asyncio.get_running_loop().time()
+        self._fades[address] = (start, target, started, duration, curve)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._tick_worker())
+
+    def cancel(self, address: str) -> None:
+        """Stop a running fade, leaving the fader where it is."""
+        self._fades.pop(address, None)
+
+    @staticmethod
+    def _interpolate(start, target, progress, curve):
+        """Return the fader value at a point (0-1) through the fade."""
+        if progress >= 1:
+            return target
+        if curve == "db":
+            start_db = fader_to_db(start, None)
+            target_db = fader_to_db(target, None)
+            return db_to_fader(start_db + (target_db - start_db) * progress, None)
+        return start + (target - start) * progress
+
+    async def _tick_worker(self):
+        """Advance every running fade once per tick."""
+        loop = asyncio.get_running_loop()
+        while self._fades:
+            now = loop.time()
+            for address, fade in list(self._fades.items()):
+                (start, target, started, duration, curve) = fade
+                progress = (now - started) / duration if duration > 0 else 1
+                self._send(address, self._interpolate(start, target, progress, curve))
+                if progress >= 1:
+                    del self._fades[address]
+            await asyncio.sleep(self._interval)
+
+    def stop(self):
+        """Abandon all running fades."""
+        self._fades = {}
+        if self._task:
+            self._task.cancel()
+
+
+class BehringerMixerStateView(Mapping):
+    """Read-only view of the mixer state with a change sequence number.
+
+    Reads go straight to the library's state dict, which is never written
+    to; the few values the integration adds (firmware, availability, values
+    written but not confirmed yet) live in a small overlay in front of it.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty view."""
+        self._source = {}
+        self._overlay = {}
+        self.version = 0
+        # Version at which the source was last replaced as a whole
+        self._reset_version = 0
+        # Last version each address changed at, oldest change first
+        self._changed = {}
+
+    def __getitem__(self, key):
+        """Return a state value."""
+        if key in self._overlay:
+            return self._overlay[key]
+        return self._source[key]
+
+    def __contains__(self, key) -> bool:
+        """Return True if the state has a value for key."""
+        return key in self._overlay or key in self._source
+
+    def __iter__(self):
+        """Iterate over the state addresses."""
+        yield from self._overlay
+        for key in self._source:
+            if key not in self._overlay:
+                yield key
+
+    def __len__(self) -> int:
+        """Return the number of state addresses."""
+        return len(self._source) + sum(
+            1 for key in self._overlay if key not in self._source
+        )
+
+    def get(self, key, default=None):
+        """Return a state value, or default if there is none."""
+        if key in self._overlay:
+            return self._overlay[key]
+        return self._source.get(key, default)
+
+    @property
+    def source(self) -> dict:
+        """Return the state dict the view currently reads from."""
+        return self._source
+
+    def rebind(self, source: dict) -> None:
+        """Read from a new state dict; everything counts as changed."""
+        self._source = source
+        self.version += 1
+        self._reset_version = self.version
+        self._changed = {}
+
+    def set_overlay(self, key: str, value) -> None:
+        """Set a value held by the integration rather than the library."""
+        if self._overlay.get(key, self) != value:
+            self._overlay[key] = value
+            self.mark_changed(key)
+
+    def clear_overlay(self, key: str) -> None:
+        """Drop a value from the overlay, uncovering the library's value."""
+        if key in self._overlay:
+            del self._overlay[key]
+            self.mark_changed(key)
+
+    def mark_changed(self, address: str) -> None:
+        """Record that an address changed, bumping the version."""
+        self.version += 1
+        self._changed.pop(address, None)
+        self._changed[address] = self.version
+
+    def changes_since(self, version: int) -> list[str] | None:
+        """Return the addresses changed after version, newest first.
+
+        Returns None if the whole state was replaced since then.
+        """
+        if version < self._reset_version:
+            return None
+        changed = []
+        for address in reversed(self._changed):
+            if self._changed[address] <= version:
+                break
+            changed.append(address)
+        return changed
+
+
+class BehringerMixerPendingWrites:
+    """Show written values straight away until the mixer confirms them.
+
+    A written value is put in the state view overlay and published at once.
+    When the mixer reports the address, a matching value confirms the write.
+    A different value rolls a switch or select back at once, while fader and
+    gain values, which pass through intermediate positions, have until the
+    timeout to settle. Writes still unconfirmed then are rolled back.
+    """
+
+    def __init__(self, view: BehringerMixerStateView, publish) -> None:
+        """Initialise the tracker; publish(addresses) notifies the entities."""
+        self._view = view
+        self._publish = publish
+        # Address -> (written value, timeout handle)
+        self._pending = {}
+        self.confirmed = 0
+        self.mismatches = 0
+        self.timeouts = 0
+
+    def __contains__(self, address: str) -> bool:
+        """Return True if a write to the address awaits confirmation."""
+        return address in self._pending
+
+    @staticmethod
+    def _matches(written, reported) -> bool:
+        """Return True if a reported value confirms the written one."""
+        if isinstance(written, float) and isinstance(reported, (int, float)):
+            return abs(written - reported) <= OPTIMISTIC_TOLERANCE
+        return written == reported
+
+    def add(self, address: str, value) -> None:
+        """Show a written value until the mixer confirms it."""
+        pending = self._pending.pop(address, None)
+        if pending:
+            pending[1].cancel()
+        handle = asyncio.get_running_loop().call_later(
+            OPTIMISTIC_TIMEOUT, self._expire, address
+        )
+        self._pending[address] = (value, handle)
+        if not pending or pending[0] != value:
+            self._view.set_overlay(address, value)
+            self._publish([address])
+
+    def reported(self, address: str) -> None:
+        """Check a value the mixer reported for a pending address."""
+        written, handle = self._pending[address]
+        reported = self._view.source.get(address)
+        if self._matches(written, reported):
+            self.confirmed += 1
+        elif isinstance(written, float):
+            return
+        else:
+            self.mismatches += 1
+            LOGGER.debug(
+                "Mixer reported %s for %s after writing %s, rolling back (%s mismatches)",
+                reported,
+                address,
+                written,
+                self.mismatches,
+            )
+        handle.cancel()
+        del self._pending[address]
+        self._view.clear_overlay(address)
+
+    def _expire(self, address: str) -> None:
+        """Settle a write the mixer did not confirm in time."""
+        written, _ = self._pending.pop(address)
+        reported = self._view.source.get(address)
+        if self._matches(written, reported):
+            self.confirmed += 1
+        else:
+            self.mismatches += 1
+            self.timeouts += 1
+            LOGGER.warning(
+                "Mixer did not confirm %s for %s (reports %s), rolling back (%s mismatches)",
+                written,
+                address,
+                reported,
+                self.mismatches,
+            )
+        self._view.clear_overlay(address)
+        self._publish([address])
+
+    def cancel(self, address: str) -> None:
+        """Roll a write back straight away (e.g. it could not be sent)."""
+        pending = self._pending.pop(address, None)
+        if pending:
+            pending[1].cancel()
+            self._view.clear_overlay(address)
+            self._publish([address])
+
+    def stop(self) -> None:
+        """Forget every pending write."""
+        for address, (_, handle) in self._pending.items():
+            handle.cancel()
+            self._view.clear_overlay(address)
+        self._pending = {}
+
+
+class BehringerMixerPacketLimiter:
+    """Token bucket capping outgoing OSC packets per second.
+
+    Shared by every mixer and safe to use from several threads: a packet is
+    always taken from the budget straight away, and the caller is told how
+    long to hold off before sending more.
+    """
+
+    def __init__(self, rate: float, burst: float) -> None:
+        """Initialise the limiter with a full bucket."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.packets = 0
+        self.delayed = 0
+
+    def reserve(self) -> float:
+        """Take one packet from the budget, returning the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            self.packets += 1
+            if self._tokens >= 0:
+                return 0.0
+            self.delayed += 1
+            return -self._tokens / self._rate
+
+    async def acquire(self) -> None:
+        """Take one packet from the budget, waiting if it is overdrawn."""
+        if wait := self.reserve():
+            await asyncio.sleep(wait)
+
+
+class BehringerMixerIOThread:
+    """Run the mixer's OSC traffic on a dedicated thread and event loop.
+
+    Library callbacks are queued on the I/O thread and handed to the home
+    (Home Assistant) loop in batches; writes and queries are handed over to
+    the I/O loop.
+    """
+
+    def __init__(self, home_loop: asyncio.AbstractEventLoop) -> None:
+        """Initialise the thread and its event loop."""
+        self.home_loop = home_loop
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, name=f"{DOMAIN}_io", daemon=True
+        )
+        self._queue = deque()
+        self._drain_scheduled = False
+        self.batches = 0
+        self.items = 0
+        self.max_queue_depth = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+
+    def start(self) -> None:
+        """Start the I/O thread."""
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Run the I/O loop until stopped."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+        self.loop.close()
+
+    async def run(self, coro):
+        """Run a coroutine on the I/O loop and wait for its result."""
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(coro, self.loop)
+        )
+
+    def call(self, func, *args) -> None:
+        """Call a function on the I/O loop without waiting."""
+        self.loop.call_soon_threadsafe(func, *args)
+
+    def queued(self, callback):
+        """Wrap a callback so I/O thread calls run on the home loop, batched."""
+
+        def enqueue(*args):
+            self._queue.append((time.monotonic(), callback, args))
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                self.home_loop.call_soon_threadsafe(self._drain)
+            return True
+
+        return enqueue
+
+    def _drain(self) -> None:
+        """Run every queued callback on the home loop."""
+        self._drain_scheduled = False
+        self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+        now = time.monotonic()
+        latency = 0.0
+        while self._queue:
+            queued_at, callback, args = self._queue.popleft()
+            latency = max(latency, now - queued_at)
+            self.items += 1
+            try:
+                callback(*args)
+            except Exception as e:
+                LOGGER.warning("Error handling mixer update: %s", e)
+        self.batches += 1
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def metrics(self) -> dict:
+        """Return queue depth and cross-thread latency metrics."""
+        return {
+            "queue_depth": len(self._queue),
+            "max_queue_depth": self.max_queue_depth,
+            "batches": self.batches,
+            "items": self.items,
+            "last_latency_ms": round(self.last_latency * 1000, 3),
+            "max_latency_ms": round(self.max_latency * 1000, 3),
+        }
+
+    async def stop(self) -> None:
+        """Stop the I/O loop and wait for the thread to finish."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        await self.home_loop.run_in_executor(None, self._thread.join)
+
+
 class BehringerMixerApiClient:
     """Behringer Mixer API Client."""
 
-    def __init__(self, mixer_ip: str, mixer_type: str) -> None:
+    def __init__(
+        self,
+        mixer_ip: str,
+        mixer_type: str,
+        write_rate: float = DEFAULT_WRITE_RATE,
+        update_window: int = DEFAULT_UPDATE_WINDOW,
+        io_thread: bool = False,
+        connection_manager=None,
+    ) -> None:
         """Initialise the API Client."""
         self._mixer_ip = mixer_ip
         self._mixer_type = mixer_type
         self._state = {}
         self._mixer = None
+        self._live = False
+        self._snapshot = None
         self.tasks = set()
         self.coordinator = None
+        # Batch window for publishing changes, in seconds (0 = publish at once)
+        self._update_window = update_window / 1000
+        self._publish_from = None
+        self._publish_handle = None
+        # Number of reloads and scene recalls holding publishing back, and
+        # what to publish once the last is released (None = everything)
+        self._publish_holds = 0
+        self._held_addresses = set()
+        # Shows the entities unavailable if the subscription stays lost
+        self._disconnect_handle = None
+        self._input_addresses = None
+        # Address prefixes (entity base addresses) the integration uses, and
+        # the library tags needed for them; None means everything
+        self._address_prefixes = None
+        self._library_tags = None
+        self.write_coalescer = BehringerMixerWriteCoalescer(
+            self.async_set_value, write_rate
+        )
+        self.fade_engine = BehringerMixerFadeEngine(self.write_coalescer.queue)
+        self.state_view = BehringerMixerStateView()
+        self.pending_writes = BehringerMixerPendingWrites(
+            self.state_view, self._publish_addresses
+        )
+        self.meters = None
+        # Hot path counters and timings, None unless enabled (enable_metrics)
+        self.metrics = None
+        # Run the OSC traffic on a dedicated thread (see BehringerMixerIOThread)
+        self._io_thread = io_thread
+        self._io = None
+        # Domain-wide manager sharing the renewal timer and packet budget
+        self._manager = connection_manager
+        # With the shared renewal: the subscription status last reported and
+        # the callback reporting changes to it
+        self._shared_renewal = False
+        self._subscribed = False
+        self._status_callback = None
+
+    def restrict_addresses(self, address_prefixes: set[str], library_tags) -> None:
+        """Only load and track the given address prefixes.
+
+        library_tags limits which address groups the library maps at all;
+        pass None if the prefixes cannot be expressed as library tags.
+        """
+        self._address_prefixes = frozenset(address_prefixes)
+        self._library_tags = library_tags
+
+    def covers_tags(self, library_tags) -> bool:
+        """Return True if the library already maps the given address tags."""
+        if self._library_tags is None:
+            return True
+        return library_tags is not None and set(library_tags) <= set(
+            self._library_tags
+        )
+
+    async def async_retrack_addresses(self, address_prefixes: set[str]) -> None:
+        """Track a new set of address prefixes on a running client.
+
+        The library keeps the address groups it was created with (see
+        covers_tags). Addresses that were not tracked before are queried, so
+        entities added for them start from the mixer's values.
+        """
+        before = self._address_prefixes
+        self._address_prefixes = frozenset(address_prefixes)
+        if before is None or self._mixer is None or not self._live:
+            return
+        added = [
+            row["output"]
+            for row in self._mixer.dump_mapping()
+            if self._is_tracked(row["output"])
+            and row["output"] not in before
+            and row["output"].rpartition("/")[0] not in before
+        ]
+        if added:
+            await self._async_send_queries(self._query_addresses(added))
+
+    def enable_meters(
+        self, addresses, signal_thresholds: dict | None = None, signal_hold=0
+    ) -> None:
+        """Meter the given state addresses once connected.
+
+        signal_thresholds maps state addresses to the level (dBFS) at which
+        they count as carrying signal, for the signal presence detector.
+        """
+        detector = None
+        if signal_thresholds:
+            detector = BehringerMixerSignalDetector(
+                signal_thresholds, signal_hold, self._publish_signal
+            )
+        meters = BehringerMixerMeters(
+            self._mixer_type,
+            set(addresses) | set(signal_thresholds or ()),
+            self._publish_meters,
+            detector,
+        )
+        if not meters.supported():
+            LOGGER.warning("Metering is not supported on the %s", self._mixer_type)
+            return
+        self.meters = meters
+
+    def enable_metrics(self) -> None:
+        """Start collecting hot path counters and timings."""
+        if self.metrics is None:
+            self.metrics = BehringerMixerMetrics()
+
+    def _is_tracked(self, address: str) -> bool:
+        """Return True if an address falls under the tracked prefixes."""
+        return (
+            address in self._address_prefixes
+            or address.rpartition("/")[0] in self._address_prefixes
+        )
 
     async def setup(self, test_connection_only=False):
         """Set up everything necessary."""
+        if self._io_thread and not test_connection_only and self._io is None:
+            self._io = BehringerMixerIOThread(asyncio.get_running_loop())
+            self._io.start()
+        await self._on_io(self._async_setup(test_connection_only))
+        if test_connection_only:
+            return True
+        if self.meters:
+            self.meters.start(
+                self._mixer.server.dispatcher,
+                self._send_message,
+                self._io.queued if self._io else None,
+            )
+        if self._shared_renewal:
+            self._manager.register(self)
+        return True
+
+    async def _async_setup(self, test_connection_only):
+        """Create and connect the mixer (on the I/O loop if there is one)."""
         self._mixer = mixer_api.create(
             self._mixer_type,
             ip=self._mixer_ip,
             logLevel=LOGGER.getEffectiveLevel(),
             logger=LOGGER,
             delay=0.002,
+            include=None if test_connection_only else self._library_tags,
         )
+        if self._manager and not test_connection_only:
+            self._mixer.send = self._throttled(self._mixer.send)
         await self._mixer.start()
         if not test_connection_only:
             # Get Initial state first
-            await self._mixer.reload()
+            if self._address_prefixes is None:
+                await self._mixer.reload()
+            else:
+                await self._async_send_queries(
+                    self._query_addresses(
+                        row["output"]
+                        for row in self._mixer.dump_mapping()
+                        if self._is_tracked(row["output"])
+                    )
+                )
+            self._live = True
+            # The library reloads its whole state when the subscription comes
+            # back; only re-query the addresses the entities use instead.
+            self._mixer.reload = self._async_delta_reload
+            data_callback = self.new_data_callback
+            status_callback = self.subscription_status_callback
+            if self._io:
+                self._mixer.reload = self._async_io_delta_reload
+                data_callback = self._io.queued(data_callback)
+                status_callback = self._io.queued(status_callback)
+            if self._manager and self._can_share_renewal():
+                # The manager's shared timer renews the subscription
+                self._shared_renewal = True
+                self._status_callback = status_callback
+                await self._async_subscribe(data_callback)
+                return
             # Setup subscription for live updates
-            task = asyncio.create_task(self._mixer.subscribe(self.new_data_callback))
+            task = asyncio.create_task(self._mixer.subscribe(data_callback))
             self.tasks.add(task)
             task.add_done_callback(self.tasks.discard)
             task_sub_status = asyncio.create_task(
-                self._mixer.subscription_status_register(
-                    self.subscription_status_callback
-                )
+                self._mixer.subscription_status_register(status_callback)
             )
             self.tasks.add(task_sub_status)
             task_sub_status.add_done_callback(self.tasks.discard)
-        return True
+
+    def _throttled(self, send):
+        """Wrap the library's send so it draws on the shared packet budget."""
+
+        async def throttled_send(addr: str, param=None):
+            await self._manager.limiter.acquire()
+            await send(addr, param)
+
+        return throttled_send
+
+    def _can_share_renewal(self) -> bool:
+        """Return True if the library still has the hook the shared renewal sets.
+
+        The library only hands updates to the callback that its subscription
+        worker installs. The shared renewal installs it without the worker;
+        if a library update has renamed it, the worker is used instead.
+        """
+        if "_callback_function" in vars(self._mixer):
+            return True
+        LOGGER.warning(
+            "The behringer_mixer library has changed, %s renews its own subscription",
+            self._mixer_ip,
+        )
+        return False
+
+    async def _async_subscribe(self, data_callback):
+        """Subscribe like the library's worker does, without its own loop."""
+        mixer = self._mixer
+        mixer._callback_function = data_callback
+        await mixer.send(mixer.subscription_string)
+        self._subscribed = True
+
+    async def async_renew_subscription(self):
+        """Renew the subscription and check the connection (shared timer)."""
+        if self._live and self._mixer and self._mixer.server:
+            await self._on_io(self._async_renew_subscription())
+
+    async def _async_renew_subscription(self):
+        """Do what one pass of the library's subscription worker does."""
+        mixer = self._mixer
+        await mixer.send(mixer.subscription_string)
+        await mixer.send(mixer.info_address)
+        connected = mixer.subscription_connected()
+        if connected == self._subscribed:
+            return
+        self._subscribed = connected
+        if connected:
+            # Coming back from loss of connection, re-query the state
+            if self._io:
+                await self._async_io_delta_reload()
+            else:
+                await self._async_delta_reload()
+        self._status_callback(connected)
+
+    async def _on_io(self, coro):
+        """Run a mixer coroutine on the I/O loop, or here without one."""
+        if self._io:
+            return await self._io.run(coro)
+        return await coro
+
+    def _send_message(self, address: str, value) -> float:
+        """Send a raw OSC message from the loop that owns the socket.
+
+        Returns how long to hold off before sending more under the shared
+        packet cap.
+        """
+        wait = self._manager.limiter.reserve() if self._manager else 0.0
+        self._send_raw(address, value)
+        return wait
+
+    def _send_raw(self, address: str, value) -> None:
+        """Send a raw OSC message without drawing on the packet budget."""
+        if self._io:
+            self._io.call(self._mixer.server.send_message, address, value)
+        else:
+            self._mixer.server.send_message(address, value)
+
+    def io_metrics(self) -> dict | None:
+        """Return the I/O thread queue metrics, if it is enabled."""
+        return self._io.metrics() if self._io else None
+
+    def is_live(self) -> bool:
+        """Return True once the live mixer state has been loaded."""
+        return self._live
 
     def type(self):
         """Return the mixer type."""
         return self._mixer_type
 
+    def mixer_ip(self):
+        """Return the mixer IP address."""
+        return self._mixer_ip
+
     def mixer_info(self):
         """Return the mixer info."""
+        if self._mixer is None:
+            if self._snapshot:
+                return self._snapshot["mixer_info"]
+            # The info is static per mixer type, so an instance that maps
+            # only the untagged addresses is enough and needs no I/O.
+            return mixer_api.create(
+                self._mixer_type, ip=self._mixer_ip, logger=LOGGER, include=[""]
+            ).info()
         return self._mixer.info()
 
     def mixer_network_name(self):
         """Return the mixer network_name."""
+        if self._mixer is None and self._snapshot:
+            return self._snapshot["name"]
         return self._mixer.name()
 
+    def mixer_state(self) -> dict:
+        """Return the raw mixer state."""
+        if not self._live and self._snapshot:
+            return self._snapshot["state"]
+        return self._mixer.state()
+
+    def load_snapshot(self, snapshot: dict) -> bool:
+        """Serve a saved state until the live connection is up."""
+        if (snapshot.get("mixer_ip"), snapshot.get("mixer_type")) != (
+            self._mixer_ip,
+            self._mixer_type,
+        ):
+            return False
+        self._snapshot = snapshot
+        return True
+
+    def snapshot(self) -> dict:
+        """Return the current state in a form that can be saved and reloaded."""
+        return {
+            "mixer_ip": self._mixer_ip,
+            "mixer_type": self._mixer_type,
+            "mixer_info": self.mixer_info(),
+            "name": self.mixer_network_name(),
+            "firmware": self._mixer.firmware(),
+            "state": dict(self.mixer_state()),
+        }
+
     async def async_get_data(self) -> any:
         """Get data from the API."""
         return self._get_data()
 
-    def _get_data(self) -> any:
-        """Process the internal data from the API."""
-        data = self._mixer.state()
-        data["/firmware"] = self._mixer.firmware()
-        data["/available"] = self._mixer.subscription_connected()
-        return data
+    def _get_data(self) -> BehringerMixerStateView:
+        """Point the state view at the current state and return it."""
+        view = self.state_view
+        if not self._live and self._snapshot:
+            if view.source is not self._snapshot["state"]:
+                view.rebind(self._snapshot["state"])
+            view.set_overlay("/firmware", self._snapshot["firmware"])
+            view.set_overlay("/available", False)
+            return view
+        if view.source is not self._mixer.state():
+            view.rebind(self._mixer.state())
+        view.set_overlay("/firmware", self._mixer.firmware())
+        view.set_overlay("/available", self._mixer.subscription_connected())
+        return view
 
     async def async_set_value(self, address: str, value: str) -> any:
         """Set a specific value on the mixer."""
-        return await self._mixer.set_value(address, value)
+        if not self._live:
+            raise BehringerMixerApiClientCommunicationError(
+                "The mixer is not connected yet"
+            )
+        self._add_pending_write(address, value)
+        started = time.perf_counter() if self.metrics else None
+        try:
+            return await self._on_io(self._mixer.set_value(address, value))
+        except Exception:
+            self.pending_writes.cancel(address)
+            raise
+        finally:
+            if started is not None:
+                self.metrics.count("writes")
+                self.metrics.write_latency.add((time.perf_counter() - started) * 1000)
+
+    async def async_set_values(self, values: dict) -> dict:
+        """Write many values back-to-back, returning the addresses that failed."""
+        failed = {}
+        for address, value in values.items():
+            self.fade_engine.cancel(address)
+            try:
+                await self.async_set_value(address, value)
+            except Exception as e:
+                LOGGER.warning("Failed to write %s to %s: %s", value, address, e)
+                failed[address] = str(e) or type(e).__name__
+        return failed
+
+    def queue_value(self, address: str, value) -> None:
+        """Set a value through the write coalescer (fader/gain moves).
+
+        A write that then fails to send is rolled back by async_set_value.
+        """
+        if not self._live:
+            raise BehringerMixerApiClientCommunicationError(
+                "The mixer is not connected yet"
+            )
+        self.fade_engine.cancel(address)
+        self._add_pending_write(address, value)
+        self.write_coalescer.queue(address, value)
+
+    def _add_pending_write(self, address: str, value) -> None:
+        """Show a written value optimistically if an entity displays it."""
+        # dB and untracked addresses are never published, so never confirmed
+        if address.endswith("_db") or (
+            self._address_prefixes is not None and not self._is_tracked(address)
+        ):
+            return
+        self.pending_writes.add(address, value)
+
+    def start_fade(
+        self, address: str, target: float, duration: float, curve: str = "linear"
+    ) -> None:
+        """Fade a fader address from its current value to target."""
+        if not self._live:
+            raise BehringerMixerApiClientCommunicationError(
+                "The mixer is not connected yet"
+            )
+        start = self.mixer_state().get(address) or 0
+        self.fade_engine.start(address, start, target, duration, curve)
+
+    def _query_addresses(self, state_addresses) -> list[str]:
+        """Return the OSC addresses to query to refresh the given state keys."""
+        if self._input_addresses is None:
+            self._input_addresses = {
+                row["output"]: row["input"] for row in self._mixer.dump_mapping()
+            }
+        return [
+            self._input_addresses[address]
+            for address in state_addresses
+            if address in self._input_addresses
+        ]
+
+    async def _async_send_queries(self, queries: list[str]):
+        """Send queries in pipelined batches and wait for the replies to land.
+
+        Every query waits for the shared packet budget before it goes out,
+        so a reload never sends faster than the cap allows.
+        """
+        limiter = self._manager.limiter if self._manager else None
+        for start in range(0, len(queries), RELOAD_BATCH_SIZE):
+            for address in queries[start : start + RELOAD_BATCH_SIZE]:
+                if limiter:
+                    await limiter.acquire()
+                self._send_raw(address, None)
+            await asyncio.sleep(RELOAD_BATCH_INTERVAL)
+        await asyncio.sleep(RELOAD_SETTLE_TIME)
+
+    async def _async_delta_reload(self):
+        """Re-query the watched addresses in batches and publish what changed."""
+        if not self.coordinator:
+            return
+        state = self._mixer.state()
+        watched = self.coordinator.watched_addresses()
+        before = {address: state.get(address) for address in watched}
+        queries = self._query_addresses(watched)
+        LOGGER.debug("Reconnected, re-querying %s addresses", len(queries))
+        self._publish_holds += 1
+        try:
+            await self._async_send_queries(queries)
+        finally:
+            changed = [
+                address for address in watched if state.get(address) != before[address]
+            ]
+            # Back within the grace period the entities still show the state
+            # from before the drop, so only what changed needs publishing.
+            # Otherwise they are unavailable and the status callback that
+            # follows publishes everything anyway.
+            self._release_publish_hold(
+                changed if self.coordinator.sub_connected else ()
+            )
+
+    async def _async_io_delta_reload(self):
+        """Run the delta reload on the home loop (for the I/O thread)."""
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(
+                self._async_delta_reload(), self._io.home_loop
+            )
+        )
 
     async def load_scene(self, scene_number):
-        """Change the scene."""
-        return await self._mixer.load_scene(scene_number)
+        """Recall a scene as one transaction, publishing only what it changed.
+
+        Publishing is held back while the mixer reports the scene's
+        parameters. Once it has reported the new scene and gone quiet (or
+        the settle timeout passed), the watched addresses are re-queried in
+        case UDP dropped any of the burst, and the ones that changed are
+        published in one go.
+        """
+        if not self._live:
+            raise BehringerMixerApiClientCommunicationError(
+                "The mixer is not connected yet"
+            )
+        started = time.monotonic()
+        watched = self.coordinator.watched_addresses() if self.coordinator else ()
+        # Changes batched before the recall are not part of it
+        self._flush_pending_publish()
+        state = self._mixer.state()
+        before = {address: state.get(address) for address in watched}
+        self._publish_holds += 1
+        try:
+            await self._on_io(self._async_send_scene_load(scene_number))
+            await self._async_wait_scene_settled(scene_number, started)
+            await self._async_send_queries(self._query_addresses(watched))
+        finally:
+            state = self._mixer.state()
+            changed = [
+                address for address in watched if state.get(address) != before[address]
+            ]
+            self._release_publish_hold(changed)
+        duration = time.monotonic() - started
+        LOGGER.debug(
+            "Recalled scene %s in %.2fs, %s addresses changed",
+            scene_number,
+            duration,
+            len(changed),
+        )
+        if self.metrics:
+            self.metrics.count("scene_recalls")
+            self.metrics.scene_recall.add(duration * 1000)
+        return True
+
+    async def _async_send_scene_load(self, scene_number):
+        """Send the scene load command(s) of the mixer type."""
+        mixer = self._mixer
+        await mixer.send(mixer.cmd_scene_load, str(scene_number))
+        if mixer.cmd_scene_execute:
+            await mixer.send(mixer.cmd_scene_execute[0], mixer.cmd_scene_execute[1])
+
+    async def _async_wait_scene_settled(self, scene_number, started: float):
+        """Wait for the mixer to report the scene and then go quiet."""
+        view = self.state_view
+        deadline = started + SCENE_SETTLE_TIMEOUT
+        version = view.version
+        while time.monotonic() < deadline:
+            await asyncio.sleep(SCENE_QUIET_TIME)
+            state = self._mixer.state()
+            # Meter levels and other overlay values do not count as activity
+            changes = view.changes_since(version)
+            quiet = changes is not None and not any(
+                address in state for address in changes
+            )
+            if quiet and str(state.get("/scene/current")) == str(scene_number):
+                return
+            version = view.version
+        LOGGER.debug("Scene %s did not settle in time", scene_number)
 
     def new_data_callback(self, data: dict):
         """Handle the callback indicating new data has been received."""
-        if data and data.get("property") and data.get("property").endswith("_db"):
+        address = data.get("property") if data else None
+        metrics = self.metrics
+        if metrics:
+            metrics.count("callbacks")
+        if address and (
+            address.endswith("_db")
+            or (self._address_prefixes is not None and not self._is_tracked(address))
+        ):
+            if metrics:
+                metrics.count(
+                    "db_filtered" if address.endswith("_db") else "untracked_filtered"
+                )
+            return True
+        view = self.state_view
+        swapped = view.source is not self._mixer.state()
+        if address and not swapped:
+            view.mark_changed(address)
+            if address in self.pending_writes:
+                self.pending_writes.reported(address)
+        if not self.coordinator:
             return True
+        if self._publish_holds:
+            # The hold's own diff of the watched addresses covers what the
+            # mixer reports; a full update is kept for the release
+            if not address or swapped:
+                self._held_addresses = None
+            return True
+        if not address or swapped:
+            # No address or the library swapped its state dict (reload)
+            self.publish_full_update()
+        elif self._update_window:
+            if self._publish_handle is None:
+                self._publish_from = view.version - 1
+                self._publish_handle = asyncio.get_running_loop().call_later(
+                    self._update_window, self._publish_changed
+                )
+        else:
+            # Only wake the entities bound to this address
+            self.coordinator.async_update_addresses((address,))
+        return True
+
+    def _publish_changed(self):
+        """Publish every address changed within the batch window at once."""
+        self._publish_handle = None
+        addresses = None
+        if self.state_view.source is self._mixer.state():
+            addresses = self.state_view.changes_since(self._publish_from)
+        if addresses is None:
+            self.publish_full_update()
+        else:
+            self.coordinator.async_update_addresses(addresses)
+
+    def _flush_pending_publish(self):
+        """Publish the batched changes now rather than at the end of the window."""
+        if self._publish_handle:
+            self._publish_handle.cancel()
+            self._publish_changed()
+
+    def _cancel_pending_publish(self):
+        """Forget any batched changes that have not been published yet."""
+        if self._publish_handle:
+            self._publish_handle.cancel()
+            self._publish_handle = None
+
+    def publish_full_update(self):
+        """Push the whole state to every entity (reconnects, scene loads)."""
+        self._cancel_pending_publish()
         if self.coordinator:
             self.coordinator.async_set_updated_data(self._get_data())
-        return True
+
+    def _publish_addresses(self, addresses: list[str]):
+        """Publish changes the integration made to the state view itself."""
+        if not self.coordinator:
+            return
+        if not self._publish_holds:
+            self.coordinator.async_update_addresses(addresses)
+        elif self._held_addresses is not None:
+            self._held_addresses.update(addresses)
+
+    def _release_publish_hold(self, changed=()):
+        """Release a publish hold, publishing what it held back with changed.
+
+        Nothing is published until the last hold is released.
+        """
+        if self._held_addresses is not None:
+            self._held_addresses.update(changed)
+        self._publish_holds -= 1
+        if self._publish_holds:
+            return
+        held, self._held_addresses = self._held_addresses, set()
+        if held is None:
+            self.publish_full_update()
+        elif held and self.coordinator:
+            self.coordinator.async_update_addresses(held)
+
+    def _publish_meters(self, levels: dict):
+        """Publish downsampled meter levels, keyed by state address."""
+        for address, (peak, rms) in levels.items():
+            self.state_view.set_overlay(address + "/meter", peak)
+            self.state_view.set_overlay(address + "/meter_rms", rms)
+        self._publish_addresses([address + "/meter" for address in levels])
+
+    def _publish_signal(self, states: dict):
+        """Publish signal presence transitions, keyed by state address."""
+        for address, present in states.items():
+            self.state_view.set_overlay(address + "/signal", present)
+        self._publish_addresses([address + "/signal" for address in states])
 
     def subscription_status_callback(self, subscription_connection):
         """Handle the callback indicating the status of the subscription connection."""
+        if self.metrics:
+            self.metrics.count(
+                "reconnects" if subscription_connection else "disconnects"
+            )
+        if not subscription_connection:
+            # Short drops are common on busy networks; only show the entities
+            # unavailable if the subscription stays lost.
+            if self.coordinator and self.coordinator.sub_connected:
+                if self._disconnect_handle is None:
+                    self._disconnect_handle = asyncio.get_running_loop().call_later(
+                        DISCONNECT_GRACE, self._publish_disconnected
+                    )
+                return True
+        elif self._disconnect_handle:
+            # Back in time: the delta reload already published what changed
+            self._disconnect_handle.cancel()
+            self._disconnect_handle = None
+            return True
         if self.coordinator:
             self.coordinator.sub_connected = subscription_connection
         self.new_data_callback({})
         return True
 
+    def _publish_disconnected(self):
+        """Show the entities unavailable once the grace period has run out."""
+        self._disconnect_handle = None
+        if self.coordinator:
+            self.coordinator.sub_connected = False
+        self.new_data_callback({})
+
     def register_coordinator(self, coordinator):
         """Register the coordinator object."""
         self.coordinator = coordinator
 
     async def stop(self):
         """Shutdown the client."""
-        await self._mixer.unsubscribe()
-        await self._mixer.stop()
+        self.fade_engine.stop()
+        self.write_coalescer.stop()
+        self.pending_writes.stop()
+        if self.meters:
+            self.meters.stop()
+        if self._disconnect_handle:
+            self._disconnect_handle.cancel()
+            self._disconnect_handle = None
+        self._cancel_pending_publish()
+        self._live = False
+        if self._manager:
+            self._manager.unregister(self)
+        await self._on_io(self._async_stop_mixer())
+        if self._io:
+            await self._io.stop()
+            self._io = None
+
+    async def _async_stop_mixer(self):
+        """Disconnect the mixer and cancel its tasks."""
+        if self._mixer and self._mixer.server:
+            await self._mixer.unsubscribe()
+            await self._mixer.stop()
         for task in self.tasks:
             task.cancel()
@@ -0,0 +1,75 @@
+"""Binary sensor platform for behringer_mixer."""
+
+from __future__ import annotations
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN
+from .entity import BehringerMixerEntity
+
+
+async def async_setup_entry(hass, entry, async_add_devices):
+    """Set up the binary_sensor platform."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    devices_list = build_entities(coordinator)
+    async_add_devices(devices_list)
+
+    @callback
+    def async_add_new_entities(catalog):
+        """Add entities registered after setup (e.g. sparse sends)."""
+        async_add_devices(build_entities(coordinator, catalog))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, coordinator.new_entities_signal, async_add_new_entities
+        )
+    )
+
+
+def build_entities(coordinator, catalog=None):
+    """Build up the entities."""
+    entities = []
+    catalog = catalog if catalog is not None else coordinator.entity_catalog
+    for entity in catalog.get("BINARY_SENSOR", []):
+        entity_class = ENTITY_CLASSES.get(entity.type)
+        if entity_class is None:
+            continue
+        entities.append(
+            entity_class(
+                coordinator=coordinator,
+                entity_description=BinarySensorEntityDescription(
+                    key=entity.key,
+                    name=entity.default_name,
+                ),
+                entity_setup=entity,
+            )
+        )
+    return entities
+
+
+class BehringerMixerSignalSensor(BehringerMixerEntity, BinarySensorEntity):
+    """Behringer_mixer signal presence Binary Sensor class."""
+
+    _attr_device_class = BinarySensorDeviceClass.SOUND
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise the sensor and its address key."""
+        super().__init__(*args, **kwargs)
+        self._signal_address = self.entity_setup.value_addresses[0]
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True while the channel is carrying signal."""
+        return self.coordinator.data.get(self._signal_address)
+
+
+# Catalog type -> entity class
+ENTITY_CLASSES = {
+    "signal": BehringerMixerSignalSensor,
+}
@@ -0,0 +1,132 @@
+"""Entity catalog entries for behringer_mixer."""
+
+from __future__ import annotations
+
+import json
+from sys import intern
+
+from .utils import sanitize_name
+
+# Suffix (relative to base_address) written when setting each catalog type
+WRITE_SUFFIXES = {
+    "mute": "/mix_on",
+    "fader": "/mix_fader",
+    "on": "",
+    "headamp_gain": "",
+    "tape_state": "",
+    "xusb_card_config": "",
+}
+
+# Suffixes (relative to base_address) of the state addresses each catalog
+# type reads, for the types that do not just read base_address
+READ_SUFFIXES = {
+    "mute": ("/mix_on", "/config_name"),
+    "fader": ("/mix_fader", "/config_name"),
+    "faderdb": ("/mix_fader", "/config_name"),
+    "meter": ("/meter", "/config_name"),
+    "signal": ("/signal", "/config_name"),
+}
+
+# Suffix (relative to base_address) of the dB reading shown with each type
+DB_SUFFIXES = {
+    "fader": "/mix_fader_db",
+    "faderdb": "/mix_fader_db",
+    "headamp_gain": "_db",
+}
+
+# Entry id -> (signature, catalog, dormant sends) of the last catalog built
+_CATALOG_CACHE: dict[str, tuple[str, dict, dict]] = {}
+
+
+class CatalogEntry:
+    """One entity of the catalog, with its state addresses worked out once.
+
+    Every address an entity reads or writes is built and interned here, so
+    the catalog, the entities and the coordinator's listener index all share
+    a single copy of each string. Entries are never changed after they are
+    built.
+    """
+
+    __slots__ = (
+        "type",
+        "key",
+        "unique_id",
+        "default_name",
+        "name_suffix",
+        "base_address",
+        "fader_address",
+        "on_address",
+        "name_address",
+        "write_address",
+        "value_addresses",
+        "follows_name",
+        "db_address",
+        "rms_address",
+    )
+
+    def __init__(
+        self,
+        entity_type: str,
+        key: str,
+        default_name: str,
+        base_address: str,
+        name_suffix: str = "",
+    ) -> None:
+        """Initialise the entry and its addresses."""
+        self.type = intern(entity_type)
+        self.key = key
+        self.unique_id = sanitize_name(key)
+        self.default_name = default_name or ""
+        self.name_suffix = name_suffix or ""
+        self.base_address = intern(base_address)
+        self.fader_address = intern(base_address + "/mix_fader")
+        self.on_address = intern(base_address + "/mix_on")
+        self.name_address = intern(base_address + "/config_name")
+        suffix = WRITE_SUFFIXES.get(entity_type)
+        self.write_address = None if suffix is None else intern(base_address + suffix)
+        # The addresses whose changes the entity shows, apart from its name
+        suffixes = READ_SUFFIXES.get(entity_type, ("",))
+        self.value_addresses = tuple(
+            intern(base_address + suffix)
+            for suffix in suffixes
+            if suffix != "/config_name"
+        )
+        self.follows_name = "/config_name" in suffixes
+        suffix = DB_SUFFIXES.get(entity_type)
+        self.db_address = None if suffix is None else intern(base_address + suffix)
+        self.rms_address = (
+            intern(base_address + "/meter_rms") if entity_type == "meter" else None
+        )
+
+    def __repr__(self) -> str:
+        """Return the entry for logs and debugging."""
+        return f"CatalogEntry({self.type!r}, {self.base_address!r})"
+
+
+def catalog_signature(mixer_type: str, mixer_info: dict, data) -> str:
+    """Return a string identifying everything a catalog is built from."""
+    return json.dumps([mixer_type, mixer_info, dict(data)], sort_keys=True, default=str)
+
+
+def cached_catalog(entry_id: str, signature: str) -> tuple[dict, dict] | None:
+    """Return copies of the catalog and dormant sends built for signature."""
+    cached = _CATALOG_CACHE.get(entry_id)
+    if cached is None or cached[0] != signature:
+        return None
+    # Fresh lists and dict: sends that become active are moved between them
+    catalog = {platform: list(entries) for platform, entries in cached[1].items()}
+    return catalog, dict(cached[2])
+
+
+def cache_catalog(entry_id: str, signature: str, catalog: dict, dormant: dict) -> None:
+    """Keep a copy of a freshly built catalog for the next setup of the entry."""
+    _CATALOG_CACHE[entry_id] = (
+        signature,
+        {platform: list(entries) for platform, entries in catalog.items()},
+        dict(dormant),
+    )
+
+
+def forget_catalog(entry_id: str) -> None:
+    """Drop the cached catalog of a removed entry."""
+    _CATALOG_CACHE.pop(entry_id, None)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.helpers import selector
@@ -13,14 +15,36 @@ from .api import (
     BehringerMixerApiClientCommunicationError,
     BehringerMixerApiClientError,
 )
-from .const import DOMAIN, LOGGER, REPO_URL
+from .const import (
+    DEFAULT_SIGNAL_HOLD,
+    DEFAULT_SIGNAL_THRESHOLD,
+    DEFAULT_UPDATE_WINDOW,
+    DEFAULT_WRITE_RATE,
+    DOMAIN,
+    LOGGER,
+    MIXER_INFO_TTL,
+    REPO_URL,
+)
+from .discovery import DiscoveredMixer, async_discover_mixers
+from .manager import async_get_connection_manager
+from .utils import parse_signal_thresholds
 
 FORM_PLACEHOLDERS = {"repo_url": REPO_URL}
+MANUAL_ENTRY = "manual"
+
+# (mixer ip, mixer type) -> (expiry, network name, mixer info), shared by every
+# flow so the setup and reconfigure steps connect to a mixer only once
+_MIXER_INFO_CACHE: dict[tuple[str, str], tuple[float, str, dict]] = {}
 
 class BehringerMixerFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for BehringerMixer."""
 
-    VERSION = 4
+    VERSION = 5
+
+    # Info of the mixer this flow connected to, kept for the rest of the flow
+    mixer_details: dict | None = None
+    # Mixers that answered the discovery probes, looked for once per flow
+    discovered: list[DiscoveredMixer] | None = None
 
     async def async_step_user(
         self,
@@ -28,9 +52,15 @@ class BehringerMixerFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> config_entries.FlowResult:
         """Handle a flow initialized by the user."""
         _errors = {}
+        if user_input is None and self.discovered is None:
+            self.discovered = await async_discover_mixers(
+                limiter=async_get_connection_manager(self.hass).limiter
+            )
+            if self.discovered:
+                return await self.async_step_pick_mixer()
         if user_input is not None:
             try:
-                user_input["NAME_DEFAULT"] = await self.test_connect(
+                user_input["NAME_DEFAULT"], self.mixer_details = await self.handshake(
                     mixer_ip=user_input["MIXER_IP"],
                     mixer_type=user_input["MIXER_TYPE"],
                 )
@@ -65,6 +95,28 @@ class BehringerMixerFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors=_errors,
         )
 
+    async def async_step_pick_mixer(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.FlowResult:
+        """Offer the mixers found on the network."""
+        if user_input is not None:
+            for mixer in self.discovered:
+                if mixer.ip == user_input["MIXER"]:
+                    return await self.async_step_user(
+                        {"MIXER_IP": mixer.ip, "MIXER_TYPE": mixer.mixer_type}
+                    )
+            # Anything else is the manual entry
+            return await self.async_step_user()
+
+        choices = {mixer.ip: mixer.label() for mixer in self.discovered}
+        choices[MANUAL_ENTRY] = "Enter the IP address manually"
+        return self.async_show_form(
+            step_id="pick_mixer",
+            description_placeholders=FORM_PLACEHOLDERS,
+            data_schema=vol.Schema({vol.Required("MIXER"): vol.In(choices)}),
+        )
+
     @staticmethod
     def create_list(max_number):
         """Create a list of numbers."""
@@ -88,10 +140,30 @@ class BehringerMixerFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 user_input["CHANNELSENDS_CONFIG"] or False
             )
             self.init_info["BUSSENDS_CONFIG"] = user_input["BUSSENDS_CONFIG"] or False
+            self.init_info["SPARSE_SENDS"] = user_input.get("SPARSE_SENDS") or False
             self.init_info["DBSENSORS"] = user_input["DBSENSORS"] or False
+            self.init_info["METERS"] = user_input.get("METERS") or False
+            self.init_info["SIGNAL_SENSORS"] = user_input.get("SIGNAL_SENSORS") or False
+            self.init_info["SIGNAL_THRESHOLD"] = user_input.get(
+                "SIGNAL_THRESHOLD", DEFAULT_SIGNAL_THRESHOLD
+            )
+            self.init_info["SIGNAL_THRESHOLDS"] = user_input.get(
+                "SIGNAL_THRESHOLDS", ""
+            )
+            self.init_info["SIGNAL_HOLD"] = user_input.get(
+                "SIGNAL_HOLD", DEFAULT_SIGNAL_HOLD
+            )
             self.init_info["UPSCALE_100"] = user_input["UPSCALE_100"] or False
             self.init_info["MUTE_GROUPS"] = user_input["MUTE_GROUPS"] or False
             self.init_info["HEADAMPS_CONFIG"] = user_input.get("HEADAMPS_CONFIG")
+            self.init_info["WRITE_RATE"] = user_input.get(
+                "WRITE_RATE", DEFAULT_WRITE_RATE
+            )
+            self.init_info["UPDATE_WINDOW"] = user_input.get(
+                "UPDATE_WINDOW", DEFAULT_UPDATE_WINDOW
+            )
+            self.init_info["IO_THREAD"] = user_input.get("IO_THREAD") or False
+            self.init_info["METRICS"] = user_input.get("METRICS") or False
             return self.async_create_entry(
                 title=self.init_info["NAME"],
                 data=self.init_info,
@@ -101,32 +173,41 @@ class BehringerMixerFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     @staticmethod
-    async def test_connect(mixer_ip: str, mixer_type: str) -> None:
-        """Validate IP/Type."""
+    async def handshake(mixer_ip: str, mixer_type: str) -> tuple[str, dict]:
+        """Connect to the mixer once and return its network name and info."""
+        key = (mixer_ip, mixer_type)
+        cached = _MIXER_INFO_CACHE.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1], cached[2]
         try:
             client = BehringerMixerApiClient(mixer_ip=mixer_ip, mixer_type=mixer_type)
-            await client.setup(test_connection_only=True)
-            await client.async_get_data()
-            await client.stop()
+            try:
+                await client.setup(test_connection_only=True)
+                await client.async_get_data()
+            finally:
+                await client.stop()
             if not client.mixer_network_name():
                 raise BehringerMixerApiClientCommunicationError
-            return client.mixer_network_name()
         except Exception as e:
             LOGGER.error("Error during test_connect: %s", e)
             raise
+        result = (client.mixer_network_name(), client.mixer_info())
+        _MIXER_INFO_CACHE[key] = (time.monotonic() + MIXER_INFO_TTL, *result)
+        return result
+
+    @staticmethod
+    async def test_connect(mixer_ip: str, mixer_type: str) -> str:
+        """Validate IP/Type."""
+        name, _ = await BehringerMixerFlowHandler.handshake(mixer_ip, mixer_type)
+        return name
 
     @staticmethod
-    async def mixer_info(mixer_ip: str, mixer_type: str) -> None:
+    async def mixer_info(mixer_ip: str, mixer_type: str) -> dict:
         """Load Mixer Information."""
-        try:
-            client = BehringerMixerApiClient(mixer_ip=mixer_ip, mixer_type=mixer_type)
-            await client.setup(test_connection_only=True)
-            await client.async_get_data()
-            await client.stop()
-            return client.mixer_info()
-        except Exception as e:
-            LOGGER.error("Error during test_connect: %s", e)
-            raise
+        _, mixer_info = await BehringerMixerFlowHandler.handshake(
+            mixer_ip, mixer_type
+        )
+        return mixer_info
 
     async def async_step_reconfigure(
         self, user_input: dict | None = None
@@ -141,7 +222,7 @@ class BehringerMixerFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
             user_input["MIXER_TYPE"] = config_entry.data.get("MIXER_TYPE")
             try:
-                await BehringerMixerFlowHandler.test_connect(
+                _, self.mixer_details = await self.handshake(
                     mixer_ip=user_input["MIXER_IP"],
                     mixer_type=user_input["MIXER_TYPE"],
                 )
@@ -187,7 +268,9 @@ class BehringerMixerFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             try:
                 user_input.update(self.init_info)
-                return self.async_update_reload_and_abort(
+                # The entry's update listener applies the change, in place
+                # when only the entity selection changed
+                return self.async_update_and_abort(
                     self._get_reconfigure_entry(),
                     data_updates=user_input,
                 )
@@ -198,11 +281,20 @@ class BehringerMixerFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         return await show_options_form("reconfigname", self, _errors, config_entry.data)
 
 
+def validate_signal_thresholds(value: str) -> str:
+    """Check the per-address signal thresholds can be parsed."""
+    try:
+        parse_signal_thresholds(value)
+    except ValueError as e:
+        raise vol.Invalid(str(e)) from e
+    return value
+
+
 async def show_options_form(
     form_id, object, errors, existing_values
 ) -> config_entries.FlowResult:
     """Show the options form to the user."""
-    mixer_info = await BehringerMixerFlowHandler.mixer_info(
+    mixer_info = object.mixer_details or await BehringerMixerFlowHandler.mixer_info(
         mixer_ip=object.init_info["MIXER_IP"],
         mixer_type=object.init_info["MIXER_TYPE"],
     )
@@ -247,15 +339,49 @@ async def show_options_form(
         vol.Optional(
             "BUSSENDS_CONFIG", default=existing_values.get("BUSSENDS_CONFIG", False)
         ): cv.boolean,
+        vol.Optional(
+            "SPARSE_SENDS", default=existing_values.get("SPARSE_SENDS", False)
+        ): cv.boolean,
         vol.Optional(
             "DBSENSORS", default=existing_values.get("DBSENSORS", False)
         ): cv.boolean,
+        vol.Optional(
+            "METERS", default=existing_values.get("METERS", False)
+        ): cv.boolean,
+        vol.Optional(
+            "SIGNAL_SENSORS", default=existing_values.get("SIGNAL_SENSORS", False)
+        ): cv.boolean,
+        vol.Optional(
+            "SIGNAL_THRESHOLD",
+            default=existing_values.get("SIGNAL_THRESHOLD", DEFAULT_SIGNAL_THRESHOLD),
+        ): vol.All(vol.Coerce(int), vol.Range(min=-90, max=0)),
+        vol.Optional(
+            "SIGNAL_THRESHOLDS", default=existing_values.get("SIGNAL_THRESHOLDS", "")
+        ): vol.All(cv.string, validate_signal_thresholds),
+        vol.Optional(
+            "SIGNAL_HOLD",
+            default=existing_values.get("SIGNAL_HOLD", DEFAULT_SIGNAL_HOLD),
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
         vol.Optional(
             "MUTE_GROUPS", default=existing_values.get("MUTE_GROUPS", False)
         ): cv.boolean,
         vol.Optional(
             "UPSCALE_100", default=existing_values.get("UPSCALE_100", False)
         ): cv.boolean,
+        vol.Optional(
+            "WRITE_RATE",
+            default=existing_values.get("WRITE_RATE", DEFAULT_WRITE_RATE),
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+        vol.Optional(
+            "UPDATE_WINDOW",
+            default=existing_values.get("UPDATE_WINDOW", DEFAULT_UPDATE_WINDOW),
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+        vol.Optional(
+            "IO_THREAD", default=existing_values.get("IO_THREAD", False)
+        ): cv.boolean,
+        vol.Optional(
+            "METRICS", default=existing_values.get("METRICS", False)
+        ): cv.boolean,
     }
 
     # Only add HEADAMPS_CONFIG if head_amps number > 0
@@ -8,3 +8,78 @@ DOMAIN = "ha_behringer_mixer"
 VERSION = "0.1.10"
 ATTRIBUTION = ""
 REPO_URL = "https://github.com/wrodie/ha_behringer_mixer"
+
+DEFAULT_WRITE_RATE = 30
+DEFAULT_UPDATE_WINDOW = 0
+FADE_TICK_RATE = 20
+STORAGE_VERSION = 1
+
+# Optimistic writes: seconds the mixer has to confirm a written value and
+# how far a reported fader/gain value may be from the written one
+OPTIMISTIC_TIMEOUT = 2
+OPTIMISTIC_TOLERANCE = 0.01
+
+# Scene recalls: how long the mixer has to be quiet after reporting the new
+# scene, and the longest a recall may take to settle (seconds)
+SCENE_QUIET_TIME = 0.25
+SCENE_SETTLE_TIMEOUT = 3
+
+# Reconnect reloads: queries sent per batch, pause between batches and how
+# long to wait for the last replies (seconds)
+RELOAD_BATCH_SIZE = 32
+RELOAD_BATCH_INTERVAL = 0.02
+RELOAD_SETTLE_TIME = 0.5
+# Seconds a lost subscription may take to come back before the entities are
+# shown unavailable (and then all refreshed once it does). The library only
+# reports the loss 15 seconds after the last message, so keep this short.
+DISCONNECT_GRACE = 5
+
+# Meters: ring length in frames (~50 ms each), publish rate (Hz), minimum
+# change to publish (dB), request renewal (seconds) and the level floor (dBFS)
+METER_HISTORY = 10
+METER_PUBLISH_RATE = 2
+METER_THRESHOLD = 1.0
+METER_RENEW_INTERVAL = 9
+METER_FLOOR = -90.0
+
+# Signal presence: default threshold (dBFS), how far below the threshold a
+# level must drop to count as silent (dB) and default release hold (seconds)
+DEFAULT_SIGNAL_THRESHOLD = -50
+SIGNAL_HYSTERESIS = 6
+DEFAULT_SIGNAL_HOLD = 10
+
+# Key of the shared connection manager in hass.data[DOMAIN], how often it
+# renews every mixer's subscription (seconds) and the cap on OSC packets sent
+# per second across all mixers (with the burst allowed above it)
+CONNECTION_MANAGER = "connection_manager"
+SUBSCRIPTION_RENEW_INTERVAL = 9
+MAX_PACKET_RATE = 1000
+PACKET_BURST = 100
+
+# Seconds between updates of the metric rates and diagnostic sensors
+METRICS_INTERVAL = 10
+
+# Seconds the config flow waits for mixers to answer the discovery probes
+DISCOVERY_TIMEOUT = 3
+
+# Seconds the config flow reuses the name and info read from a mixer
+MIXER_INFO_TTL = 60
+
+# Library address tags for each state address prefix, most specific first
+LIBRARY_TAGS = (
+    ("/main/m/", "mono"),
+    ("/main/", "mains"),
+    ("/ch/", "channels"),
+    ("/bus/", "busses"),
+    ("/dca/", "dcas"),
+    ("/mtx/", "matrices"),
+    ("/auxin/", "auxins"),
+    ("/chsend/", "channelsends"),
+    ("/bussend/", "bussends"),
+    ("/busmainsend/", "busmainsends"),
+    ("/headamp/", "headamps"),
+    ("/mutegroups/", "mutegroups"),
+    ("/scene/", "show"),
+    ("/usb/", "usb"),
+    ("/config/cards/", "cards"),
+)
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Iterable
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
@@ -15,8 +21,62 @@ from .api import (
     BehringerMixerApiClientAuthenticationError,
     BehringerMixerApiClientError,
 )
-from .const import DOMAIN, LOGGER
-from .utils import sanitize_name
+from .catalog import (
+    CatalogEntry,
+    cache_catalog,
+    cached_catalog,
+    catalog_signature,
+)
+from .const import (
+    DEFAULT_SIGNAL_THRESHOLD,
+    DOMAIN,
+    LIBRARY_TAGS,
+    LOGGER,
+    STORAGE_VERSION,
+)
+from .metrics import METRIC_SENSORS
+from .utils import parse_signal_thresholds, sanitize_name
+
+# Seconds to wait before retrying a failed background connection
+LIVE_RETRY_DELAY = 30
+# Seconds after a change before the live mixer state is saved again
+SNAPSHOT_SAVE_DELAY = 60
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding the last known state of a mixer."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+def library_tag(address: str) -> str | None:
+    """Return the library address tag a state address belongs to."""
+    for prefix, tag in LIBRARY_TAGS:
+        if (address + "/").startswith(prefix):
+            return tag
+    return None
+
+
+# Fader group types that have a signal meter
+METERED_TYPES = ("channel", "bus", "matrix", "auxin", "main", "mono")
+
+# Config keys that only change which entities exist, so a reconfiguration
+# touching nothing else is applied without reconnecting to the mixer
+HOT_RELOAD_KEYS = frozenset(
+    {
+        "NAME",
+        "CHANNEL_CONFIG",
+        "BUS_CONFIG",
+        "DCA_CONFIG",
+        "MATRIX_CONFIG",
+        "AUXIN_CONFIG",
+        "MAIN_CONFIG",
+        "CHANNELSENDS_CONFIG",
+        "BUSSENDS_CONFIG",
+        "HEADAMPS_CONFIG",
+        "MUTE_GROUPS",
+        "DBSENSORS",
+    }
+)
 
 
 class MixerDataUpdateCoordinator(DataUpdateCoordinator):
@@ -37,9 +97,19 @@ class MixerDataUpdateCoordinator(DataUpdateCoordinator):
             logger=LOGGER,
             name=DOMAIN,
         )
+        self.store = snapshot_store(hass, self.config_entry.entry_id)
+        self._snapshot_save_pending = False
         self.sub_connected = True
+        self._address_listeners: dict[str, set[CALLBACK_TYPE]] = {}
+        # Send entities held back in sparse mode, keyed by their fader address
+        self.dormant_sends = {}
+        self.new_entities_signal = f"{DOMAIN}_{self.config_entry.entry_id}_new_entities"
+        # Entities added to Home Assistant, by unique ID
+        self.live_entities = {}
+        # Config data the catalog was built from
+        self._config_data = dict(self.config_entry.data)
         self.entity_base_id = sanitize_name(self.config_entry.data["NAME"])
-        self.entity_catalog = self.build_entity_catalog(self.client.mixer_info())
+        self.entity_catalog = self.cached_entity_catalog(self.client.mixer_info())
 
     async def _async_update_data(self):
         """Update data via library."""
@@ -50,6 +120,278 @@ class MixerDataUpdateCoordinator(DataUpdateCoordinator):
         except BehringerMixerApiClientError as exception:
             raise UpdateFailed(exception) from exception
 
+    async def async_start_live_updates(self) -> None:
+        """Connect to the mixer and replace the snapshot with the live state.
+
+        The entities built from the snapshot stay unavailable until this
+        has loaded the live state.
+        """
+        try:
+            await self.client.setup()
+        except Exception as e:
+            LOGGER.error("Failed to connect to the mixer: %s", e)
+            self.config_entry.async_on_unload(
+                async_call_later(
+                    self.hass, LIVE_RETRY_DELAY, self._async_schedule_reload
+                )
+            )
+            return
+        if not self.client.mixer_network_name():
+            # Nothing answered; keep the snapshot and let the subscription
+            # report when the mixer comes back.
+            LOGGER.warning("Mixer did not respond, showing the last known state")
+            return
+        # Every entity has to write once anyway to become available
+        self.sub_connected = True
+        self.async_set_updated_data(await self.client.async_get_data())
+        await self.async_save_snapshot()
+
+    @callback
+    def _async_schedule_reload(self, _now) -> None:
+        """Reload the config entry to retry the connection."""
+        self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+
+    async def async_save_snapshot(self) -> None:
+        """Save the live mixer state so the next start can use it."""
+        if self.client.is_live():
+            # Saving cancels any delayed save
+            self._snapshot_save_pending = False
+            await self.store.async_save(self.client.snapshot())
+
+    @callback
+    def _async_schedule_snapshot_save(self) -> None:
+        """Save the live state a while after it changes, at most that often.
+
+        The store also writes a pending save when Home Assistant stops.
+        """
+        if self._snapshot_save_pending or not self.sub_connected:
+            return
+        if self.client.is_live():
+            self._snapshot_save_pending = True
+            self.store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _snapshot_data(self) -> dict:
+        """Return the state for a delayed save."""
+        self._snapshot_save_pending = False
+        return self.client.snapshot()
+
+    @callback
+    def async_add_address_listener(
+        self, addresses: Iterable[str], update_callback: CALLBACK_TYPE
+    ) -> Callable[[], None]:
+        """Listen for changes to specific mixer addresses."""
+        addresses = tuple(addresses)
+        for address in addresses:
+            self._address_listeners.setdefault(address, set()).add(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the address listener."""
+            for address in addresses:
+                listeners = self._address_listeners.get(address)
+                if listeners is None:
+                    continue
+                listeners.discard(update_callback)
+                if not listeners:
+                    del self._address_listeners[address]
+
+        return remove_listener
+
+    @callback
+    def async_set_updated_data(self, data) -> None:
+        """Publish a full update, activating any sends that became active."""
+        super().async_set_updated_data(data)
+        self._async_schedule_snapshot_save()
+        if self.client.metrics:
+            self.client.metrics.publish(len(self._listeners), full=True)
+        if self.dormant_sends:
+            self.async_activate_sends()
+
+    @callback
+    def async_update_addresses(self, addresses: Iterable[str]) -> None:
+        """Notify only the listeners bound to the changed addresses."""
+        if self.dormant_sends:
+            self.async_activate_sends(addresses)
+        notified = set()
+        for address in addresses:
+            for update_callback in self._address_listeners.get(address, ()):
+                if update_callback not in notified:
+                    notified.add(update_callback)
+                    update_callback()
+        self._async_schedule_snapshot_save()
+        if self.client.metrics:
+            self.client.metrics.publish(len(notified))
+
+    @callback
+    def async_publish_metrics(self, _now=None) -> None:
+        """Update the rates and the diagnostic sensors showing them."""
+        self.client.metrics.tick()
+        self.async_update_addresses([f"/metrics/{key}" for key in METRIC_SENSORS])
+
+    def address_prefixes(self) -> set[str]:
+        """Return the base address of every catalog entity, dormant or not."""
+        groups = [self.entity_catalog, *self.dormant_sends.values()]
+        return {
+            entity.base_address
+            for group in groups
+            for entities in group.values()
+            for entity in entities
+        }
+
+    def library_tags(self) -> list[str] | None:
+        """Return the library address tags covering the catalog, if possible."""
+        tags = set()
+        for address in self.address_prefixes():
+            if address == "/firmware" or address.startswith("/metrics/"):
+                continue
+            tag = library_tag(address)
+            if tag is None:
+                return None
+            tags.add(tag)
+        return sorted(tags)
+
+    def meter_addresses(self) -> set[str]:
+        """Return the base address of every meter sensor."""
+        return {
+            entity.base_address
+            for entity in self.entity_catalog["SENSOR"]
+            if entity.type == "meter"
+        }
+
+    def signal_thresholds(self) -> dict[str, float]:
+        """Return the signal threshold (dBFS) of every signal sensor."""
+        default = self.config_entry.data.get(
+            "SIGNAL_THRESHOLD", DEFAULT_SIGNAL_THRESHOLD
+        )
+        overrides = parse_signal_thresholds(
+            self.config_entry.data.get("SIGNAL_THRESHOLDS", "")
+        )
+        return {
+            entity.base_address: overrides.get(entity.base_address, default)
+            for entity in self.entity_catalog["BINARY_SENSOR"]
+            if entity.type == "signal"
+        }
+
+    def watched_addresses(self) -> set[str]:
+        """Return every state address the entities (and dormant sends) use."""
+        return set(self._address_listeners) | set(self.dormant_sends)
+
+    def _send_active(self, fader_address: str) -> bool:
+        """Return True if a send level is above -inf."""
+        return (self.client.mixer_state().get(fader_address) or 0) > 0
+
+    @callback
+    def async_activate_sends(self, addresses: Iterable[str] | None = None) -> None:
+        """Register the entities of dormant sends that are now active."""
+        new_entities = self._activate_sends(addresses)
+        if new_entities:
+            async_dispatcher_send(self.hass, self.new_entities_signal, new_entities)
+
+    def _activate_sends(self, addresses: Iterable[str] | None = None) -> dict:
+        """Move the dormant sends that are now active into the catalog."""
+        new_entities = {}
+        if addresses is None:
+            addresses = list(self.dormant_sends)
+        for address in addresses:
+            group = self.dormant_sends.get(address)
+            if group is None or not self._send_active(address):
+                continue
+            del self.dormant_sends[address]
+            for platform, entities in group.items():
+                self.entity_catalog[platform].extend(entities)
+                new_entities.setdefault(platform, []).extend(entities)
+        return new_entities
+
+    async def async_apply_config(self) -> bool:
+        """Apply changed config data to the running entry without reconnecting.
+
+        Builds the catalog for the new data, removes the entities no longer
+        in it and adds the new ones, keeping the client and its connection.
+        Registry entries of removed entities are left alone, as on a reload.
+        Returns False if the change needs a full reload: an option other
+        than the entity selection changed, the meters would change, or the
+        new entities need library address groups the client does not map.
+        """
+        data = dict(self.config_entry.data)
+        changed = {
+            key
+            for key in data.keys() | self._config_data.keys()
+            if data.get(key) != self._config_data.get(key)
+        }
+        if changed - HOT_RELOAD_KEYS:
+            return False
+        old_catalog = self.entity_catalog
+        meter_addresses = self.meter_addresses()
+        signal_thresholds = self.signal_thresholds()
+        self.entity_base_id = sanitize_name(data["NAME"])
+        self.entity_catalog = self.cached_entity_catalog(self.client.mixer_info())
+        self._activate_sends()
+        if (
+            not self.client.covers_tags(self.library_tags())
+            or self.meter_addresses() != meter_addresses
+            or self.signal_thresholds() != signal_thresholds
+        ):
+            return False
+        self._config_data = data
+
+        old_ids = {
+            entity.unique_id for entities in old_catalog.values() for entity in entities
+        }
+        new_ids = set()
+        added = {}
+        for platform, entities in self.entity_catalog.items():
+            for entity in entities:
+                new_ids.add(entity.unique_id)
+                if entity.unique_id not in old_ids:
+                    added.setdefault(platform, []).append(entity)
+        removed = [
+            self.live_entities[unique_id]
+            for unique_id in old_ids - new_ids
+            if unique_id in self.live_entities
+        ]
+        LOGGER.debug(
+            "Reconfigured in place: %s entities added, %s removed",
+            sum(len(entities) for entities in added.values()),
+            len(removed),
+        )
+        if removed:
+            await asyncio.gather(*(entity.async_remove() for entity in removed))
+        if added:
+            async_dispatcher_send(self.hass, self.new_entities_signal, added)
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.client.async_retrack_addresses(self.address_prefixes()),
+            f"{DOMAIN} retrack {self.config_entry.entry_id}",
+        )
+        return True
+
+    def write_address(self, unique_id: str) -> tuple[str, CatalogEntry] | None:
+        """Return the address written by an entity and its catalog entry."""
+        for entities in self.entity_catalog.values():
+            for entity in entities:
+                if entity.write_address is not None and entity.unique_id == unique_id:
+                    return (entity.write_address, entity)
+        return None
+
+    def cached_entity_catalog(self, mixer_info):
+        """Return the entity catalog, only building it if its inputs changed.
+
+        A reload that changes neither the mixer info nor the config data
+        reuses the catalog built for the entry last time.
+        """
+        entry_id = self.config_entry.entry_id
+        signature = catalog_signature(
+            self.client.type(), mixer_info, self.config_entry.data
+        )
+        cached = cached_catalog(entry_id, signature)
+        if cached is not None:
+            entities, self.dormant_sends = cached
+            return entities
+        entities = self.build_entity_catalog(mixer_info)
+        cache_catalog(entry_id, signature, entities, self.dormant_sends)
+        return entities
+
     def build_entity_catalog(self, mixer_info):
         """Build a list of entities."""
         types = ["channel", "bus", "dca", "matrix", "auxin"]
@@ -58,7 +400,9 @@ class MixerDataUpdateCoordinator(DataUpdateCoordinator):
             "NUMBER": [],
             "SWITCH": [],
             "SELECT": [],
+            "BINARY_SENSOR": [],
         }
+        self.dormant_sends = {}
         num_mains = mixer_info.get("mains", {}).get("number", 0)
         if self.config_entry.data.get("MAIN_CONFIG"):
             if num_mains == 1:
@@ -86,7 +430,7 @@ class MixerDataUpdateCoordinator(DataUpdateCoordinator):
             base_key = mixer_info.get("channel_sends", {}).get("base_address")
             for channel_number in self.config_entry.data.get("CHANNEL_CONFIG", []):
                 for bus_number in self.config_entry.data.get("BUS_CONFIG", []):
-                    self.fader_group(
+                    self.send_group(
                         entities,
                         "chsend",
                         f"{channel_number}/{bus_number}",
@@ -100,7 +444,7 @@ class MixerDataUpdateCoordinator(DataUpdateCoordinator):
             base_key = mixer_info.get("bus_sends", {}).get("base_address")
             for bus_number in self.config_entry.data["BUS_CONFIG"]:
                 for matrix_number in self.config_entry.data["MATRIX_CONFIG"]:
-                    self.fader_group(
+                    self.send_group(
                         entities,
                         "bussend",
                         f"{bus_number}/{matrix_number}",
@@ -111,7 +455,7 @@ class MixerDataUpdateCoordinator(DataUpdateCoordinator):
             base_key = mixer_info.get("bus_mainsends", {}).get("base_address")
             for bus_number in self.config_entry.data["BUS_CONFIG"]:
                 for main_number in range(num_mains):
-                    self.fader_group(
+                    self.send_group(
                         entities,
                         "busmainsend",
                         f"{bus_number}/{main_number+1}",
@@ -135,55 +479,65 @@ class MixerDataUpdateCoordinator(DataUpdateCoordinator):
                 base_address = base_address + "/" + str(mute_group_number + 1)
                 default_name = default_name + " " + str(mute_group_number + 1 or 0)
                 entities["SWITCH"].append(
-                    {
-                        "type": "on",
-                        "key": f"{self.entity_base_id}_{entity_part}_on",
-                        "default_name": default_name,
-                        "name_suffix": "On",
-                        "base_address": f"{base_address}/on",
-                    }
+                    CatalogEntry(
+                        entity_type="on",
+                        key=f"{self.entity_base_id}_{entity_part}_on",
+                        default_name=default_name,
+                        name_suffix="On",
+                        base_address=f"{base_address}/on",
+                    )
                 )
 
         entities["NUMBER"].append(
-            {
-                "type": "scene",
-                "key": f"{self.entity_base_id}_scene_current",
-                "default_name": "Current Scene",
-                "base_address": "/scene/current",
-            }
+            CatalogEntry(
+                entity_type="scene",
+                key=f"{self.entity_base_id}_scene_current",
+                default_name="Current Scene",
+                base_address="/scene/current",
+            )
         )
         entities["SENSOR"].append(
-            {
-                "type": "generic",
-                "key": f"{self.entity_base_id}_firmware",
-                "default_name": "Firmware Version",
-                "base_address": "/firmware",
-            }
+            CatalogEntry(
+                entity_type="generic",
+                key=f"{self.entity_base_id}_firmware",
+                default_name="Firmware Version",
+                base_address="/firmware",
+            )
         ),
         entities["SENSOR"].append(
-            {
-                "type": "generic",
-                "key": f"{self.entity_base_id}_usb_filename",
-                "default_name": "USB Filename",
-                "base_address": "/usb/file",
-            }
+            CatalogEntry(
+                entity_type="generic",
+                key=f"{self.entity_base_id}_usb_filename",
+                default_name="USB Filename",
+                base_address="/usb/file",
+            )
         )
+        if self.config_entry.data.get("METRICS"):
+            for key, (default_name, _unit) in METRIC_SENSORS.items():
+                entities["SENSOR"].append(
+                    CatalogEntry(
+                        entity_type="metric",
+                        key=f"{self.entity_base_id}_metric_{key}",
+                        default_name=default_name,
+                        base_address=f"/metrics/{key}",
+                    )
+                )
         entities["SELECT"].append(
-            {
-                "type": "tape_state",
-                "key": f"{self.entity_base_id}_tape_state",
-                "default_name": "USB Tape State",
-                "base_address": "/usb/state",
-            }
+            CatalogEntry(
+                entity_type="tape_state",
+                key=f"{self.entity_base_id}_tape_state",
+                default_name="USB Tape State",
+                base_address="/usb/state",
+            )
         )
         if self.client.type() == "X32":
             entities["SELECT"].append(
-                {
-                    "type": "xusb_card_config",
-                    "key": f"{self.entity_base_id}_xusbcard_config",
-                    "default_name": "X-USB Output Config",
-                    "base_address": "/config/cards/XUSBmode",
-                }
+                CatalogEntry(
+                    entity_type="xusb_card_config",
+                    key=f"{self.entity_base_id}_xusbcard_config",
+                    default_name="X-USB Output Config",
+                    base_address="/config/cards/XUSBmode",
+                )
             )
         return entities
 
@@ -198,34 +552,70 @@ class MixerDataUpdateCoordinator(DataUpdateCoordinator):
             default_name = default_name + " " + str(index_number or 0)
         default_name = name or default_name
         entities["SWITCH"].append(
-            {
-                "type": "mute",
-                "key": f"{self.entity_base_id}_{entity_part}_on",
-                "default_name": default_name,
-                "name_suffix": "On",
-                "base_address": base_address,
-            }
+            CatalogEntry(
+                entity_type="mute",
+                key=f"{self.entity_base_id}_{entity_part}_on",
+                default_name=default_name,
+                name_suffix="On",
+                base_address=base_address,
+            )
         )
         entities["NUMBER"].append(
-            {
-                "type": "fader",
-                "key": f"{self.entity_base_id}_{entity_part}_fader",
-                "default_name": default_name,
-                "name_suffix": "Fader",
-                "base_address": base_address,
-            }
+            CatalogEntry(
+                entity_type="fader",
+                key=f"{self.entity_base_id}_{entity_part}_fader",
+                default_name=default_name,
+                name_suffix="Fader",
+                base_address=base_address,
+            )
         )
         if self.config_entry.data.get("DBSENSORS"):
             entities["SENSOR"].append(
-                {
-                    "type": "faderdb",
-                    "key": f"{self.entity_base_id}_{entity_part}_fader_db",
-                    "default_name": default_name,
-                    "name_suffix": "Fader (dB)",
-                    "base_address": base_address,
-                }
+                CatalogEntry(
+                    entity_type="faderdb",
+                    key=f"{self.entity_base_id}_{entity_part}_fader_db",
+                    default_name=default_name,
+                    name_suffix="Fader (dB)",
+                    base_address=base_address,
+                )
+            )
+        if self.config_entry.data.get("METERS") and entity_type in METERED_TYPES:
+            entities["SENSOR"].append(
+                CatalogEntry(
+                    entity_type="meter",
+                    key=f"{self.entity_base_id}_{entity_part}_meter",
+                    default_name=default_name,
+                    name_suffix="Level",
+                    base_address=base_address,
+                )
+            )
+        if (
+            self.config_entry.data.get("SIGNAL_SENSORS")
+            and entity_type in METERED_TYPES
+        ):
+            entities["BINARY_SENSOR"].append(
+                CatalogEntry(
+                    entity_type="signal",
+                    key=f"{self.entity_base_id}_{entity_part}_signal",
+                    default_name=default_name,
+                    name_suffix="Signal",
+                    base_address=base_address,
+                )
             )
 
+    def send_group(self, entities, entity_type, index_number, base_key, name):
+        """Generate entities for a send, held back as dormant if sparse.
+
+        Dormant sends are registered by async_activate_sends once the mixer
+        state shows them as active.
+        """
+        if not self.config_entry.data.get("SPARSE_SENDS"):
+            self.fader_group(entities, entity_type, index_number, base_key, name)
+            return
+        group = {platform: [] for platform in entities}
+        self.fader_group(group, entity_type, index_number, base_key, name)
+        self.dormant_sends[f"/{base_key}/{index_number}/mix_fader"] = group
+
     def headamp_group(self, entities, entity_type, index_number, base_key, name=""):
         """Generate entities for a headamp."""
         entity_part = entity_type
@@ -237,20 +627,20 @@ class MixerDataUpdateCoordinator(DataUpdateCoordinator):
             default_name = default_name + " " + str(index_number or 0)
         default_name = name or default_name
         entities["SWITCH"].append(
-            {
-                "type": "on",
-                "key": f"{self.entity_base_id}_{entity_part}_phantom",
-                "default_name": default_name,
-                "name_suffix": "Phantom Power",
-                "base_address": f"{base_address}/phantom",
-            }
+            CatalogEntry(
+                entity_type="on",
+                key=f"{self.entity_base_id}_{entity_part}_phantom",
+                default_name=default_name,
+                name_suffix="Phantom Power",
+                base_address=f"{base_address}/phantom",
+            )
         )
         entities["NUMBER"].append(
-            {
-                "type": "headamp_gain",
-                "key": f"{self.entity_base_id}_{entity_part}_gain",
-                "default_name": default_name,
-                "name_suffix": "Gain",
-                "base_address": f"{base_address}/gain",
-            }
+            CatalogEntry(
+                entity_type="headamp_gain",
+                key=f"{self.entity_base_id}_{entity_part}_gain",
+                default_name=default_name,
+                name_suffix="Gain",
+                base_address=f"{base_address}/gain",
+            )
         )
@@ -0,0 +1,48 @@
+"""Diagnostics support for behringer_mixer."""
+
+from __future__ import annotations
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONNECTION_MANAGER, DOMAIN
+
+TO_REDACT = {"MIXER_IP"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.client
+    manager = hass.data[DOMAIN].get(CONNECTION_MANAGER)
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "mixer": {
+            "type": client.type(),
+            "live": client.is_live(),
+            "connected": coordinator.sub_connected,
+            "firmware": coordinator.data.get("/firmware") if coordinator.data else None,
+        },
+        "entities": {
+            platform: len(entities)
+            for platform, entities in coordinator.entity_catalog.items()
+        },
+        "dormant_sends": len(coordinator.dormant_sends),
+        "watched_addresses": len(coordinator.watched_addresses()),
+        "write_coalescer": {
+            "writes_sent": client.write_coalescer.writes_sent,
+            "writes_dropped": client.write_coalescer.writes_dropped,
+        },
+        "pending_writes": {
+            "confirmed": client.pending_writes.confirmed,
+            "mismatches": client.pending_writes.mismatches,
+            "timeouts": client.pending_writes.timeouts,
+        },
+        "io_thread": client.io_metrics(),
+        "connection_manager": manager.metrics() if manager else None,
+        # Hot path metrics, only collected with the METRICS option
+        "metrics": client.metrics.as_dict() if client.metrics else None,
+    }
@@ -0,0 +1,146 @@
+"""Find Behringer mixers on the local network."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import socket
+
+from pythonosc.osc_message import OscMessage, ParseError
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+from .api import BehringerMixerPacketLimiter
+from .const import DISCOVERY_TIMEOUT, LOGGER
+
+# (port, probe): /xinfo to the X32 and X-Air ports and the WING's own
+# discovery string, which it answers with "WING,ip,name,model,serial,firmware"
+DISCOVERY_PROBES = (
+    (10023, OscMessageBuilder(address="/xinfo").build().dgram),
+    (10024, OscMessageBuilder(address="/xinfo").build().dgram),
+    (2222, b"WING?"),
+)
+
+
+class DiscoveredMixer:
+    """A console that answered a discovery probe."""
+
+    __slots__ = ("ip", "name", "model", "firmware", "mixer_type")
+
+    def __init__(
+        self, ip: str, name: str, model: str, firmware: str, mixer_type: str
+    ) -> None:
+        """Initialise the discovered mixer."""
+        self.ip = ip
+        self.name = name
+        self.model = model
+        self.firmware = firmware
+        self.mixer_type = mixer_type
+
+    def label(self) -> str:
+        """Return the text offered to the user."""
+        return f"{self.name} ({self.model}, firmware {self.firmware}) - {self.ip}"
+
+
+def mixer_type_of(model: str) -> str:
+    """Return the integration's mixer type for the model a console reports."""
+    model = model.upper()
+    if model[:2] in ("XR", "MR"):
+        for size in ("12", "16"):
+            if size in model:
+                return f"XR{size}"
+        return "XR18"
+    return "X32"
+
+
+def parse_reply(data: bytes, host: str) -> DiscoveredMixer | None:
+    """Return the console described by a discovery reply, if it is one."""
+    if data.startswith(b"WING,"):
+        text = data.decode(errors="replace")
+    else:
+        try:
+            message = OscMessage(data)
+        except ParseError:
+            return None
+        params = message.params
+        if message.address == "/xinfo" and len(params) >= 4:
+            _, name, model, firmware = (str(param) for param in params[:4])
+            return DiscoveredMixer(host, name, model, firmware, mixer_type_of(model))
+        # The WING also answers its OSC info query with the discovery string
+        if message.address not in ("/*", "/?") or not params:
+            return None
+        text = str(params[0])
+    values = text.strip("\0").split(",")
+    if len(values) < 6:
+        return None
+    return DiscoveredMixer(host, values[2], values[3], values[5], "WING")
+
+
+def local_subnet_hosts() -> list[str]:
+    """Return the other addresses of this host's /24."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        try:
+            # Connecting a UDP socket sends nothing, it only picks the route
+            sock.connect(("10.255.255.255", 1))
+            local_ip = sock.getsockname()[0]
+        except OSError:
+            return []
+    network = ipaddress.ip_network(f"{local_ip}/24", strict=False)
+    return [str(host) for host in network.hosts() if str(host) != local_ip]
+
+
+class BehringerMixerDiscovery(asyncio.DatagramProtocol):
+    """Collect the consoles answering the discovery probes."""
+
+    def __init__(self) -> None:
+        """Initialise the collector."""
+        # Address the reply came from -> mixer
+        self.found: dict[str, DiscoveredMixer] = {}
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        """Record a console that answered."""
+        if addr[0] in self.found:
+            return
+        if (mixer := parse_reply(data, addr[0])) is not None:
+            LOGGER.debug("Discovered %s", mixer.label())
+            self.found[addr[0]] = mixer
+
+    def error_received(self, exc: Exception) -> None:
+        """Ignore hosts that cannot be reached."""
+        LOGGER.debug("Discovery probe failed: %s", exc)
+
+
+async def async_discover_mixers(
+    targets: list[str] | None = None,
+    timeout: float = DISCOVERY_TIMEOUT,
+    limiter: BehringerMixerPacketLimiter | None = None,
+    probes=DISCOVERY_PROBES,
+) -> list[DiscoveredMixer]:
+    """Probe the network and return the consoles that answer within timeout.
+
+    The probes are broadcast and also sent to every host of the local /24,
+    for networks that drop broadcasts. All of them go out from one socket,
+    paced by the limiter when given, and the replies are collected until
+    the deadline whether or not every probe has been sent.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    if targets is None:
+        targets = ["255.255.255.255", *local_subnet_hosts()]
+    transport, protocol = await loop.create_datagram_endpoint(
+        BehringerMixerDiscovery,
+        local_addr=("0.0.0.0", 0),
+        family=socket.AF_INET,
+        allow_broadcast=True,
+    )
+    try:
+        for host in targets:
+            if loop.time() >= deadline:
+                break
+            for port, probe in probes:
+                if limiter:
+                    await limiter.acquire()
+                transport.sendto(probe, (host, port))
+        await asyncio.sleep(max(0.0, deadline - loop.time()))
+    finally:
+        transport.close()
+    return sorted(protocol.found.values(), key=lambda mixer: (mixer.name, mixer.ip))
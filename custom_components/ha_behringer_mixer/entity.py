@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo, EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .catalog import CatalogEntry
 from .const import ATTRIBUTION, DOMAIN, VERSION
 from .coordinator import MixerDataUpdateCoordinator
-from .utils import sanitize_name
 
 
 class BehringerMixerEntity(CoordinatorEntity):
@@ -20,16 +21,20 @@ class BehringerMixerEntity(CoordinatorEntity):
         self,
         coordinator: MixerDataUpdateCoordinator,
         entity_description: EntityDescription,
-        entity_setup: dict,
+        entity_setup: CatalogEntry,
     ) -> None:
         """Initialize the entity class."""
         super().__init__(coordinator)
-        self.base_address = entity_setup.get("base_address")
-        self.default_name = entity_setup.get("default_name") or ""
-        self.name_suffix = entity_setup.get("name_suffix") or ""
-        key = sanitize_name(entity_setup.get("key"))
-        self._attr_unique_id = key
-        self._attr_suggested_object_id = DOMAIN + "." + key
+        # The catalog entry's strings are shared, not copied per entity
+        self.entity_setup = entity_setup
+        self.base_address = entity_setup.base_address
+        self.default_name = entity_setup.default_name
+        self.name_suffix = entity_setup.name_suffix
+        self._name_address = entity_setup.name_address
+        # Resolved name, cleared when config_name changes or on full updates
+        self._cached_name = None
+        self._attr_unique_id = entity_setup.unique_id
+        self._attr_suggested_object_id = DOMAIN + "." + entity_setup.unique_id
         self.entity_description = entity_description
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, coordinator.config_entry.entry_id)},
@@ -38,17 +43,52 @@ class BehringerMixerEntity(CoordinatorEntity):
             manufacturer="Behringer",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the mixer addresses this entity is bound to."""
+        await super().async_added_to_hass()
+        self.coordinator.live_entities[self.unique_id] = self
+        self.async_on_remove(
+            lambda: self.coordinator.live_entities.pop(self.unique_id, None)
+        )
+        if self.entity_setup.follows_name:
+            self.async_on_remove(
+                self.coordinator.async_add_address_listener(
+                    (self._name_address,), self._handle_name_update
+                )
+            )
+        self.async_on_remove(
+            self.coordinator.async_add_address_listener(
+                self.entity_setup.value_addresses, self._handle_address_update
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a full update, which may include a new name."""
+        self._cached_name = None
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_address_update(self) -> None:
+        """Handle an update to one of the entity's value addresses."""
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_name_update(self) -> None:
+        """Handle a change of the channel name on the mixer."""
+        self._cached_name = None
+        self.async_write_ha_state()
+
     @property
     def name(self) -> str | None:
         """Name  of the entity."""
-        return (
-            (
-                self.coordinator.data.get(self.base_address + "/config_name", "")
-                or self.default_name
+        if self._cached_name is None:
+            self._cached_name = (
+                (self.coordinator.data.get(self._name_address, "") or self.default_name)
+                + " "
+                + self.name_suffix
             )
-            + " "
-            + self.name_suffix
-        )
+        return self._cached_name
 
     @property
     def available(self) -> bool:
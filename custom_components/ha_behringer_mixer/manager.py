@@ -0,0 +1,95 @@
+"""Connection manager shared by every mixer of the integration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .api import BehringerMixerApiClient, BehringerMixerPacketLimiter
+from .const import (
+    CONNECTION_MANAGER,
+    DOMAIN,
+    LOGGER,
+    MAX_PACKET_RATE,
+    PACKET_BURST,
+    SUBSCRIPTION_RENEW_INTERVAL,
+)
+
+
+class BehringerMixerConnectionManager:
+    """Share one renewal timer and one packet budget between all mixers.
+
+    Instead of each client running the library's subscription worker, the
+    manager renews every registered mixer's subscription from a single
+    timer, and every client draws its outgoing OSC packets from one
+    limiter so many consoles together stay under MAX_PACKET_RATE.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise the manager."""
+        self.hass = hass
+        self.limiter = BehringerMixerPacketLimiter(MAX_PACKET_RATE, PACKET_BURST)
+        self._clients: set[BehringerMixerApiClient] = set()
+        self._renewing: set[BehringerMixerApiClient] = set()
+        self._unsub_timer = None
+
+    @callback
+    def register(self, client: BehringerMixerApiClient) -> None:
+        """Start renewing a connected client's subscription."""
+        self._clients.add(client)
+        if self._unsub_timer is None:
+            self._unsub_timer = async_track_time_interval(
+                self.hass,
+                self._async_renew_all,
+                timedelta(seconds=SUBSCRIPTION_RENEW_INTERVAL),
+                name=f"{DOMAIN} subscription renewal",
+            )
+
+    @callback
+    def unregister(self, client: BehringerMixerApiClient) -> None:
+        """Stop renewing a client, and the timer once none are left."""
+        self._clients.discard(client)
+        if not self._clients and self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    async def _async_renew_all(self, _now) -> None:
+        """Renew every mixer's subscription at once."""
+        # A mixer still busy re-querying after a reconnect is skipped
+        clients = [client for client in self._clients if client not in self._renewing]
+        self._renewing.update(clients)
+        try:
+            results = await asyncio.gather(
+                *(client.async_renew_subscription() for client in clients),
+                return_exceptions=True,
+            )
+        finally:
+            self._renewing.difference_update(clients)
+        for client, result in zip(clients, results):
+            if isinstance(result, Exception):
+                LOGGER.warning(
+                    "Failed to renew the subscription of %s: %s",
+                    client.mixer_ip(),
+                    result,
+                )
+
+    def metrics(self) -> dict:
+        """Return the shared packet budget counters."""
+        return {
+            "mixers": len(self._clients),
+            "packets_sent": self.limiter.packets,
+            "packets_delayed": self.limiter.delayed,
+        }
+
+
+def async_get_connection_manager(
+    hass: HomeAssistant,
+) -> BehringerMixerConnectionManager:
+    """Return the domain's connection manager, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if CONNECTION_MANAGER not in domain_data:
+        domain_data[CONNECTION_MANAGER] = BehringerMixerConnectionManager(hass)
+    return domain_data[CONNECTION_MANAGER]
@@ -0,0 +1,230 @@
+"""Signal level metering for behringer_mixer."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import sys
+import time
+from array import array
+from collections import deque
+
+from .const import (
+    LOGGER,
+    METER_FLOOR,
+    METER_HISTORY,
+    METER_PUBLISH_RATE,
+    METER_RENEW_INTERVAL,
+    METER_THRESHOLD,
+    SIGNAL_HYSTERESIS,
+)
+
+
+def _x32_layout():
+    """Return the X32 meter blobs and the slots of each state address."""
+    inputs = {f"/ch/{number}": (number - 1,) for number in range(1, 33)}
+    inputs.update({f"/auxin/{number}": (31 + number,) for number in range(1, 9)})
+    inputs.update({f"/bus/{number}": (47 + number,) for number in range(1, 17)})
+    inputs.update({f"/mtx/{number}": (63 + number,) for number in range(1, 7)})
+    return {
+        # 32 inputs, 8 aux ins, 8 fx returns, 16 buses and 6 matrices
+        "/meters/0": ("f", inputs),
+        # 16 buses, 6 matrices, main L/R and mono
+        "/meters/2": ("f", {"/main/st": (22, 23), "/main/m": (24,)}),
+    }
+
+
+def _xair_layout():
+    """Return the X-Air meter blob and the slots of each state address."""
+    slots = {f"/ch/{number}": (number - 1,) for number in range(1, 17)}
+    slots.update({f"/bus/{number}": (25 + number,) for number in range(1, 7)})
+    slots["/main/st"] = (36, 37)
+    # 16 channels, aux L/R, 8 fx returns, 6 buses, 4 fx sends, main L/R and
+    # monitor L/R
+    return {"/meters/1": ("h", slots)}
+
+
+# Per mixer type: meter blob -> (sample typecode, {state address: slots}).
+# "f" samples are linear levels (1.0 = 0 dBFS), "h" samples are dB * 256.
+# The WING meters over a separate binary protocol and is not supported.
+METER_LAYOUTS = {
+    "X32": _x32_layout(),
+    "XR18": _xair_layout(),
+    "XR16": _xair_layout(),
+    "XR12": _xair_layout(),
+}
+
+
+def _to_db(level: float) -> float:
+    """Convert a linear level to dBFS, clamped to the meter floor."""
+    if level <= 0:
+        return METER_FLOOR
+    return max(round(20 * math.log10(level), 1), METER_FLOOR)
+
+
+class BehringerMixerSignalDetector:
+    """Decide per address whether it is carrying signal.
+
+    An address turns on as soon as its peak reaches its threshold, and off
+    once its peak has stayed SIGNAL_HYSTERESIS dB below the threshold for
+    the hold time. Only transitions are published.
+    """
+
+    def __init__(self, thresholds: dict, hold: float, publish) -> None:
+        """Initialise the detector with a threshold (dBFS) per address."""
+        self._thresholds = thresholds
+        self._hold = hold
+        self._publish = publish
+        self._present = {}
+        self._quiet_since = {}
+
+    def update(self, levels: dict, now: float) -> None:
+        """Feed (peak, rms) levels per address, publishing any transitions."""
+        changed = {}
+        for address, threshold in self._thresholds.items():
+            level = levels.get(address)
+            if level is None:
+                continue
+            present = self._present.get(address)
+            if level[0] >= threshold:
+                self._quiet_since.pop(address, None)
+                if present is not True:
+                    changed[address] = True
+            elif present is None:
+                changed[address] = False
+            elif present and level[0] < threshold - SIGNAL_HYSTERESIS:
+                quiet_since = self._quiet_since.setdefault(address, now)
+                if now - quiet_since >= self._hold:
+                    del self._quiet_since[address]
+                    changed[address] = False
+            else:
+                # Inside the hysteresis band, the release has to start again
+                self._quiet_since.pop(address, None)
+        if changed:
+            self._present.update(changed)
+            self._publish(changed)
+
+
+class BehringerMixerMeters:
+    """Receive meter blobs, keep a short history and publish it slowly.
+
+    Each blob is decoded as a whole into an array and kept in a ring of
+    recent frames. One worker renews the meter requests and, at
+    METER_PUBLISH_RATE, works out peak and RMS per metered address over the
+    ring, feeds them to the signal detector (if any) and publishes only the
+    addresses that moved by METER_THRESHOLD dB.
+    """
+
+    def __init__(self, mixer_type: str, addresses, publish, detector=None) -> None:
+        """Initialise the meters for the given state addresses."""
+        self._publish = publish
+        self._detector = detector
+        self._dispatcher = None
+        self._send = None
+        self._handler = None
+        self._task = None
+        # Blob address -> (typecode, {state address: slots}) for wanted ones
+        self._layout = {}
+        for blob, (typecode, slots) in METER_LAYOUTS.get(mixer_type, {}).items():
+            wanted = {
+                address: slots[address] for address in addresses if address in slots
+            }
+            if wanted:
+                self._layout[blob] = (typecode, wanted)
+        self._frames = {blob: deque(maxlen=METER_HISTORY) for blob in self._layout}
+        self._received = False
+        self._published = {}
+
+    def supported(self) -> bool:
+        """Return True if any of the addresses can be metered."""
+        return bool(self._layout)
+
+    def start(self, dispatcher, send, queued=None) -> None:
+        """Route the meter blobs to this object and start the worker.
+
+        send(address, value) sends a raw OSC message to the mixer. When the
+        socket runs on another thread, queued wraps the blob handler so it
+        runs on this loop, next to the worker reading the ring.
+        """
+        self._dispatcher = dispatcher
+        self._send = send
+        self._handler = queued(self._handle_blob) if queued else self._handle_blob
+        for blob in self._layout:
+            dispatcher.map(blob, self._handler)
+        self._task = asyncio.create_task(self._worker())
+
+    def _handle_blob(self, address: str, *args) -> None:
+        """Decode a meter blob in one go and add it to the ring."""
+        layout = self._layout.get(address)
+        if not layout or not args or not isinstance(args[0], bytes):
+            return
+        blob = memoryview(args[0])
+        frame = array(layout[0])
+        count = int.from_bytes(blob[:4], "little")
+        frame.frombytes(blob[4 : 4 + count * frame.itemsize])
+        if sys.byteorder == "big":
+            frame.byteswap()
+        self._frames[address].append(frame)
+        self._received = True
+
+    def _levels(self) -> dict:
+        """Return (peak, rms) in dBFS for every metered address."""
+        levels = {}
+        for blob, (typecode, wanted) in self._layout.items():
+            frames = self._frames[blob]
+            if not frames:
+                continue
+            for address, slots in wanted.items():
+                samples = [frame[slot] for frame in frames for slot in slots]
+                if typecode == "h":
+                    samples = [10 ** (sample / 5120) for sample in samples]
+                rms = math.sqrt(
+                    sum(sample * sample for sample in samples) / len(samples)
+                )
+                levels[address] = (_to_db(max(samples)), _to_db(rms))
+        return levels
+
+    def _publish_levels(self) -> None:
+        """Publish the addresses whose level moved by at least the threshold."""
+        if not self._received:
+            return
+        self._received = False
+        levels = self._levels()
+        if self._detector:
+            self._detector.update(levels, time.monotonic())
+        changed = {}
+        for address, (peak, rms) in levels.items():
+            last = self._published.get(address)
+            if (
+                last is None
+                or abs(peak - last[0]) >= METER_THRESHOLD
+                or abs(rms - last[1]) >= METER_THRESHOLD
+            ):
+                changed[address] = self._published[address] = (peak, rms)
+        if changed:
+            self._publish(changed)
+
+    async def _worker(self):
+        """Renew the meter requests and publish at the downsampled rate."""
+        renewed = None
+        while True:
+            now = time.monotonic()
+            if renewed is None or now - renewed >= METER_RENEW_INTERVAL:
+                renewed = now
+                for blob in self._layout:
+                    self._send("/meters", blob)
+            try:
+                self._publish_levels()
+            except Exception as e:
+                LOGGER.warning("Failed to publish meter levels: %s", e)
+            await asyncio.sleep(1 / METER_PUBLISH_RATE)
+
+    def stop(self) -> None:
+        """Stop the worker and release the meter blobs."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        if self._dispatcher:
+            for blob in self._layout:
+                self._dispatcher.unmap(blob, self._handler)
+            self._dispatcher = None
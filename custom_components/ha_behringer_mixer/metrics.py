@@ -0,0 +1,154 @@
+"""Hot path counters and timings for behringer_mixer."""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+
+# Upper bounds of the histogram buckets (the last bucket is open ended)
+LATENCY_BOUNDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+FANOUT_BOUNDS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+RECALL_BOUNDS = (250, 500, 1000, 1500, 2000, 3000, 5000, 10000)
+
+COUNTERS = (
+    "callbacks",
+    "db_filtered",
+    "untracked_filtered",
+    "publishes",
+    "full_publishes",
+    "entity_writes",
+    "writes",
+    "reconnects",
+    "disconnects",
+    "scene_recalls",
+)
+
+# Diagnostic sensors: key -> (name, unit)
+METRIC_SENSORS = {
+    "callback_rate": ("Mixer updates per second", "1/s"),
+    "db_filtered": ("Filtered dB updates", None),
+    "publish_rate": ("Publishes per second", "1/s"),
+    "writes_per_publish": ("Entity writes per publish", None),
+    "write_latency": ("Write latency (p95)", "ms"),
+    "reconnects": ("Reconnects", None),
+}
+
+
+class BehringerMixerHistogram:
+    """Fixed bucket histogram, cheap enough to feed on every event."""
+
+    __slots__ = ("bounds", "buckets", "count", "total", "maximum")
+
+    def __init__(self, bounds) -> None:
+        """Initialise an empty histogram."""
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self, value: float) -> None:
+        """Record one value."""
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, share: float) -> float | None:
+        """Return the upper bound of the bucket holding the given share."""
+        if not self.count:
+            return None
+        wanted = share * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.buckets):
+            seen += count
+            if seen >= wanted:
+                return bound
+        return self.maximum
+
+    def mean(self) -> float | None:
+        """Return the mean of the recorded values."""
+        return round(self.total / self.count, 2) if self.count else None
+
+    def as_dict(self) -> dict:
+        """Return the histogram for the diagnostics."""
+        buckets = {
+            f"<={bound}": count for bound, count in zip(self.bounds, self.buckets)
+        }
+        buckets[f">{self.bounds[-1]}"] = self.buckets[-1]
+        return {
+            "count": self.count,
+            "mean": self.mean(),
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": round(self.maximum, 2),
+            "buckets": buckets,
+        }
+
+
+class BehringerMixerMetrics:
+    """Counters and timing histograms of the hot paths.
+
+    Only created when metrics are enabled; the hot paths test for it with a
+    single attribute check, so nothing is collected otherwise. Rates are
+    worked out over the interval between two ticks.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the counters."""
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.rates = dict.fromkeys(COUNTERS, 0.0)
+        # Milliseconds per async_set_value, entity writes per publish and
+        # milliseconds per scene recall
+        self.write_latency = BehringerMixerHistogram(LATENCY_BOUNDS)
+        self.writes_per_publish = BehringerMixerHistogram(FANOUT_BOUNDS)
+        self.scene_recall = BehringerMixerHistogram(RECALL_BOUNDS)
+        self._ticked = time.monotonic()
+        self._ticked_counters = dict(self.counters)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add to a counter."""
+        self.counters[name] += amount
+
+    def publish(self, entity_writes: int, full: bool = False) -> None:
+        """Record one coordinator publish and the entity writes it caused."""
+        counters = self.counters
+        counters["full_publishes" if full else "publishes"] += 1
+        counters["entity_writes"] += entity_writes
+        self.writes_per_publish.add(entity_writes)
+
+    def tick(self) -> None:
+        """Work out the per second rates since the last tick."""
+        now = time.monotonic()
+        elapsed = now - self._ticked
+        if elapsed <= 0:
+            return
+        self.rates = {
+            name: round((value - self._ticked_counters[name]) / elapsed, 2)
+            for name, value in self.counters.items()
+        }
+        self._ticked = now
+        self._ticked_counters = dict(self.counters)
+
+    def sensor_value(self, key: str) -> float | None:
+        """Return the value of a diagnostic sensor."""
+        if key == "callback_rate":
+            return self.rates["callbacks"]
+        if key == "publish_rate":
+            return round(self.rates["publishes"] + self.rates["full_publishes"], 2)
+        if key == "writes_per_publish":
+            return self.writes_per_publish.mean()
+        if key == "write_latency":
+            return self.write_latency.percentile(0.95)
+        return self.counters.get(key)
+
+    def as_dict(self) -> dict:
+        """Return everything collected, for the diagnostics."""
+        return {
+            "counters": dict(self.counters),
+            "rates_per_second": dict(self.rates),
+            "write_latency_ms": self.write_latency.as_dict(),
+            "entity_writes_per_publish": self.writes_per_publish.as_dict(),
+            "scene_recall_ms": self.scene_recall.as_dict(),
+        }
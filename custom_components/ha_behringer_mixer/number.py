@@ -2,60 +2,72 @@
 from __future__ import annotations
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
+from homeassistant.core import ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+import voluptuous as vol
 
-# from homeassistant.helpers import config_validation as cv, entity_platform
-# import voluptuous as vol
-
+from .api import BehringerMixerApiClientCommunicationError
 from .const import DOMAIN
 from .entity import BehringerMixerEntity
-from .utils import async_migrate_old_unique_ids
+
+FADE_SCHEMA = {
+    vol.Required("level"): vol.Coerce(float),
+    vol.Required("duration"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional("curve", default="linear"): vol.In(["linear", "db"]),
+}
 
 
 async def async_setup_entry(hass, entry, async_add_devices):
     """Set up the sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    await async_migrate_old_unique_ids(hass, entry, "number")
     devices_list = build_entities(coordinator)
     async_add_devices(devices_list)
 
+    @callback
+    def async_add_new_entities(catalog):
+        """Add entities registered after setup (e.g. sparse sends)."""
+        async_add_devices(build_entities(coordinator, catalog))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, coordinator.new_entities_signal, async_add_new_entities
+        )
+    )
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service("fade", FADE_SCHEMA, async_fade_entity)
+
+
+async def async_fade_entity(entity, call: ServiceCall) -> None:
+    """Fade a fader, refusing the scene and headamp gain numbers."""
+    if not isinstance(entity, BehringerMixerFader):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="not_a_fader",
+            translation_placeholders={"entity_id": entity.entity_id},
+        )
+    await entity.async_fade(
+        call.data["level"], call.data["duration"], call.data["curve"]
+    )
+
 
-def build_entities(coordinator):
+def build_entities(coordinator, catalog=None):
     """Build up the entities."""
     entities = []
-    for entity in coordinator.entity_catalog.get("NUMBER"):
-        if entity.get("type") == "scene":
-            entities.append(
-                BehringerMixerSceneNumber(
-                    coordinator=coordinator,
-                    entity_description=NumberEntityDescription(
-                        key=entity.get("key"),
-                        name=entity.get("default_name"),
-                    ),
-                    entity_setup=entity,
-                )
-            )
-        elif entity.get("type") == "headamp_gain":
-            entities.append(
-                BehringerMixerHeadAmpGain(
-                    coordinator=coordinator,
-                    entity_description=NumberEntityDescription(
-                        key=entity.get("key"),
-                        name=entity.get("default_name"),
-                    ),
-                    entity_setup=entity,
-                )
-            )
-        else:
-            entities.append(
-                BehringerMixerFader(
-                    coordinator=coordinator,
-                    entity_description=NumberEntityDescription(
-                        key=entity.get("key"),
-                        name=entity.get("default_name"),
-                    ),
-                    entity_setup=entity,
-                )
+    catalog = catalog if catalog is not None else coordinator.entity_catalog
+    for entity in catalog.get("NUMBER", []):
+        entity_class = ENTITY_CLASSES.get(entity.type, BehringerMixerFader)
+        entities.append(
+            entity_class(
+                coordinator=coordinator,
+                entity_description=NumberEntityDescription(
+                    key=entity.key,
+                    name=entity.default_name,
+                ),
+                entity_setup=entity,
             )
+        )
     return entities
 
 
@@ -83,6 +95,12 @@ class BehringerMixerHeadAmpGain(BehringerMixerEntity, NumberEntity):
 
     _attr_native_min_value = 0
     _attr_native_max_value = 1
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise the gain and its address keys."""
+        super().__init__(*args, **kwargs)
+        self._db_address = self.entity_setup.db_address
+
     @property
     def native_value(self) -> float | None:
         """Value of the entity."""
@@ -95,15 +113,11 @@ class BehringerMixerHeadAmpGain(BehringerMixerEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current scene."""
-        await self.coordinator.client.async_set_value(
-            self.base_address, value
-        )
+        self.coordinator.client.queue_value(self.base_address, value)
     @property
     def extra_state_attributes(self):
         """Generate extra state attributes."""
-        attrs = {}
-        attrs["db"] = self.coordinator.data.get(self.base_address + "_db", "") or -12
-        return attrs
+        return {"db": self.coordinator.data.get(self._db_address, "") or -12}
 
 class BehringerMixerFader(BehringerMixerEntity, NumberEntity):
     """Behringer_mixer Number class."""
@@ -111,34 +125,66 @@ class BehringerMixerFader(BehringerMixerEntity, NumberEntity):
     _attr_native_min_value = 0
     _attr_icon = "mdi:volume-source"
 
-    @property
-    def native_max_value(self) -> float | None:
-        """Maximum value of the entity."""
-        if self.coordinator.config_entry.data.get("UPSCALE_100"):
-            return 100
-        return 1
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise the fader, its address keys and option flags."""
+        super().__init__(*args, **kwargs)
+        self._fader_address = self.entity_setup.fader_address
+        self._fader_db_address = self.entity_setup.db_address
+        self._upscale = bool(self.coordinator.config_entry.data.get("UPSCALE_100"))
+        self._attr_native_max_value = 100 if self._upscale else 1
 
     @property
     def native_value(self) -> float | None:
         """Value of the entity."""
-        value = self.coordinator.data.get(self.base_address + "/mix_fader", "")
-        if self.coordinator.config_entry.data.get("UPSCALE_100"):
+        value = self.coordinator.data.get(self._fader_address, "")
+        if self._upscale:
             return 100 * value
         return value
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        if self.coordinator.config_entry.data.get("UPSCALE_100"):
+        if self._upscale:
             value = value / 100
-        await self.coordinator.client.async_set_value(
-            self.base_address + "/mix_fader", value
-        )
+        self.coordinator.client.queue_value(self._fader_address, value)
+
+    async def async_fade(self, level: float, duration: float, curve: str) -> None:
+        """Fade the fader to level over duration seconds."""
+        if not self.native_min_value <= level <= self.native_max_value:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="level_out_of_range",
+                translation_placeholders={
+                    "entity_id": self.entity_id,
+                    "level": str(level),
+                    "min": str(self.native_min_value),
+                    "max": str(self.native_max_value),
+                },
+            )
+        if self._upscale:
+            level = level / 100
+        try:
+            self.coordinator.client.start_fade(
+                self._fader_address, level, duration, curve
+            )
+        except BehringerMixerApiClientCommunicationError as exception:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="mixer_not_connected",
+                translation_placeholders={"entity_id": self.entity_id},
+            ) from exception
 
     @property
     def extra_state_attributes(self):
         """Generate extra state attributes."""
-        attrs = {}
-        db_value = self.coordinator.data.get(self.base_address + "/mix_fader_db", None)
-        attrs["db"] = db_value if db_value is not None else -90
-        attrs["low_precision"] = round(self.value or 0, 3)
-        return attrs
+        db_value = self.coordinator.data.get(self._fader_db_address)
+        return {
+            "db": db_value if db_value is not None else -90,
+            "low_precision": round(self.value or 0, 3),
+        }
+
+
+# Catalog type -> entity class, faders for anything else
+ENTITY_CLASSES = {
+    "scene": BehringerMixerSceneNumber,
+    "headamp_gain": BehringerMixerHeadAmpGain,
+}
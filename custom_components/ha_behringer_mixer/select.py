@@ -3,46 +3,49 @@
 from __future__ import annotations
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import DOMAIN
 from .entity import BehringerMixerEntity
-from .utils import async_migrate_old_unique_ids
 
 
 async def async_setup_entry(hass, entry, async_add_devices):
     """Set up the sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    await async_migrate_old_unique_ids(hass, entry, "select")
     devices_list = build_entities(coordinator)
     async_add_devices(devices_list)
 
+    @callback
+    def async_add_new_entities(catalog):
+        """Add entities registered after setup (e.g. on reconfiguration)."""
+        async_add_devices(build_entities(coordinator, catalog))
 
-def build_entities(coordinator):
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, coordinator.new_entities_signal, async_add_new_entities
+        )
+    )
+
+
+def build_entities(coordinator, catalog=None):
     """Build up the entities."""
     entities = []
-    for entity in coordinator.entity_catalog.get("SELECT"):
-        if entity.get("type") == "tape_state":
-            entities.append(
-                BehringerMixerUSBState(
-                    coordinator=coordinator,
-                    entity_description=SelectEntityDescription(
-                        key=entity.get("key"),
-                        name=entity.get("default_name"),
-                    ),
-                    entity_setup=entity,
-                )
-            )
-        elif entity.get("type") == "xusb_card_config":
-            entities.append(
-                BehringerMixerX32XUSBConfig(
-                    coordinator=coordinator,
-                    entity_description=SelectEntityDescription(
-                        key=entity.get("key"),
-                        name=entity.get("default_name"),
-                    ),
-                    entity_setup=entity,
-                )
+    catalog = catalog if catalog is not None else coordinator.entity_catalog
+    for entity in catalog.get("SELECT", []):
+        entity_class = ENTITY_CLASSES.get(entity.type)
+        if entity_class is None:
+            continue
+        entities.append(
+            entity_class(
+                coordinator=coordinator,
+                entity_description=SelectEntityDescription(
+                    key=entity.key,
+                    name=entity.default_name,
+                ),
+                entity_setup=entity,
             )
+        )
     return entities
 
 
@@ -68,9 +71,7 @@ class BehringerMixerUSBState(BehringerMixerEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the current option."""
-        if self.base_address in self.coordinator.data:
-            return self.coordinator.data[self.base_address]
-        return None
+        return self.coordinator.data.get(self.base_address)
 
 
 class BehringerMixerX32XUSBConfig(BehringerMixerEntity, SelectEntity):
@@ -93,6 +94,11 @@ class BehringerMixerX32XUSBConfig(BehringerMixerEntity, SelectEntity):
     @property
     def current_option(self) -> str | None:
         """Return the current option."""
-        if self.base_address in self.coordinator.data:
-            return self.coordinator.data[self.base_address]
-        return None
+        return self.coordinator.data.get(self.base_address)
+
+
+# Catalog type -> entity class
+ENTITY_CLASSES = {
+    "tape_state": BehringerMixerUSBState,
+    "xusb_card_config": BehringerMixerX32XUSBConfig,
+}
@@ -1,46 +1,54 @@
 """Sensor platform for behringer_mixer."""
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import DOMAIN
 from .entity import BehringerMixerEntity
-from .utils import async_migrate_old_unique_ids
+from .metrics import METRIC_SENSORS
 
 
 async def async_setup_entry(hass, entry, async_add_devices):
     """Set up the sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    await async_migrate_old_unique_ids(hass, entry, "sensor")
     devices_list = build_entities(coordinator)
     async_add_devices(devices_list)
 
+    @callback
+    def async_add_new_entities(catalog):
+        """Add entities registered after setup (e.g. sparse sends)."""
+        async_add_devices(build_entities(coordinator, catalog))
 
-def build_entities(coordinator):
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, coordinator.new_entities_signal, async_add_new_entities
+        )
+    )
+
+
+def build_entities(coordinator, catalog=None):
     """Build up the entities."""
     entities = []
-    for entity in coordinator.entity_catalog.get("SENSOR"):
-        if entity.get("type") == "faderdb":
-            entities.append(
-                BehringerMixerDbSensor(
-                    coordinator=coordinator,
-                    entity_description=SensorEntityDescription(
-                        key=entity.get("key"),
-                        name=entity.get("default_name"),
-                    ),
-                    entity_setup=entity,
-                )
-            )
-        else:
-            entities.append(
-                BehringerMixerGenericSensor(
-                    coordinator=coordinator,
-                    entity_description=SensorEntityDescription(
-                        key=entity.get("key"), name=entity.get("default_name")
-                    ),
-                    entity_setup=entity,
-                )
+    catalog = catalog if catalog is not None else coordinator.entity_catalog
+    for entity in catalog.get("SENSOR", []):
+        entity_class = ENTITY_CLASSES.get(entity.type, BehringerMixerGenericSensor)
+        entities.append(
+            entity_class(
+                coordinator=coordinator,
+                entity_description=SensorEntityDescription(
+                    key=entity.key,
+                    name=entity.default_name,
+                ),
+                entity_setup=entity,
             )
+        )
     return entities
 
 
@@ -65,11 +73,72 @@ class BehringerMixerDbSensor(BehringerMixerEntity, SensorEntity):
     _attr_native_unit_of_measurement = "dB"
     _attr_icon = "mdi:volume-source"
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise the sensor and its address key."""
+        super().__init__(*args, **kwargs)
+        self._fader_db_address = self.entity_setup.db_address
+
     @property
     def native_value(self) -> float | None:
         """Value of the entity."""
-        value = self.coordinator.data.get(self.base_address + "/mix_fader_db", "")
+        value = self.coordinator.data.get(self._fader_db_address, "")
         try:
             return float(value)
         except (TypeError, ValueError):
             return -90
+
+
+class BehringerMixerMeterSensor(BehringerMixerEntity, SensorEntity):
+    """Behringer_mixer signal level (meter) Sensor class."""
+
+    _attr_native_unit_of_measurement = "dBFS"
+    _attr_icon = "mdi:waveform"
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise the sensor and its address keys."""
+        super().__init__(*args, **kwargs)
+        self._meter_address = self.entity_setup.value_addresses[0]
+        self._rms_address = self.entity_setup.rms_address
+
+    @property
+    def native_value(self) -> float | None:
+        """Peak level over the last meter window."""
+        return self.coordinator.data.get(self._meter_address)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the RMS level alongside the peak."""
+        return {"rms": self.coordinator.data.get(self._rms_address)}
+
+
+class BehringerMixerMetricSensor(BehringerMixerGenericSensor):
+    """Behringer_mixer diagnostic Sensor class showing a hot path metric."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:speedometer"
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise the sensor and its metric key."""
+        super().__init__(*args, **kwargs)
+        self._metric = self.base_address.rpartition("/")[2]
+        self._attr_native_unit_of_measurement = METRIC_SENSORS[self._metric][1]
+
+    @property
+    def native_value(self) -> float | None:
+        """Value of the metric."""
+        metrics = self.coordinator.client.metrics
+        return metrics.sensor_value(self._metric) if metrics else None
+
+    @property
+    def available(self) -> bool:
+        """Metrics stay available while the mixer is disconnected."""
+        return True
+
+
+# Catalog type -> entity class, generic sensors for anything else
+ENTITY_CLASSES = {
+    "metric": BehringerMixerMetricSensor,
+    "meter": BehringerMixerMeterSensor,
+    "faderdb": BehringerMixerDbSensor,
+}
@@ -0,0 +1,109 @@
+"""Services for Behringer Mixer integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+
+from .const import CONNECTION_MANAGER, DOMAIN
+
+SERVICE_SET_VALUES = "set_values"
+
+SET_VALUES_SCHEMA = vol.Schema(
+    {
+        vol.Optional("config_entry_id"): cv.string,
+        vol.Required("values"): vol.All(dict, vol.Length(min=1)),
+    }
+)
+
+FADER_VALUE = vol.All(vol.Coerce(float), vol.Range(min=0, max=1))
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_set_values(call: ServiceCall) -> ServiceResponse:
+        """Validate every value first, then send them all in one pass."""
+        loaded = {
+            entry_id: coordinator
+            for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+            if entry_id != CONNECTION_MANAGER
+        }
+        default_entry_id = call.data.get("config_entry_id")
+        if default_entry_id is None and len(loaded) == 1:
+            default_entry_id = next(iter(loaded))
+
+        writes = {}
+        errors = []
+        for key, value in call.data["values"].items():
+            try:
+                (coordinator, address, value) = _resolve_write(
+                    hass, loaded, default_entry_id, key, value
+                )
+            except vol.Invalid as err:
+                errors.append(f"{key}: {err.msg}")
+                continue
+            writes.setdefault(coordinator, {})[address] = value
+        if errors:
+            raise ServiceValidationError(
+                "Invalid mixer values, nothing was sent: " + "; ".join(errors)
+            )
+
+        sent = []
+        failed = {}
+        for coordinator, values in writes.items():
+            failures = await coordinator.client.async_set_values(values)
+            failed.update(failures)
+            sent.extend(address for address in values if address not in failures)
+        return {"sent": sent, "failed": failed}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_VALUES,
+        async_set_values,
+        schema=SET_VALUES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def _resolve_write(hass, loaded, default_entry_id, key, value):
+    """Resolve an address or entity id to (coordinator, address, value)."""
+    if key.startswith("/"):
+        coordinator = loaded.get(default_entry_id)
+        if coordinator is None:
+            raise vol.Invalid("config_entry_id is required to set raw addresses")
+        address = key
+    else:
+        entry = er.async_get(hass).async_get(key)
+        if entry is None or entry.platform != DOMAIN:
+            raise vol.Invalid("not a Behringer mixer entity")
+        coordinator = loaded.get(entry.config_entry_id)
+        if coordinator is None:
+            raise vol.Invalid("mixer is not loaded")
+        resolved = coordinator.write_address(entry.unique_id)
+        if resolved is None:
+            raise vol.Invalid("entity cannot be set")
+        (address, catalog_entry) = resolved
+        if catalog_entry.type == "fader" and coordinator.config_entry.data.get(
+            "UPSCALE_100"
+        ):
+            value = vol.Coerce(float)(value) / 100
+
+    if address not in coordinator.client.mixer_state():
+        raise vol.Invalid("unknown mixer address")
+    current = coordinator.client.mixer_state()[address]
+    if address.endswith("/mix_fader"):
+        value = FADER_VALUE(value)
+    elif isinstance(current, bool):
+        value = cv.boolean(value)
+    elif isinstance(current, (int, float)):
+        value = vol.Coerce(float)(value)
+    return (coordinator, address, value)
@@ -2,47 +2,47 @@
 from __future__ import annotations
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from .const import DOMAIN
 from .entity import BehringerMixerEntity
-from .utils import async_migrate_old_unique_ids
 
 
 async def async_setup_entry(hass, entry, async_add_devices):
     """Set up the sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    await async_migrate_old_unique_ids(hass, entry, "switch")
     devices_list = build_entities(coordinator)
     async_add_devices(devices_list)
 
+    @callback
+    def async_add_new_entities(catalog):
+        """Add entities registered after setup (e.g. sparse sends)."""
+        async_add_devices(build_entities(coordinator, catalog))
 
-def build_entities(coordinator):
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, coordinator.new_entities_signal, async_add_new_entities
+        )
+    )
+
+
+def build_entities(coordinator, catalog=None):
     """Build up the entities."""
     entities = []
-    for entity in coordinator.entity_catalog.get("SWITCH"):
-
-        if entity.get("type") == "mute":
-            entities.append(
-                BehringerMixerSwitch(
-                    coordinator=coordinator,
-                    entity_description=SwitchEntityDescription(
-                        key=entity.get("key"),
-                        name=entity.get("default_name"),
-                    ),
-                    entity_setup=entity,
-                )
-            )
-        else:
-            entities.append(
-                BehringerMixerSwitchGeneric(
-                    coordinator=coordinator,
-                    entity_description=SwitchEntityDescription(
-                        key=entity.get("key"),
-                        name=entity.get("default_name"),
-                    ),
-                    entity_setup=entity,
-                )
+    catalog = catalog if catalog is not None else coordinator.entity_catalog
+    for entity in catalog.get("SWITCH", []):
+        entity_class = ENTITY_CLASSES.get(entity.type, BehringerMixerSwitchGeneric)
+        entities.append(
+            entity_class(
+                coordinator=coordinator,
+                entity_description=SwitchEntityDescription(
+                    key=entity.key,
+                    name=entity.default_name,
+                ),
+                entity_setup=entity,
             )
+        )
     return entities
 
 class BehringerMixerSwitchGeneric(BehringerMixerEntity, SwitchEntity):
@@ -70,6 +70,11 @@ class BehringerMixerSwitch(BehringerMixerEntity, SwitchEntity):
 
     _attr_icon = "mdi:volume-high"
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise the switch and its address key."""
+        super().__init__(*args, **kwargs)
+        self._on_address = self.entity_setup.on_address
+
     @property
     def icon(self) -> str | None:
         """Icon of the entity."""
@@ -80,16 +85,18 @@ class BehringerMixerSwitch(BehringerMixerEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return true if the switch is on."""
-        return self.coordinator.data.get(self.base_address + "/mix_on", False)
+        return self.coordinator.data.get(self._on_address, False)
 
     async def async_turn_on(self, **_: any) -> None:
         """Turn on the switch."""
-        await self.coordinator.client.async_set_value(
-            self.base_address + "/mix_on", True
-        )
+        await self.coordinator.client.async_set_value(self._on_address, True)
 
     async def async_turn_off(self, **_: any) -> None:
         """Turn off the switch."""
-        await self.coordinator.client.async_set_value(
-            self.base_address + "/mix_on", False
-        )
+        await self.coordinator.client.async_set_value(self._on_address, False)
+
+
+# Catalog type -> entity class, generic switches for anything else
+ENTITY_CLASSES = {
+    "mute": BehringerMixerSwitch,
+}
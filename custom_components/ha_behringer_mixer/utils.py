@@ -25,31 +25,62 @@ def sanitize_name(raw_name: str) -> str:
     return ha_slugify(raw_name, separator="_")
 
 
-async def async_migrate_old_unique_ids(hass, config_entry, platform_domain):
+def parse_signal_thresholds(text: str) -> dict[str, float]:
+    """Parse per-address signal thresholds, e.g. "ch/1=-40, main/st=-60".
+
+    Returns a mapping of state base address to threshold in dBFS and raises
+    ValueError if an entry cannot be parsed.
+    """
+    thresholds = {}
+    for item in (text or "").split(","):
+        if not item.strip():
+            continue
+        address, _, threshold = item.partition("=")
+        address = "/" + address.strip().strip("/")
+        try:
+            if address == "/":
+                raise ValueError
+            thresholds[address] = float(threshold)
+        except ValueError:
+            raise ValueError(f"Invalid signal threshold: {item.strip()}") from None
+    return thresholds
+
+
+async def async_migrate_old_unique_ids(hass, config_entry):
     """Migrate hyphenated unique IDs to sanitized versions for 2026.02 compliance.
 
-    Call this from each platform's async_setup_entry.
+    Runs once per config entry, from async_migrate_entry, over the entities
+    of every platform in a single pass of the registry.
     """
     ent_reg = er.async_get(hass)
 
-    # Get all entities for this config entry and platform (e.g., 'number')
+    # Get all entities for this config entry, and index their unique IDs so
+    # a migration never collides with an entity that already has the new ID
     entries = er.async_entries_for_config_entry(ent_reg, config_entry.entry_id)
+    taken = {(entry.domain, entry.unique_id) for entry in entries}
 
     for entry in entries:
-        # Only process entities for the specific platform calling this (sensor, number, etc.)
-        if entry.domain != platform_domain:
-            continue
-
         # Create the compliant ID
         clean_unique_id = sanitize_name(entry.unique_id)
 
-        if entry.unique_id != clean_unique_id:
-            _LOGGER.info(
-                "Migrating %s entity unique_id: %s -> %s",
-                platform_domain,
+        if entry.unique_id == clean_unique_id:
+            continue
+        if (entry.domain, clean_unique_id) in taken:
+            _LOGGER.warning(
+                "Not migrating %s entity unique_id %s, %s is already in use",
+                entry.domain,
                 entry.unique_id,
                 clean_unique_id,
             )
-
-            # Update the registry. This moves settings/history to the new ID.
-            ent_reg.async_update_entity(entry.entity_id, new_unique_id=clean_unique_id)
+            continue
+        _LOGGER.info(
+            "Migrating %s entity unique_id: %s -> %s",
+            entry.domain,
+            entry.unique_id,
+            clean_unique_id,
+        )
+
+        # Update the registry. This moves settings/history to the new ID.
+        ent_reg.async_update_entity(entry.entity_id, new_unique_id=clean_unique_id)
+        taken.discard((entry.domain, entry.unique_id))
+        taken.add((entry.domain, clean_unique_id))
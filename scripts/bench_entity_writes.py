@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Measure the cost of calculating an entity state write.
+
+Builds fader, mute switch and fader dB sensor entities against an in-memory
+mixer state (no Home Assistant instance or mixer needed) and times
+Entity._async_calculate_state, which is what every state write runs.
+
+With --baseline the entities work out their name, address keys and options
+on every write, as they did before those were cached, so the two runs give
+the before and after cost per write.
+
+Usage: python scripts/bench_entity_writes.py [--channels 32] [--writes 20000]
+                                             [--repeat 5] [--baseline]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "custom_components"),
+)
+
+from homeassistant.components.number import NumberEntityDescription  # noqa: E402
+from homeassistant.components.sensor import SensorEntityDescription  # noqa: E402
+from homeassistant.components.switch import SwitchEntityDescription  # noqa: E402
+
+from ha_behringer_mixer.catalog import CatalogEntry  # noqa: E402
+from ha_behringer_mixer.number import BehringerMixerFader  # noqa: E402
+from ha_behringer_mixer.sensor import BehringerMixerDbSensor  # noqa: E402
+from ha_behringer_mixer.switch import BehringerMixerSwitch  # noqa: E402
+
+
+def _uncached_name(entity) -> str:
+    """Return the entity name the way it was resolved before it was cached."""
+    return (
+        (
+            entity.coordinator.data.get(entity.base_address + "/config_name", "")
+            or entity.default_name
+        )
+        + " "
+        + entity.name_suffix
+    )
+
+
+class BaselineFader(BehringerMixerFader):
+    """A fader without the cached name, address keys and option flag."""
+
+    @property
+    def name(self) -> str | None:
+        """Name of the entity."""
+        return _uncached_name(self)
+
+    @property
+    def native_max_value(self) -> float:
+        """Maximum value of the entity."""
+        if self.coordinator.config_entry.data.get("UPSCALE_100"):
+            return 100
+        return 1
+
+    @property
+    def native_value(self) -> float | None:
+        """Value of the entity."""
+        value = self.coordinator.data.get(self.base_address + "/mix_fader", "")
+        if self.coordinator.config_entry.data.get("UPSCALE_100"):
+            return 100 * value
+        return value
+
+    @property
+    def extra_state_attributes(self):
+        """Generate extra state attributes."""
+        attrs = {}
+        db_value = self.coordinator.data.get(self.base_address + "/mix_fader_db", None)
+        attrs["db"] = db_value if db_value is not None else -90
+        attrs["low_precision"] = round(self.value or 0, 3)
+        return attrs
+
+
+class BaselineSwitch(BehringerMixerSwitch):
+    """A mute switch without the cached name and address key."""
+
+    @property
+    def name(self) -> str | None:
+        """Name of the entity."""
+        return _uncached_name(self)
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if the switch is on."""
+        return self.coordinator.data.get(self.base_address + "/mix_on", False)
+
+
+class BaselineDbSensor(BehringerMixerDbSensor):
+    """A fader dB sensor without the cached name and address key."""
+
+    @property
+    def name(self) -> str | None:
+        """Name of the entity."""
+        return _uncached_name(self)
+
+    @property
+    def native_value(self) -> float | None:
+        """Value of the entity."""
+        value = self.coordinator.data.get(self.base_address + "/mix_fader_db", "")
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return -90
+
+
+def build(channels: int, baseline: bool = False):
+    """Return a fake coordinator and the entities of every channel."""
+    state = {}
+    for number in range(1, channels + 1):
+        base = f"/ch/{number}"
+        state[base + "/mix_fader"] = 0.5
+        state[base + "/mix_fader_db"] = -10.0
+        state[base + "/mix_on"] = True
+        state[base + "/config_name"] = f"Vocal {number}"
+    coordinator = SimpleNamespace(
+        data=state,
+        sub_connected=True,
+        config_entry=SimpleNamespace(
+            entry_id="bench", data={"MIXER_TYPE": "X32", "MIXER_IP": "127.0.0.1"}
+        ),
+    )
+    classes = (
+        (BaselineFader, BaselineSwitch, BaselineDbSensor)
+        if baseline
+        else (BehringerMixerFader, BehringerMixerSwitch, BehringerMixerDbSensor)
+    )
+    entities = []
+    for number in range(1, channels + 1):
+        key = f"bench_ch_{number}"
+        for cls, description, entity_type, suffix in (
+            (classes[0], NumberEntityDescription, "fader", "Fader"),
+            (classes[1], SwitchEntityDescription, "mute", "On"),
+            (classes[2], SensorEntityDescription, "faderdb", "Fader (dB)"),
+        ):
+            entity = cls(
+                coordinator=coordinator,
+                entity_description=description(key=key + suffix),
+                entity_setup=CatalogEntry(
+                    entity_type=entity_type,
+                    key=f"{key}_{suffix}",
+                    default_name=f"channel {number}",
+                    base_address=f"/ch/{number}",
+                    name_suffix=suffix,
+                ),
+            )
+            entity.entity_id = f"bench.{key}_{suffix}"
+            entities.append(entity)
+    return coordinator, entities
+
+
+def main() -> None:
+    """Run the benchmark and print the cost per state write."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--channels", type=int, default=32)
+    parser.add_argument("--writes", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--baseline",
+        action="store_true",
+        help="resolve names, keys and options on every write, as before caching",
+    )
+    args = parser.parse_args()
+
+    coordinator, entities = build(args.channels, args.baseline)
+    rounds = max(args.writes // len(entities), 1)
+    for entity in entities:
+        entity._async_calculate_state()
+
+    best = None
+    for _ in range(args.repeat):
+        started = time.perf_counter_ns()
+        for index in range(rounds):
+            coordinator.data["/ch/1/mix_fader"] = (index % 100) / 100
+            for entity in entities:
+                entity._async_calculate_state()
+        elapsed = time.perf_counter_ns() - started
+        best = elapsed if best is None else min(best, elapsed)
+    writes = rounds * len(entities)
+    mode = "baseline (uncached)" if args.baseline else "cached"
+    sys.stdout.write(
+        f"{mode}: {len(entities)} entities, {writes} state writes, "
+        f"best of {args.repeat}\n"
+        f"{best / writes:.0f} ns per state write\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""Measure end-to-end latency and throughput of live mixer updates.
+
+Runs the real BehringerMixerApiClient, MixerDataUpdateCoordinator and
+entities inside a bare Home Assistant core, connected over UDP to the mixer
+simulator (scripts/simulator.py) running on its own thread. For each catalog
+size it pushes fader moves from the simulator and times each one until the
+entity bound to the fader has written its state (async_write_ha_state).
+
+Reported per catalog size:
+  latency_ms               p50/p99 from the simulator sending a change to the
+                           state write, at --rate changes per second
+  cpu_us_per_update        CPU time of the Home Assistant event loop thread
+                           per delivered update, at --rate
+  max_updates_per_second   highest rate (doubling from 250 up to --max-rate)
+                           at which at least 95% of the changes arrived and
+                           p99 stayed below --max-latency
+
+Results are written as JSON, so they can be compared between revisions.
+
+Usage: python scripts/bench_live_updates.py [--type X32]
+                                            [--sizes 10,100,500,2000]
+                                            [--rate 200] [--duration 5]
+                                            [--max-rate 16000]
+                                            [--max-latency 250]
+                                            [--io-thread] [--update-window 0]
+                                            [--output results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from types import MappingProxyType
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "custom_components"),
+)
+
+from homeassistant import config_entries  # noqa: E402
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import frame  # noqa: E402
+
+from ha_behringer_mixer import (  # noqa: E402
+    binary_sensor,
+    number,
+    select,
+    sensor,
+    switch,
+)
+from ha_behringer_mixer.api import BehringerMixerApiClient  # noqa: E402
+from ha_behringer_mixer.const import DOMAIN  # noqa: E402
+from ha_behringer_mixer.coordinator import MixerDataUpdateCoordinator  # noqa: E402
+from ha_behringer_mixer.entity import BehringerMixerEntity  # noqa: E402
+from ha_behringer_mixer.manager import async_get_connection_manager  # noqa: E402
+from simulator import MixerSimulator  # noqa: E402
+
+PLATFORMS = (number, switch, sensor, select, binary_sensor)
+# Share of the pushed changes that must arrive for a rate to count as sustained
+MIN_DELIVERY = 0.95
+# Time allowed for the last changes of a run to arrive
+DRAIN_TIME = 0.5
+
+
+class Probe:
+    """Match changes pushed by the simulator with the state writes."""
+
+    def __init__(self) -> None:
+        """Initialise the probe."""
+        # Base address -> time of its oldest change not written yet. Written
+        # by the simulator thread, popped on the event loop (GIL-atomic).
+        self.pending = {}
+        self.latencies = []
+        self.pushed = 0
+
+    def reset(self) -> None:
+        """Forget the previous run."""
+        self.pending.clear()
+        self.latencies = []
+        self.pushed = 0
+
+    def changed(self, base_address: str) -> None:
+        """Record a change pushed by the simulator."""
+        if base_address not in self.pending:
+            self.pending[base_address] = time.perf_counter()
+            self.pushed += 1
+
+    def written(self, base_address: str) -> None:
+        """Record a state write of an entity."""
+        started = self.pending.pop(base_address, None)
+        if started is not None:
+            self.latencies.append(time.perf_counter() - started)
+
+
+class SimulatorThread:
+    """Run the simulator on its own thread and event loop."""
+
+    def __init__(self, mixer_type: str) -> None:
+        """Start the thread and the simulator."""
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="simulator", daemon=True
+        )
+        self._thread.start()
+        self.simulator = MixerSimulator(mixer_type)
+        self.call(self.simulator.start())
+
+    def call(self, coro):
+        """Run a coroutine on the simulator loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    async def drive(self, probe: Probe, addresses, rate: float, duration: float):
+        """Push fader moves round robin at rate per second for duration."""
+        started = last = time.monotonic()
+        due = 0.0
+        count = 0
+        while last - started < duration:
+            await asyncio.sleep(0.005)
+            now = time.monotonic()
+            due += (now - last) * rate
+            last = now
+            for _ in range(int(due)):
+                base_address, address = addresses[count % len(addresses)]
+                count += 1
+                probe.changed(base_address)
+                self.simulator.push(address, (count % 997) / 997)
+            due -= int(due)
+
+    def stop(self) -> None:
+        """Stop the simulator and its thread."""
+        self.loop.call_soon_threadsafe(self.simulator.stop)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+
+
+def entry_data(mixer_type: str, mixer_info: dict) -> dict:
+    """Return config entry data enabling every entity of the mixer type."""
+
+    def numbers(key):
+        return list(range(1, mixer_info.get(key, {}).get("number", 0) + 1))
+
+    return {
+        "NAME": "bench",
+        "MIXER_IP": "127.0.0.1",
+        "MIXER_TYPE": mixer_type,
+        "CHANNEL_CONFIG": numbers("channel"),
+        "BUS_CONFIG": numbers("bus"),
+        "DCA_CONFIG": numbers("dca"),
+        "MATRIX_CONFIG": numbers("matrix"),
+        "AUXIN_CONFIG": numbers("auxin"),
+        "HEADAMPS_CONFIG": numbers("head_amps"),
+        "MAIN_CONFIG": True,
+        "CHANNELSENDS_CONFIG": True,
+        "BUSSENDS_CONFIG": True,
+        "MUTE_GROUPS": True,
+        "DBSENSORS": True,
+    }
+
+
+def trim_catalog(catalog: dict, size: int) -> dict:
+    """Keep whole entity groups, in catalog order, until size is reached."""
+    order = {}
+    for entities in catalog.values():
+        for entity in entities:
+            order.setdefault(entity.base_address, 0)
+            order[entity.base_address] += 1
+    kept = set()
+    count = 0
+    for base_address, entities in order.items():
+        if count >= size:
+            break
+        kept.add(base_address)
+        count += entities
+    return {
+        platform: [entity for entity in entities if entity.base_address in kept]
+        for platform, entities in catalog.items()
+    }
+
+
+def summarise(probe: Probe) -> dict:
+    """Return the latency percentiles of a run in milliseconds."""
+    if len(probe.latencies) < 2:
+        return {"p50": None, "p99": None}
+    cuts = statistics.quantiles(probe.latencies, n=100)
+    return {"p50": round(cuts[49] * 1000, 3), "p99": round(cuts[98] * 1000, 3)}
+
+
+async def run_size(hass, sim: SimulatorThread, probe: Probe, args, size: int):
+    """Set up the integration with size entities and measure it."""
+    mixer_type = args.type
+    client = BehringerMixerApiClient(
+        "127.0.0.1",
+        mixer_type,
+        update_window=args.update_window,
+        io_thread=args.io_thread,
+        connection_manager=async_get_connection_manager(hass),
+    )
+    entry = ConfigEntry(
+        data=entry_data(mixer_type, client.mixer_info()),
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options={},
+        source="user",
+        subentries_data=None,
+        title="bench",
+        unique_id=None,
+        version=5,
+    )
+    config_entries.current_entry.set(entry)
+    coordinator = MixerDataUpdateCoordinator(hass=hass, client=client)
+    coordinator.entity_catalog = trim_catalog(coordinator.entity_catalog, size)
+    client.restrict_addresses(
+        coordinator.address_prefixes(), coordinator.library_tags()
+    )
+    await client.setup()
+    await coordinator.async_refresh()
+    client.register_coordinator(coordinator)
+
+    entities = []
+    for platform in PLATFORMS:
+        entities.extend(platform.build_entities(coordinator))
+    for index, entity in enumerate(entities):
+        entity.hass = hass
+        entity.entity_id = f"{DOMAIN}.bench_{index}"
+        await entity.async_added_to_hass()
+        entity.async_write_ha_state()
+    addresses = [
+        (entity.base_address, address)
+        for entity in coordinator.entity_catalog["NUMBER"]
+        if entity.type == "fader"
+        and (address := sim.simulator.input_address(entity.fader_address))
+    ]
+
+    async def measure(rate):
+        probe.reset()
+        cpu = time.thread_time()
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(
+                sim.drive(probe, addresses, rate, args.duration), sim.loop
+            )
+        )
+        await asyncio.sleep(DRAIN_TIME)
+        cpu = time.thread_time() - cpu
+        delivered = len(probe.latencies)
+        return probe.pushed, delivered, cpu, summarise(probe)
+
+    pushed, delivered, cpu, latency = await measure(args.rate)
+    result = {
+        "entities": len(entities),
+        "addresses": len(addresses),
+        "rate": args.rate,
+        "pushed": pushed,
+        "delivered": delivered,
+        "latency_ms": latency,
+        "cpu_us_per_update": round(cpu / delivered * 1e6, 1) if delivered else None,
+        "max_updates_per_second": 0,
+    }
+    rate = 250
+    while rate <= args.max_rate:
+        pushed, delivered, _, latency = await measure(rate)
+        if (
+            not pushed
+            or delivered < pushed * MIN_DELIVERY
+            or latency["p99"] is None
+            or latency["p99"] > args.max_latency
+        ):
+            break
+        result["max_updates_per_second"] = rate
+        rate *= 2
+
+    for entity in entities:
+        await entity.async_remove(force_remove=True)
+    await client.stop()
+    return result
+
+
+async def run(args) -> dict:
+    """Run the benchmark for every catalog size."""
+    hass = HomeAssistant(tempfile.mkdtemp())
+    frame.async_setup(hass)
+    probe = Probe()
+    original_write = BehringerMixerEntity.async_write_ha_state
+
+    def timed_write(self):
+        original_write(self)
+        probe.written(self.base_address)
+
+    BehringerMixerEntity.async_write_ha_state = timed_write
+    sim = SimulatorThread(args.type)
+    try:
+        results = [await run_size(hass, sim, probe, args, size) for size in args.sizes]
+    finally:
+        sim.stop()
+    return {
+        "mixer_type": args.type,
+        "io_thread": args.io_thread,
+        "update_window": args.update_window,
+        "duration": args.duration,
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Parse the arguments, run the benchmark and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--type", default="X32")
+    parser.add_argument(
+        "--sizes",
+        default="10,100,500,2000",
+        type=lambda text: [int(size) for size in text.split(",")],
+    )
+    parser.add_argument("--rate", type=float, default=200)
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--max-rate", type=float, default=16000)
+    parser.add_argument("--max-latency", type=float, default=250)
+    parser.add_argument("--io-thread", action="store_true")
+    parser.add_argument("--update-window", type=int, default=0)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+    # Entities are added without an entity platform; keep the log quiet
+    logging.basicConfig(level=logging.ERROR)
+
+    results = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(results + "\n")
+    else:
+        sys.stdout.write(results + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,473 @@
+#!/usr/bin/env python3
+"""Simulate a Behringer mixer on a local UDP port.
+
+Speaks enough of the X32, X-Air (XR18/XR16/XR12) and WING OSC protocols for
+the integration to run against it unchanged: it answers the info query,
+keeps /xremote (or WING "/*s") subscriptions alive, answers parameter
+queries, applies writes and echoes them to the other subscribers, recalls
+scenes, and streams meter blobs (silent unless set with set_meters) to the
+clients that request them. It can also push a storm of synthetic changes
+(fader moves and mute toggles) to its subscribers at a configurable rate,
+to measure throughput and latency without hardware.
+
+The parameters are taken from the behringer_mixer library's own mapping
+table, so the simulated console has exactly the addresses the client loads.
+
+Usage: python scripts/simulator.py [--type X32] [--host 127.0.0.1]
+                                   [--port PORT] [--rate 0]
+                                   [--storm /ch/] [--name Simulator]
+
+Then add the integration with MIXER_IP set to the host (the port is the
+mixer type's default unless --port is given).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import logging
+import random
+import sys
+import time
+from array import array
+
+from behringer_mixer import mixer_api
+from pythonosc.osc_message import OscMessage, ParseError
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+_LOGGER = logging.getLogger("simulator")
+
+# How long a subscription lasts without being renewed, as on the consoles
+SUBSCRIPTION_TIMEOUT = 10
+# Storm changes are sent in batches at this rate
+STORM_TICK_RATE = 100
+# Meter blobs are sent to the clients that requested them at this rate
+METER_RATE = 20
+
+# Meter blob -> (sample typecode, number of samples), as the consoles send them.
+# "f" samples are linear levels, "h" samples are dB * 256.
+METER_BLOBS = {
+    "/meters/0": ("f", 70),
+    "/meters/1": ("h", 40),
+    "/meters/2": ("f", 49),
+}
+# The sample of a silent input, per typecode
+METER_SILENCE = {"f": 0.0, "h": -32768}
+
+MODELS = {
+    "X32": ("X32", "4.06"),
+    "XR18": ("XR18", "1.17"),
+    "XR16": ("XR16", "1.17"),
+    "XR12": ("XR12", "1.17"),
+    "WING": ("wing", "3.0.5"),
+}
+
+# Default value per state address suffix, in the console's own units
+DEFAULTS = {
+    "mix_fader": 0.75,
+    "mix_on": 1,
+    "on": 0,
+    "phantom": 0,
+    "gain": 0.5,
+    "config_color": 1,
+    "config_name": "",
+    "current": 0,
+    "next_scene": 0,
+    "mounted": 0,
+    "file": "",
+    "name": "",
+    "state": 0,
+}
+
+
+def _db_to_fader(db: float) -> float:
+    """Convert dB to a fader position, the inverse of the library's curve."""
+    if db >= 10:
+        return 1.0
+    if db >= -10:
+        return (db + 30) / 40
+    if db >= -30:
+        return (db + 50) / 80
+    if db >= -60:
+        return (db + 70) / 160
+    return max((db + 90) / 480, 0.0)
+
+
+def _fader_to_db(fader: float) -> float:
+    """Convert a fader position to dB along the consoles' curve."""
+    if fader >= 1:
+        return 10.0
+    if fader >= 0.5:
+        return round(40 * fader - 30, 1)
+    if fader >= 0.25:
+        return round(80 * fader - 50, 1)
+    if fader >= 0.0625:
+        return round(160 * fader - 70, 1)
+    return round(max(480 * fader - 90, -90), 1)
+
+
+class _Parameter:
+    """One console parameter and how it travels over OSC."""
+
+    __slots__ = ("kind", "nested", "value")
+
+    def __init__(self, mapping: dict, wing: bool) -> None:
+        """Initialise the parameter from a library mapping row."""
+        suffix = mapping["output"].rsplit("/", 1)[-1]
+        self.kind = suffix
+        if mapping.get("data_type") in ("boolean", "boolean_inverted"):
+            self.kind = "boolean"
+        # WING nodes answer with (text, normalised value, raw value)
+        self.nested = wing and "data_index" in mapping
+        value = DEFAULTS.get(suffix, 0)
+        if mapping.get("data_type") == "boolean_inverted":
+            value = 1 - value
+        if mapping.get("mapping"):
+            value = next(iter(mapping["mapping"]))
+        if wing and suffix == "state":
+            value = "STOP"
+        self.value = value
+
+    def args(self) -> list:
+        """Return the OSC arguments reporting the current value."""
+        if not self.nested:
+            return [self.value]
+        if self.kind == "mix_fader":
+            db = _fader_to_db(self.value)
+            return [str(db), float(self.value), db]
+        if isinstance(self.value, str):
+            return [self.value, 0.0, self.value]
+        return [str(self.value), float(self.value), self.value]
+
+    def write(self, value) -> None:
+        """Apply a value written by a client."""
+        if self.nested and self.kind == "mix_fader" and isinstance(value, str):
+            # The client writes WING faders in dB
+            value = _db_to_fader(float(value))
+        elif self.kind == "boolean":
+            value = int(float(value) != 0)
+        elif isinstance(self.value, float):
+            value = float(value)
+        elif isinstance(self.value, int) and isinstance(value, str):
+            value = int(float(value))
+        self.value = value
+
+
+class MixerSimulator(asyncio.DatagramProtocol):
+    """A simulated console answering OSC clients over UDP."""
+
+    def __init__(
+        self, mixer_type: str, name: str = "Simulator", host: str = "127.0.0.1"
+    ) -> None:
+        """Build the console's parameters from the library's mapping table."""
+        self.mixer_type = mixer_type
+        self.name = name
+        self.host = host
+        mixer = mixer_api.create(mixer_type, ip=host)
+        self.port = mixer.port_number
+        self._mixer = mixer
+        self._wing = mixer_type == "WING"
+        self._parameters = {
+            address: _Parameter(mapping, self._wing)
+            for address, mapping in mixer._mappings.items()
+            if address != mixer.info_address
+        }
+        # State address (as the client names it) -> console address
+        self._inputs = {
+            mapping["output"]: address
+            for address, mapping in mixer._mappings.items()
+            if address in self._parameters
+        }
+        self._scene_address = next(
+            (
+                address
+                for address, mapping in mixer._mappings.items()
+                if mapping["output"] == "/scene/current"
+            ),
+            None,
+        )
+        self._subscribers = {}
+        # Scene number -> {console address: value} applied when it is recalled
+        self.scenes = {}
+        self._transport = None
+        self._storm_task = None
+        # (client, meter blob) -> when the request runs out
+        self._meter_requests = {}
+        self._meters = {}
+        self._meter_task = None
+        self.received = 0
+        self.sent = 0
+        # Subscription requests and renewals received from clients
+        self.renewals = 0
+        # Console address -> number of writes received from clients
+        self.writes = {}
+
+    async def start(self, port: int | None = None) -> None:
+        """Start listening on the host and the mixer type's port."""
+        if port:
+            self.port = port
+        loop = asyncio.get_running_loop()
+        await loop.create_datagram_endpoint(
+            lambda: self, local_addr=(self.host, self.port)
+        )
+        _LOGGER.info(
+            "Simulating a %s with %d parameters on %s:%d",
+            self.mixer_type,
+            len(self._parameters),
+            self.host,
+            self.port,
+        )
+
+    def stop(self) -> None:
+        """Stop the change storm and the meters, and close the socket."""
+        self.storm(0)
+        if self._meter_task:
+            self._meter_task.cancel()
+            self._meter_task = None
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+
+    def connection_made(self, transport) -> None:
+        """Keep the transport to reply with."""
+        self._transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        """Handle one OSC message from a client."""
+        if data == b"WING?":
+            # The WING's discovery probe is plain text, and so is the reply
+            if self._wing and self._transport:
+                self._transport.sendto(self._info()[0].encode(), addr)
+            return
+        try:
+            message = OscMessage(data)
+        except ParseError:
+            return
+        self.received += 1
+        address, params = message.address, message.params
+        if address == self._mixer.info_address:
+            self._send(addr, self._info_address(), self._info())
+        elif address in (
+            self._mixer.subscription_string,
+            self._mixer.subscription_renew_string,
+        ):
+            self._subscribers[addr] = time.monotonic() + SUBSCRIPTION_TIMEOUT
+            self.renewals += 1
+        elif address == "/unsubscribe":
+            self._subscribers.pop(addr, None)
+        elif address == "/meters" and params and not self._wing:
+            self._request_meters(addr, str(params[0]))
+        elif address == self._mixer.cmd_scene_load:
+            self._load_scene(address, params, addr)
+        elif self._mixer.cmd_scene_execute and (
+            address == self._mixer.cmd_scene_execute[0]
+        ):
+            self._recall(self._parameters[self._mixer.cmd_scene_load].value)
+        elif (parameter := self._parameters.get(address)) is not None:
+            if params:
+                try:
+                    parameter.write(params[0])
+                except (TypeError, ValueError):
+                    return
+                self.writes[address] = self.writes.get(address, 0) + 1
+                self._broadcast(address, parameter.args(), skip=addr)
+            else:
+                self._send(addr, address, parameter.args())
+
+    def _info_address(self) -> str:
+        """Return the address the info reply is sent to."""
+        return "/*" if self._wing else self._mixer.info_address
+
+    def _info(self) -> list:
+        """Return the arguments of the info reply."""
+        model, firmware = MODELS.get(self.mixer_type, (self.mixer_type, "1.0"))
+        if self._wing:
+            return [f"WING,{self.host},{self.name},{model},SIMULATOR,{firmware}"]
+        return [self.host, self.name, model, firmware]
+
+    def _load_scene(self, address: str, params: list, addr) -> None:
+        """Handle the scene load command of the mixer type."""
+        if not params:
+            return
+        if address in self._parameters:
+            # The WING stages the scene and recalls it on a separate command
+            self._parameters[address].write(params[0])
+            self._send(addr, address, self._parameters[address].args())
+            return
+        self._recall(params[0])
+
+    def _recall(self, scene) -> None:
+        """Recall a scene: apply it, report it and resend every parameter."""
+        try:
+            scene = int(float(scene))
+        except (TypeError, ValueError):
+            return
+        for address, value in self.scenes.get(scene, {}).items():
+            self._parameters[address].value = value
+        if self._scene_address:
+            self.push(self._scene_address, scene)
+        for address, parameter in self._parameters.items():
+            if address != self._scene_address:
+                self._broadcast(address, parameter.args())
+
+    def _send(self, addr, address: str, args: list) -> None:
+        """Send one OSC message to a client."""
+        if not self._transport:
+            return
+        builder = OscMessageBuilder(address=address)
+        for arg in args:
+            builder.add_arg(arg)
+        self._transport.sendto(builder.build().dgram, addr)
+        self.sent += 1
+
+    def _broadcast(self, address: str, args: list, skip=None) -> None:
+        """Send one OSC message to every live subscriber."""
+        now = time.monotonic()
+        for subscriber, expires in list(self._subscribers.items()):
+            if expires < now:
+                del self._subscribers[subscriber]
+            elif subscriber != skip:
+                self._send(subscriber, address, args)
+
+    def _request_meters(self, addr, blob: str) -> None:
+        """Start (or renew) sending a meter blob to a client."""
+        if blob not in METER_BLOBS:
+            return
+        self._meter_requests[addr, blob] = time.monotonic() + SUBSCRIPTION_TIMEOUT
+        if self._meter_task is None:
+            self._meter_task = asyncio.get_running_loop().create_task(
+                self._meter_worker()
+            )
+
+    def set_meters(self, blob: str, samples) -> None:
+        """Set the samples a meter blob reports, in the blob's own units."""
+        typecode, size = METER_BLOBS[blob]
+        frame = array(typecode, samples)
+        frame.extend([METER_SILENCE[typecode]] * (size - len(frame)))
+        self._meters[blob] = frame
+
+    def _meter_blob(self, blob: str) -> bytes:
+        """Return a meter blob: the sample count then the little-endian samples."""
+        typecode, size = METER_BLOBS[blob]
+        frame = self._meters.get(blob) or array(typecode, [METER_SILENCE[typecode]] * size)
+        if sys.byteorder == "big":
+            frame = array(typecode, frame)
+            frame.byteswap()
+        return len(frame).to_bytes(4, "little") + frame.tobytes()
+
+    async def _meter_worker(self) -> None:
+        """Send every requested meter blob, dropping the expired requests."""
+        while True:
+            now = time.monotonic()
+            for (addr, blob), expires in list(self._meter_requests.items()):
+                if expires < now:
+                    del self._meter_requests[addr, blob]
+                else:
+                    self._send(addr, blob, [self._meter_blob(blob)])
+            await asyncio.sleep(1 / METER_RATE)
+
+    def subscribers(self) -> int:
+        """Return the number of live subscriptions."""
+        now = time.monotonic()
+        return sum(1 for expires in self._subscribers.values() if expires >= now)
+
+    def addresses(self, prefix: str = "/") -> list[str]:
+        """Return the parameter addresses starting with prefix."""
+        return [address for address in self._parameters if address.startswith(prefix)]
+
+    def input_address(self, state_address: str) -> str | None:
+        """Return the console address behind a client state address."""
+        return self._inputs.get(state_address)
+
+    def value(self, address: str):
+        """Return the current value of a parameter."""
+        return self._parameters[address].value
+
+    def push(self, address: str, value, report: bool = True) -> None:
+        """Change a parameter as if on the console and report it.
+
+        With report=False nobody is told, like a change clients missed.
+        """
+        parameter = self._parameters[address]
+        parameter.value = value
+        if report:
+            self._broadcast(address, parameter.args())
+
+    def storm(self, rate: float, prefix: str = "/ch/") -> None:
+        """Push synthetic changes at rate per second, 0 to stop."""
+        if self._storm_task:
+            self._storm_task.cancel()
+            self._storm_task = None
+        if rate > 0:
+            addresses = [
+                address
+                for address in self.addresses(prefix)
+                if self._parameters[address].kind in ("mix_fader", "boolean")
+            ]
+            if addresses:
+                self._storm_task = asyncio.get_running_loop().create_task(
+                    self._storm_worker(rate, addresses)
+                )
+
+    async def _storm_worker(self, rate: float, addresses: list[str]) -> None:
+        """Walk the faders and toggle the switches in batches."""
+        cycle = itertools.cycle(addresses)
+        due = 0.0
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(1 / STORM_TICK_RATE)
+            now = time.monotonic()
+            due += (now - last) * rate
+            last = now
+            for _ in range(int(due)):
+                address = next(cycle)
+                parameter = self._parameters[address]
+                if parameter.kind == "boolean":
+                    self.push(address, 1 - parameter.value)
+                else:
+                    value = parameter.value + random.uniform(-0.05, 0.05)
+                    self.push(address, round(min(max(value, 0.0), 1.0), 4))
+            due -= int(due)
+
+
+async def _run(args) -> None:
+    """Run the simulator until interrupted."""
+    simulator = MixerSimulator(args.type, name=args.name, host=args.host)
+    await simulator.start(args.port)
+    simulator.storm(args.rate, args.storm)
+    try:
+        while True:
+            await asyncio.sleep(10)
+            _LOGGER.info(
+                "%d subscribers, %d messages received, %d sent",
+                simulator.subscribers(),
+                simulator.received,
+                simulator.sent,
+            )
+    finally:
+        simulator.stop()
+
+
+def main() -> None:
+    """Parse the arguments and run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--type", default="X32", choices=sorted(MODELS))
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument(
+        "--rate", type=float, default=0, help="synthetic changes per second"
+    )
+    parser.add_argument(
+        "--storm", default="/ch/", help="address prefix the changes are made on"
+    )
+    parser.add_argument("--name", default="Simulator")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""Fixtures running the integration against the mixer simulator.
+
+The integration's client, coordinator and entities run inside a bare Home
+Assistant core, talking over UDP on the loopback interface to
+scripts/simulator.py on the same event loop, as scripts/bench_live_updates.py
+does.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from types import MappingProxyType
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "custom_components"), os.path.join(ROOT, "scripts")]
+
+from homeassistant import config_entries  # noqa: E402
+from homeassistant.config_entries import ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import entity_registry as er, frame  # noqa: E402
+
+from ha_behringer_mixer import (  # noqa: E402
+    binary_sensor,
+    number,
+    select,
+    sensor,
+    switch,
+)
+from ha_behringer_mixer.api import BehringerMixerApiClient  # noqa: E402
+from ha_behringer_mixer.const import DEFAULT_SIGNAL_HOLD, DOMAIN  # noqa: E402
+from ha_behringer_mixer.coordinator import MixerDataUpdateCoordinator  # noqa: E402
+from ha_behringer_mixer.entity import BehringerMixerEntity  # noqa: E402
+from ha_behringer_mixer.manager import async_get_connection_manager  # noqa: E402
+from simulator import MixerSimulator  # noqa: E402
+
+PLATFORMS = (number, switch, sensor, select, binary_sensor)
+
+ENTRY_DATA = {
+    "NAME": "Test",
+    "MIXER_IP": "127.0.0.1",
+    "MIXER_TYPE": "X32",
+    "CHANNEL_CONFIG": [1, 2],
+    "BUS_CONFIG": [1],
+    "DCA_CONFIG": [],
+    "MATRIX_CONFIG": [],
+    "AUXIN_CONFIG": [],
+    "HEADAMPS_CONFIG": [],
+    "MAIN_CONFIG": True,
+    "CHANNELSENDS_CONFIG": False,
+    "BUSSENDS_CONFIG": False,
+    "MUTE_GROUPS": False,
+    "DBSENSORS": True,
+    "UPSCALE_100": False,
+}
+
+
+async def wait_for(predicate, timeout: float = 3.0) -> bool:
+    """Wait until predicate() is true, returning False on timeout."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+class MixerHarness:
+    """The integration for one config entry, set up against the simulator."""
+
+    def __init__(self, hass: HomeAssistant, options: dict) -> None:
+        """Initialise the harness."""
+        self.hass = hass
+        self.entry = ConfigEntry(
+            data={**ENTRY_DATA, **options},
+            discovery_keys=MappingProxyType({}),
+            domain=DOMAIN,
+            minor_version=1,
+            options={},
+            source="user",
+            subentries_data=None,
+            title="Test",
+            unique_id=None,
+            version=5,
+        )
+        self.client = None
+        self.coordinator = None
+        self.entities = []
+        # Unique IDs of the entities that wrote their state, in order
+        self.written = []
+
+    async def async_setup(self, snapshot: dict | None = None) -> None:
+        """Connect to the simulator and add the entities, like async_setup_entry.
+
+        With a snapshot the entities are added from it first and the live
+        connection is left to async_start_live_updates.
+        """
+        data = self.entry.data
+        config_entries.current_entry.set(self.entry)
+        self.client = client = BehringerMixerApiClient(
+            mixer_ip=data["MIXER_IP"],
+            mixer_type=data["MIXER_TYPE"],
+            update_window=data.get("UPDATE_WINDOW", 0),
+            io_thread=data.get("IO_THREAD", False),
+            connection_manager=async_get_connection_manager(self.hass),
+        )
+        from_snapshot = bool(snapshot) and client.load_snapshot(snapshot)
+        self.coordinator = coordinator = MixerDataUpdateCoordinator(
+            hass=self.hass, client=client
+        )
+        coordinator.sub_connected = not from_snapshot
+        client.restrict_addresses(
+            coordinator.address_prefixes(), coordinator.library_tags()
+        )
+        meter_addresses = coordinator.meter_addresses()
+        signal_thresholds = coordinator.signal_thresholds()
+        if meter_addresses or signal_thresholds:
+            client.enable_meters(
+                meter_addresses,
+                signal_thresholds,
+                data.get("SIGNAL_HOLD", DEFAULT_SIGNAL_HOLD),
+            )
+        if not from_snapshot:
+            assert await client.setup()
+        await coordinator.async_refresh()
+        client.register_coordinator(coordinator)
+        await self.async_add_entities()
+        self.written.clear()
+
+    async def async_add_entities(self, catalog: dict | None = None) -> None:
+        """Add the entities of a catalog (default: the whole catalog)."""
+        for platform in PLATFORMS:
+            for entity in platform.build_entities(self.coordinator, catalog):
+                entity.hass = self.hass
+                entity.entity_id = f"{DOMAIN}.test_{len(self.entities)}"
+                self.entities.append(entity)
+                await entity.async_added_to_hass()
+
+    async def async_stop(self) -> None:
+        """Remove the entities and disconnect."""
+        for entity in self.entities:
+            await entity.async_remove(force_remove=True)
+        self.entities = []
+        if self.client:
+            await self.client.stop()
+            self.client = None
+
+    def entity(self, unique_id: str) -> BehringerMixerEntity:
+        """Return the entity with the given unique ID."""
+        return next(
+            entity for entity in self.entities if entity.unique_id == unique_id
+        )
+
+
+@pytest.fixture
+async def hass(tmp_path):
+    """Return a bare Home Assistant core."""
+    hass = HomeAssistant(str(tmp_path))
+    frame.async_setup(hass)
+    yield hass
+    await hass.async_stop(force=True)
+
+
+@pytest.fixture
+async def entity_registry(hass):
+    """Return the entity registry, with config entries to register entities to."""
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    await er.async_load(hass)
+    return er.async_get(hass)
+
+
+@pytest.fixture
+async def simulator():
+    """Return a simulated X32 on the loopback interface."""
+    simulator = MixerSimulator("X32")
+    await simulator.start()
+    yield simulator
+    simulator.stop()
+
+
+@pytest.fixture
+async def setup_mixer(hass, simulator, monkeypatch):
+    """Return a function setting up the integration against the simulator."""
+    harnesses = []
+    original_write = BehringerMixerEntity.async_write_ha_state
+
+    def recording_write(self):
+        original_write(self)
+        for harness in harnesses:
+            if self in harness.entities:
+                harness.written.append(self.unique_id)
+
+    monkeypatch.setattr(BehringerMixerEntity, "async_write_ha_state", recording_write)
+
+    async def _setup(snapshot=None, **options) -> MixerHarness:
+        harness = MixerHarness(hass, options)
+        harnesses.append(harness)
+        await harness.async_setup(snapshot)
+        if not snapshot:
+            assert await wait_for(lambda: simulator.subscribers() > 0)
+        return harness
+
+    yield _setup
+    for harness in harnesses:
+        await harness.async_stop()
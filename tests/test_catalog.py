@@ -0,0 +1,35 @@
+"""The entity catalog's precomputed addresses."""
+
+from __future__ import annotations
+
+from ha_behringer_mixer.catalog import CatalogEntry
+
+
+def test_entry_builds_every_address_once():
+    """A fader entry carries the addresses its entity reads and writes."""
+    entry = CatalogEntry(
+        entity_type="fader",
+        key="test_channel_1_fader",
+        default_name="",
+        base_address="/ch/1",
+    )
+
+    assert entry.value_addresses == ("/ch/1/mix_fader",)
+    assert entry.follows_name
+    assert entry.db_address == "/ch/1/mix_fader_db"
+    assert entry.write_address == "/ch/1/mix_fader"
+    assert entry.rms_address is None
+
+
+async def test_entities_share_the_catalog_strings(setup_mixer):
+    """Entities and the listener index use the catalog's strings, not copies."""
+    mixer = await setup_mixer(METERS=True)
+    listened = {key: key for key in mixer.coordinator._address_listeners}
+    fader = mixer.entity("test_channel_1_fader")
+    meter = mixer.entity("test_channel_1_meter")
+
+    assert fader._fader_db_address is fader.entity_setup.db_address
+    assert meter._rms_address is meter.entity_setup.rms_address
+    for entity in (fader, meter):
+        for address in entity.entity_setup.value_addresses:
+            assert listened[address] is address
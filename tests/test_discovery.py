@@ -0,0 +1,44 @@
+"""Tests for finding mixers on the network."""
+
+from __future__ import annotations
+
+from ha_behringer_mixer.discovery import async_discover_mixers, parse_reply
+from simulator import MixerSimulator
+
+
+async def test_discovery_finds_every_family():
+    """One simulated console of each family answers its own probe."""
+    simulators = [
+        MixerSimulator("X32", name="Front", host="127.0.0.2"),
+        MixerSimulator("XR18", name="Monitor", host="127.0.0.3"),
+        MixerSimulator("WING", name="Stage", host="127.0.0.4"),
+    ]
+    for simulator in simulators:
+        # The WING answers discovery on 2222, next to its OSC port
+        await simulator.start(2222 if simulator.mixer_type == "WING" else None)
+    try:
+        # 127.0.0.5 has no console and must not hold up the others
+        found = await async_discover_mixers(
+            targets=["127.0.0.2", "127.0.0.3", "127.0.0.4", "127.0.0.5"],
+            timeout=0.5,
+        )
+    finally:
+        for simulator in simulators:
+            simulator.stop()
+
+    assert [(mixer.name, mixer.ip, mixer.mixer_type) for mixer in found] == [
+        ("Front", "127.0.0.2", "X32"),
+        ("Monitor", "127.0.0.3", "XR18"),
+        ("Stage", "127.0.0.4", "WING"),
+    ]
+
+
+async def test_discovery_without_consoles():
+    """Nothing answering is an empty result once the timeout passes."""
+    assert await async_discover_mixers(targets=["127.0.0.5"], timeout=0.2) == []
+
+
+def test_parse_reply_ignores_other_traffic():
+    """Replies that are not a console's info are dropped."""
+    assert parse_reply(b"not osc", "127.0.0.2") is None
+    assert parse_reply(b"WING,too,short", "127.0.0.2") is None
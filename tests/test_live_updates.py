@@ -0,0 +1,174 @@
+"""Live updates and writes against the simulated mixer."""
+
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.core import ServiceCall
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import pytest
+
+from conftest import wait_for
+from ha_behringer_mixer.api import BehringerMixerApiClientCommunicationError
+from ha_behringer_mixer.const import DOMAIN
+from ha_behringer_mixer.number import async_fade_entity
+
+
+async def test_update_writes_only_bound_entities(setup_mixer, simulator):
+    """A fader move writes the fader and its dB sensor, nothing else."""
+    mixer = await setup_mixer()
+    fader = mixer.entity("test_channel_1_fader")
+
+    simulator.push(simulator.input_address("/ch/1/mix_fader"), 0.25)
+    assert await wait_for(lambda: fader.native_value == 0.25)
+    await asyncio.sleep(0.1)
+
+    assert sorted(mixer.written) == ["test_channel_1_fader", "test_channel_1_fader_db"]
+
+
+async def test_name_change_writes_every_entity_of_the_channel(setup_mixer, simulator):
+    """A channel rename reaches the fader, mute and dB sensor of that channel."""
+    mixer = await setup_mixer()
+
+    simulator.push(simulator.input_address("/ch/2/config_name"), "Vocals")
+    assert await wait_for(lambda: len(mixer.written) >= 3)
+    await asyncio.sleep(0.1)
+
+    assert sorted(mixer.written) == [
+        "test_channel_2_fader",
+        "test_channel_2_fader_db",
+        "test_channel_2_on",
+    ]
+    assert mixer.entity("test_channel_2_fader").name == "Vocals Fader"
+
+
+async def test_update_window_batches_changes(setup_mixer, simulator):
+    """Changes inside the update window are published together."""
+    mixer = await setup_mixer(UPDATE_WINDOW=100)
+    publishes = []
+    original = mixer.coordinator.async_update_addresses
+
+    def recording_update(addresses):
+        publishes.append(set(addresses))
+        original(addresses)
+
+    mixer.coordinator.async_update_addresses = recording_update
+    for number in (1, 2):
+        simulator.push(simulator.input_address(f"/ch/{number}/mix_fader"), 0.5)
+    assert await wait_for(lambda: publishes)
+    await asyncio.sleep(0.2)
+
+    assert len(publishes) == 1
+    assert {"/ch/1/mix_fader", "/ch/2/mix_fader"} <= publishes[0]
+
+
+async def test_queued_writes_are_coalesced(setup_mixer, simulator):
+    """Many fader writes in a burst reach the mixer as a few, ending on the last."""
+    mixer = await setup_mixer()
+    address = simulator.input_address("/ch/1/mix_fader")
+
+    for step in range(1, 51):
+        mixer.client.queue_value("/ch/1/mix_fader", step / 100)
+    assert await wait_for(lambda: simulator.value(address) == 0.5)
+    await asyncio.sleep(0.2)
+
+    assert simulator.writes[address] < 10
+
+
+async def test_write_is_shown_until_confirmed(setup_mixer, simulator):
+    """A switched mute shows at once and stays after the mixer confirms it."""
+    mixer = await setup_mixer()
+    mute = mixer.entity("test_channel_1_on")
+    address = simulator.input_address("/ch/1/mix_on")
+
+    await mute.async_turn_off()
+    assert mute.is_on is False
+    assert await wait_for(lambda: simulator.writes.get(address) == 1)
+    await asyncio.sleep(0.1)
+
+    assert mute.is_on is False
+    assert mixer.client.pending_writes.timeouts == 0
+
+
+async def test_failed_fader_write_is_rolled_back(setup_mixer, monkeypatch):
+    """A fader move the mixer never received goes back to the mixer's value."""
+    mixer = await setup_mixer()
+    fader = mixer.entity("test_channel_1_fader")
+    before = fader.native_value
+
+    async def failing_set_value(address, value):
+        raise OSError("Network is unreachable")
+
+    monkeypatch.setattr(mixer.client._mixer, "set_value", failing_set_value)
+    await fader.async_set_native_value(0.25)
+    assert fader.native_value == 0.25
+
+    assert await wait_for(lambda: fader.native_value == before)
+    assert mixer.client.write_coalescer.writes_sent == 0
+
+
+async def test_fader_write_fails_fast_before_live(setup_mixer, simulator):
+    """A fader move before the mixer is live raises instead of being dropped."""
+    first = await setup_mixer()
+    snapshot = first.client.snapshot()
+    await first.async_stop()
+
+    mixer = await setup_mixer(snapshot=snapshot)
+    with pytest.raises(BehringerMixerApiClientCommunicationError):
+        await mixer.entity("test_channel_1_fader").async_set_native_value(0.25)
+    assert not simulator.writes
+
+
+async def test_fade_reaches_target(setup_mixer, simulator):
+    """A fade ends on its target level."""
+    mixer = await setup_mixer()
+    address = simulator.input_address("/ch/2/mix_fader")
+
+    await mixer.entity("test_channel_2_fader").async_fade(0.8, 0.3, "linear")
+
+    assert await wait_for(lambda: abs(simulator.value(address) - 0.8) < 0.001)
+    assert simulator.writes[address] > 1
+
+
+async def test_fade_service_refuses_other_numbers(hass, setup_mixer, simulator):
+    """The fade service only fades faders."""
+    mixer = await setup_mixer()
+    address = simulator.input_address("/ch/1/mix_fader")
+    data = {"level": 0.2, "duration": 0, "curve": "linear"}
+
+    with pytest.raises(ServiceValidationError) as error:
+        await async_fade_entity(
+            mixer.entity("test_scene_current"), ServiceCall(hass, DOMAIN, "fade", data)
+        )
+    assert error.value.translation_key == "not_a_fader"
+
+    await async_fade_entity(
+        mixer.entity("test_channel_1_fader"), ServiceCall(hass, DOMAIN, "fade", data)
+    )
+    assert await wait_for(lambda: abs(simulator.value(address) - 0.2) < 0.001)
+
+
+async def test_fade_service_refuses_levels_out_of_range(hass, setup_mixer, simulator):
+    """A level outside the fader's range is refused rather than clamped."""
+    mixer = await setup_mixer()
+    fader = mixer.entity("test_channel_1_fader")
+    data = {"level": 75, "duration": 0, "curve": "linear"}
+
+    with pytest.raises(ServiceValidationError) as error:
+        await async_fade_entity(fader, ServiceCall(hass, DOMAIN, "fade", data))
+    assert error.value.translation_key == "level_out_of_range"
+    await asyncio.sleep(0.1)
+    assert not simulator.writes
+
+
+async def test_fade_before_live_is_refused(setup_mixer, simulator):
+    """A fade before the mixer is live fails at once instead of ticking on."""
+    first = await setup_mixer()
+    snapshot = first.client.snapshot()
+    await first.async_stop()
+
+    mixer = await setup_mixer(snapshot=snapshot)
+    with pytest.raises(HomeAssistantError) as error:
+        await mixer.entity("test_channel_1_fader").async_fade(0.5, 1, "linear")
+    assert error.value.translation_key == "mixer_not_connected"
+    assert not mixer.client.fade_engine._fades
@@ -0,0 +1,91 @@
+"""The connection manager's shared renewal and packet budget."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from conftest import wait_for
+from ha_behringer_mixer import manager
+from ha_behringer_mixer.api import (
+    BehringerMixerApiClient,
+    BehringerMixerPacketLimiter,
+)
+from ha_behringer_mixer.manager import async_get_connection_manager
+from simulator import MixerSimulator
+
+
+async def test_renewal_is_shared_by_every_mixer(hass, setup_mixer, monkeypatch):
+    """One timer renews every registered mixer, and stops with the last one."""
+    monkeypatch.setattr(manager, "SUBSCRIPTION_RENEW_INTERVAL", 0.2)
+    second = MixerSimulator("X32", host="127.0.0.2")
+    await second.start()
+    try:
+        first_mixer = await setup_mixer()
+        second_mixer = await setup_mixer(MIXER_IP="127.0.0.2")
+        connections = async_get_connection_manager(hass)
+        assert connections.metrics()["mixers"] == 2
+
+        renewals = second.renewals
+        assert await wait_for(lambda: second.renewals >= renewals + 2)
+
+        await first_mixer.async_stop()
+        assert connections.metrics()["mixers"] == 1
+        renewals = second.renewals
+        assert await wait_for(lambda: second.renewals > renewals)
+
+        await second_mixer.async_stop()
+        assert connections.metrics()["mixers"] == 0
+        renewals = second.renewals
+        await asyncio.sleep(0.5)
+        assert second.renewals == renewals
+    finally:
+        second.stop()
+
+
+async def test_limiter_holds_packets_to_the_rate():
+    """Past the burst, packets are let through at the configured rate."""
+    limiter = BehringerMixerPacketLimiter(200, 10)
+
+    started = time.monotonic()
+    for _ in range(60):
+        await limiter.acquire()
+    elapsed = time.monotonic() - started
+
+    assert elapsed >= (60 - 10) / 200 * 0.9
+    assert limiter.packets == 60
+    assert limiter.delayed >= 45
+
+
+async def test_reload_queries_stay_under_the_cap(hass, setup_mixer, monkeypatch):
+    """Re-query batches wait for the packet budget before every packet."""
+    mixer = await setup_mixer()
+    rate, burst = 1000, 5
+    async_get_connection_manager(hass).limiter = BehringerMixerPacketLimiter(
+        rate, burst
+    )
+    sent = []
+    monkeypatch.setattr(
+        mixer.client, "_send_raw", lambda address, value: sent.append(time.monotonic())
+    )
+
+    await mixer.client._async_send_queries(["/ch/01/mix/fader"] * 100)
+
+    assert len(sent) == 100
+    for index, sent_at in enumerate(sent):
+        assert sent_at - sent[0] >= (index - burst) / rate - 0.002
+
+
+async def test_library_worker_is_used_without_the_hook(
+    hass, setup_mixer, simulator, monkeypatch
+):
+    """Without the library hook the client falls back to the library's worker."""
+    monkeypatch.setattr(
+        BehringerMixerApiClient, "_can_share_renewal", lambda client: False
+    )
+    mixer = await setup_mixer()
+    fader = mixer.entity("test_channel_1_fader")
+
+    assert async_get_connection_manager(hass).metrics()["mixers"] == 0
+    simulator.push(simulator.input_address("/ch/1/mix_fader"), 0.25)
+    assert await wait_for(lambda: fader.native_value == 0.25)
@@ -0,0 +1,30 @@
+"""Meter levels and signal presence from the simulated mixer."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+
+from conftest import wait_for
+
+
+@pytest.mark.parametrize("io_thread", [False, True])
+async def test_meter_levels_are_published(setup_mixer, simulator, caplog, io_thread):
+    """Meter blobs reach the level and signal sensors, with or without the I/O thread."""
+    mixer = await setup_mixer(IO_THREAD=io_thread, METERS=True, SIGNAL_SENSORS=True)
+    level = mixer.entity("test_channel_1_meter")
+    signal = mixer.entity("test_channel_1_signal")
+    quiet = mixer.entity("test_channel_2_meter")
+
+    # Channel 1 at half scale (-6 dBFS), everything else silent
+    simulator.set_meters("/meters/0", [0.5])
+    with caplog.at_level(logging.WARNING):
+        assert await wait_for(lambda: level.native_value == -6.0, timeout=5)
+        assert await wait_for(lambda: signal.is_on, timeout=5)
+        # Keep the blobs coming for a few publishes
+        await asyncio.sleep(1.5)
+
+    assert quiet.native_value == -90.0
+    assert "meter" not in caplog.text
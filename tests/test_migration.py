@@ -0,0 +1,54 @@
+"""Migrating config entries and their registry entries."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+
+from homeassistant.config_entries import ConfigEntry
+
+from conftest import ENTRY_DATA
+from ha_behringer_mixer import async_migrate_entry
+from ha_behringer_mixer.const import DOMAIN
+
+
+async def test_v5_migration_skips_colliding_unique_ids(hass, entity_registry):
+    """Unique IDs are sanitized unless another entity already has the new ID."""
+    entry = ConfigEntry(
+        data=ENTRY_DATA,
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options={},
+        source="user",
+        subentries_data=None,
+        title="Test",
+        unique_id=None,
+        version=4,
+    )
+    hass.config_entries._entries[entry.entry_id] = entry
+
+    def register(domain, unique_id):
+        return entity_registry.async_get_or_create(
+            domain, DOMAIN, unique_id, config_entry=entry
+        ).entity_id
+
+    # Old and already migrated IDs side by side
+    fader_old = register("number", "Test-Mixer_channel_1_fader")
+    fader_new = register("number", "test_mixer_channel_1_fader")
+    # Two old IDs that sanitize to the same new ID
+    mute_first = register("switch", "Test-Mixer_channel_2_on")
+    mute_second = register("switch", "Test Mixer_channel_2_on")
+    # The same old ID on another platform does not collide
+    db_sensor = register("sensor", "Test-Mixer_channel_1_fader")
+
+    assert await async_migrate_entry(hass, entry)
+
+    def unique_id(entity_id):
+        return entity_registry.async_get(entity_id).unique_id
+
+    assert entry.version == 5
+    assert unique_id(fader_old) == "Test-Mixer_channel_1_fader"
+    assert unique_id(fader_new) == "test_mixer_channel_1_fader"
+    assert unique_id(mute_first) == "test_mixer_channel_2_on"
+    assert unique_id(mute_second) == "Test Mixer_channel_2_on"
+    assert unique_id(db_sensor) == "test_mixer_channel_1_fader"
@@ -0,0 +1,69 @@
+"""Applying a changed config entry to the running integration."""
+
+from __future__ import annotations
+
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+import pytest
+
+from ha_behringer_mixer import async_reload_entry
+from ha_behringer_mixer.const import DOMAIN
+
+
+@pytest.fixture
+async def loaded_mixer(hass, entity_registry, setup_mixer, monkeypatch):
+    """Return a loaded mixer, recording reloads and entities added in place."""
+    mixer = await setup_mixer()
+    hass.config_entries._entries[mixer.entry.entry_id] = mixer.entry
+    hass.data.setdefault(DOMAIN, {})[mixer.entry.entry_id] = mixer.coordinator
+    mixer.reloads = []
+    mixer.added = []
+
+    async def recording_reload(entry_id):
+        mixer.reloads.append(entry_id)
+
+    monkeypatch.setattr(hass.config_entries, "async_reload", recording_reload)
+    async_dispatcher_connect(
+        hass,
+        mixer.coordinator.new_entities_signal,
+        lambda catalog: mixer.added.extend(
+            entity.unique_id for entities in catalog.values() for entity in entities
+        ),
+    )
+    return mixer
+
+
+async def reconfigure(hass, mixer, **changes) -> None:
+    """Change the entry data and apply it as the update listener does."""
+    hass.config_entries.async_update_entry(
+        mixer.entry, data={**mixer.entry.data, **changes}
+    )
+    await async_reload_entry(hass, mixer.entry)
+    await hass.async_block_till_done()
+
+
+async def test_entity_selection_is_applied_in_place(hass, loaded_mixer):
+    """Changing the channels adds and removes entities without a reload."""
+    mixer = loaded_mixer
+    client = mixer.client
+
+    await reconfigure(hass, mixer, CHANNEL_CONFIG=[1, 3])
+
+    assert not mixer.reloads
+    assert mixer.coordinator.client is client
+    assert {"test_channel_3_fader", "test_channel_3_on"} <= set(mixer.added)
+    assert not any(unique_id.startswith("test_channel_1") for unique_id in mixer.added)
+    live = mixer.coordinator.live_entities
+    assert "test_channel_1_fader" in live
+    assert not any(unique_id.startswith("test_channel_2") for unique_id in live)
+
+
+async def test_other_options_reload_the_entry(hass, loaded_mixer):
+    """A change outside the entity selection reloads and keeps the entities."""
+    mixer = loaded_mixer
+    live = set(mixer.coordinator.live_entities)
+
+    await reconfigure(hass, mixer, CHANNEL_CONFIG=[1, 3], UPSCALE_100=True)
+
+    assert mixer.reloads == [mixer.entry.entry_id]
+    assert not mixer.added
+    assert set(mixer.coordinator.live_entities) == live
@@ -0,0 +1,98 @@
+"""Subscription drops and reconnects against the simulated mixer."""
+
+from __future__ import annotations
+
+from conftest import wait_for
+from ha_behringer_mixer import api
+
+
+def record_publishes(mixer) -> tuple[list[set], list]:
+    """Record the per-address and the full publishes to the entities."""
+    publishes, full = [], []
+    coordinator = mixer.coordinator
+    update_addresses = coordinator.async_update_addresses
+    set_updated_data = coordinator.async_set_updated_data
+
+    def recording_update(addresses):
+        publishes.append(set(addresses))
+        update_addresses(addresses)
+
+    def recording_full(data):
+        full.append(data)
+        set_updated_data(data)
+
+    coordinator.async_update_addresses = recording_update
+    coordinator.async_set_updated_data = recording_full
+    return publishes, full
+
+
+async def drop(mixer, simulator) -> None:
+    """Take the mixer off the network until its replies are overdue."""
+    simulator.stop()
+    mixer.client._mixer._last_received = 0
+    await mixer.client._async_renew_subscription()
+
+
+async def reconnect(mixer, simulator) -> None:
+    """Bring the mixer back and renew the subscription."""
+    await simulator.start()
+    client = mixer.client
+    # The first renewal after the outage is answered, the next notices
+    await client._async_renew_subscription()
+    assert await wait_for(client._mixer.subscription_connected)
+    await client._async_renew_subscription()
+
+
+async def test_short_drop_publishes_only_what_changed(setup_mixer, simulator):
+    """Back within the grace period, only the missed changes are published."""
+    mixer = await setup_mixer()
+    fader = mixer.entity("test_channel_1_fader")
+    publishes, full = record_publishes(mixer)
+
+    await drop(mixer, simulator)
+    assert fader.available
+    simulator.push(simulator.input_address("/ch/1/mix_fader"), 0.25, report=False)
+    await reconnect(mixer, simulator)
+
+    assert publishes == [{"/ch/1/mix_fader"}]
+    assert full == []
+    assert fader.available
+    assert fader.native_value == 0.25
+    assert sorted(mixer.written) == ["test_channel_1_fader", "test_channel_1_fader_db"]
+
+
+async def test_mixer_down_past_grace_makes_entities_unavailable(
+    setup_mixer, simulator, monkeypatch
+):
+    """A mixer that stays away is shown unavailable once the grace runs out."""
+    monkeypatch.setattr(api, "DISCONNECT_GRACE", 0.3)
+    mixer = await setup_mixer()
+    fader = mixer.entity("test_channel_1_fader")
+
+    await drop(mixer, simulator)
+    assert fader.available
+    assert await wait_for(lambda: not fader.available)
+
+    assert not mixer.coordinator.sub_connected
+    assert sorted(mixer.written) == sorted(entity.unique_id for entity in mixer.entities)
+    assert not any(entity.available for entity in mixer.entities)
+
+
+async def test_long_drop_shows_entities_unavailable(
+    setup_mixer, simulator, monkeypatch
+):
+    """Past the grace period the entities go unavailable, then all refresh."""
+    monkeypatch.setattr(api, "DISCONNECT_GRACE", 0.1)
+    mixer = await setup_mixer()
+    fader = mixer.entity("test_channel_1_fader")
+    publishes, full = record_publishes(mixer)
+
+    await drop(mixer, simulator)
+    assert await wait_for(lambda: not fader.available)
+    simulator.push(simulator.input_address("/ch/1/mix_fader"), 0.25, report=False)
+    await reconnect(mixer, simulator)
+
+    assert fader.available
+    assert fader.native_value == 0.25
+    assert len(full) == 2
+    assert publishes == []
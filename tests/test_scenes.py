@@ -0,0 +1,107 @@
+"""Scene recalls against the simulated mixer."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from conftest import wait_for
+from ha_behringer_mixer.api import (
+    BehringerMixerApiClient,
+    BehringerMixerApiClientCommunicationError,
+)
+
+
+def record_publishes(mixer) -> list[set]:
+    """Record the addresses of every publish to the entities."""
+    publishes = []
+    original = mixer.coordinator.async_update_addresses
+
+    def recording_update(addresses):
+        publishes.append(set(addresses))
+        original(addresses)
+
+    mixer.coordinator.async_update_addresses = recording_update
+    return publishes
+
+
+async def test_scene_recall_publishes_only_what_changed(setup_mixer, simulator):
+    """A recall publishes the addresses the scene changed, once."""
+    mixer = await setup_mixer()
+    simulator.scenes[3] = {
+        simulator.input_address("/ch/1/mix_fader"): 0.25,
+        simulator.input_address("/ch/2/mix_on"): 0,
+    }
+    publishes = record_publishes(mixer)
+
+    await mixer.client.load_scene(3)
+
+    assert len(publishes) == 1
+    assert {"/ch/1/mix_fader", "/ch/2/mix_on"} <= publishes[0]
+    assert "/ch/2/mix_fader" not in publishes[0]
+    assert mixer.entity("test_channel_1_fader").native_value == 0.25
+    assert mixer.entity("test_channel_2_on").is_on is False
+
+
+async def test_scene_recall_flushes_batched_changes(setup_mixer, simulator):
+    """Changes waiting in the update window are published before the recall."""
+    mixer = await setup_mixer(UPDATE_WINDOW=1000)
+    simulator.scenes[4] = {simulator.input_address("/ch/1/mix_fader"): 0.25}
+    publishes = record_publishes(mixer)
+    simulator.push(simulator.input_address("/ch/2/mix_fader"), 0.375)
+    assert await wait_for(
+        lambda: mixer.client.mixer_state().get("/ch/2/mix_fader") == 0.375
+    )
+
+    await mixer.client.load_scene(4)
+
+    assert publishes[0] == {"/ch/2/mix_fader"}
+    assert "/ch/1/mix_fader" in publishes[1]
+    assert mixer.entity("test_channel_2_fader").native_value == 0.375
+
+
+async def test_signal_change_during_a_recall_is_published_after_it(
+    setup_mixer, simulator
+):
+    """A signal transition held back by a recall is published when it ends."""
+    mixer = await setup_mixer(SIGNAL_SENSORS=True)
+    simulator.scenes[5] = {simulator.input_address("/ch/1/mix_fader"): 0.25}
+    signal = mixer.entity("test_channel_1_signal")
+    publishes = record_publishes(mixer)
+
+    recall = asyncio.create_task(mixer.client.load_scene(5))
+    assert await wait_for(lambda: mixer.client._publish_holds)
+    mixer.client._publish_signal(
+        {signal._signal_address.removesuffix("/signal"): True}
+    )
+    assert "test_channel_1_signal" not in mixer.written
+    await recall
+
+    assert "test_channel_1_signal" in mixer.written
+    assert any(
+        {"/ch/1/mix_fader", signal._signal_address} <= addresses
+        for addresses in publishes
+    )
+
+
+async def test_disconnect_during_a_recall_is_published_after_it(setup_mixer):
+    """Entities go unavailable once a recall holding the disconnect ends."""
+    mixer = await setup_mixer()
+
+    recall = asyncio.create_task(mixer.client.load_scene(6))
+    assert await wait_for(lambda: mixer.client._publish_holds)
+    mixer.client._publish_disconnected()
+    assert not mixer.written
+    await recall
+
+    assert set(mixer.written) == {entity.unique_id for entity in mixer.entities}
+    assert not mixer.entity("test_channel_1_fader").available
+
+
+async def test_scene_recall_needs_the_mixer():
+    """Recalling a scene before the mixer is connected fails cleanly."""
+    client = BehringerMixerApiClient(mixer_ip="127.0.0.1", mixer_type="X32")
+
+    with pytest.raises(BehringerMixerApiClientCommunicationError):
+        await client.load_scene(1)
@@ -0,0 +1,99 @@
+"""The set_values service against the simulated mixer."""
+
+from __future__ import annotations
+
+import asyncio
+
+from homeassistant.exceptions import ServiceValidationError
+import pytest
+
+from conftest import wait_for
+from ha_behringer_mixer.const import DOMAIN
+from ha_behringer_mixer.services import SERVICE_SET_VALUES, async_setup_services
+
+
+@pytest.fixture
+async def loaded_mixer(hass, entity_registry, setup_mixer):
+    """Return a mixer loaded as a config entry, with its services registered."""
+    async_setup_services(hass)
+    mixer = await setup_mixer()
+    hass.config_entries._entries[mixer.entry.entry_id] = mixer.entry
+    hass.data.setdefault(DOMAIN, {})[mixer.entry.entry_id] = mixer.coordinator
+    return mixer
+
+
+async def set_values(hass, values: dict) -> dict:
+    """Call the set_values service and return its response."""
+    return await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_VALUES,
+        {"values": values},
+        blocking=True,
+        return_response=True,
+    )
+
+
+async def test_set_values_resolves_entities_and_addresses(
+    hass, entity_registry, loaded_mixer, simulator
+):
+    """Entity ids and raw addresses are both written, and reported as sent."""
+    entity_registry.async_get_or_create(
+        "number",
+        DOMAIN,
+        "test_channel_1_fader",
+        config_entry=loaded_mixer.entry,
+        suggested_object_id="vocals_fader",
+    )
+
+    response = await set_values(
+        hass, {"number.vocals_fader": 0.25, "/ch/2/mix_fader": 0.375}
+    )
+
+    assert response == {"sent": ["/ch/1/mix_fader", "/ch/2/mix_fader"], "failed": {}}
+    assert await wait_for(
+        lambda: simulator.value(simulator.input_address("/ch/1/mix_fader")) == 0.25
+    )
+    assert simulator.value(simulator.input_address("/ch/2/mix_fader")) == 0.375
+
+
+async def test_set_values_sends_nothing_if_any_value_is_invalid(
+    hass, loaded_mixer, simulator
+):
+    """One invalid value fails the whole call before anything is written."""
+    with pytest.raises(ServiceValidationError) as error:
+        await set_values(
+            hass,
+            {
+                "/ch/1/mix_fader": 0.25,
+                "/ch/2/mix_fader": 2,
+                "/ch/9/mix_on": False,
+                "sensor.unknown": 1,
+            },
+        )
+
+    assert "nothing was sent" in str(error.value)
+    assert "/ch/2/mix_fader" in str(error.value)
+    assert "/ch/9/mix_on" in str(error.value)
+    assert "sensor.unknown" in str(error.value)
+    await asyncio.sleep(0.1)
+    assert not simulator.writes
+
+
+async def test_set_values_reports_failed_writes(hass, loaded_mixer, monkeypatch):
+    """Writes the mixer refused are returned with their error, the rest as sent."""
+    mixer = loaded_mixer
+    set_value = mixer.client._mixer.set_value
+
+    async def refusing_set_value(address, value):
+        if address == "/ch/2/mix_on":
+            raise OSError("Network is unreachable")
+        return await set_value(address, value)
+
+    monkeypatch.setattr(mixer.client._mixer, "set_value", refusing_set_value)
+
+    response = await set_values(hass, {"/ch/1/mix_on": False, "/ch/2/mix_on": False})
+
+    assert response == {
+        "sent": ["/ch/1/mix_on"],
+        "failed": {"/ch/2/mix_on": "Network is unreachable"},
+    }
@@ -0,0 +1,49 @@
+"""Starting from the saved mixer state."""
+
+from __future__ import annotations
+
+import json
+import os
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+
+from conftest import wait_for
+
+
+async def test_snapshot_entities_wait_for_live_data(setup_mixer, simulator):
+    """Entities built from a snapshot are unavailable until the mixer is live."""
+    first = await setup_mixer()
+    snapshot = first.client.snapshot()
+    await first.async_stop()
+    simulator.push(simulator.input_address("/ch/1/mix_fader"), 0.25)
+
+    mixer = await setup_mixer(snapshot=snapshot)
+    fader = mixer.entity("test_channel_1_fader")
+    assert fader.native_value == 0.75
+    assert not fader.available
+
+    await mixer.coordinator.async_start_live_updates()
+
+    assert fader.available
+    assert fader.native_value == 0.25
+    assert "test_channel_2_fader" in mixer.written
+
+
+async def test_live_state_is_saved_when_home_assistant_stops(
+    hass, setup_mixer, simulator
+):
+    """A change schedules a save that the final write flushes."""
+    mixer = await setup_mixer()
+    simulator.push(simulator.input_address("/ch/2/mix_fader"), 0.25)
+    assert await wait_for(
+        lambda: mixer.client.mixer_state().get("/ch/2/mix_fader") == 0.25
+    )
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    path = hass.config.path(".storage", mixer.coordinator.store.key)
+    assert await wait_for(lambda: os.path.exists(path))
+    with open(path, encoding="utf-8") as file:
+        saved = json.load(file)["data"]
+    assert saved["state"]["/ch/2/mix_fader"] == 0.25
@@ -0,0 +1,34 @@
+"""Sends held back until the mixer shows them in use."""
+
+from __future__ import annotations
+
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from conftest import wait_for
+
+SEND_ENTITIES = {
+    "test_chsend_1_1_on",
+    "test_chsend_1_1_fader",
+    "test_chsend_1_1_fader_db",
+}
+
+
+async def test_raised_send_adds_its_entities(hass, setup_mixer, simulator):
+    """Raising a dormant send's level adds its switch, fader and dB sensor."""
+    mixer = await setup_mixer(CHANNELSENDS_CONFIG=True, SPARSE_SENDS=True)
+    assert "/chsend/1/1/mix_fader" in mixer.coordinator.dormant_sends
+    assert not any("chsend" in entity.unique_id for entity in mixer.entities)
+    added = []
+    async_dispatcher_connect(hass, mixer.coordinator.new_entities_signal, added.append)
+
+    simulator.push(simulator.input_address("/chsend/1/1/mix_fader"), 0.5)
+    assert await wait_for(lambda: added)
+    await mixer.async_add_entities(added[0])
+
+    assert {entity.unique_id for entity in mixer.entities} >= SEND_ENTITIES
+    assert not any("chsend_2" in entity.unique_id for entity in mixer.entities)
+    assert "/chsend/1/1/mix_fader" not in mixer.coordinator.dormant_sends
+    assert "/chsend/2/1/mix_fader" in mixer.coordinator.dormant_sends
+    fader = mixer.entity("test_chsend_1_1_fader")
+    assert fader.available
+    assert fader.native_value == 0.5